@@ -10,16 +10,29 @@ Usage:
 The application will start on http://localhost:8050 by default.
 """
 
+import time
+
 import dash
 from dash import html
 import dash_bootstrap_components as dbc
+from flask import Response, stream_with_context
 
 # Import application modules
 from layouts.main_layout import MainLayoutManager
 from callbacks.rotation_callbacks import register_rotation_callbacks
+from callbacks.view_events import ViewEventStream
 from config.app_config import (
-    APP_TITLE, APP_HOST, APP_PORT, DEBUG_MODE
+    APP_TITLE, APP_HOST, APP_PORT, DEBUG_MODE,
+    DATA_REFRESH_ENABLED, DATA_REFRESH_INTERVAL_SECONDS, CHANGE_DETECTION_ENABLED, DISPLAY_CLOCK_ROUTE,
+    PRERENDER_ENABLED, PRERENDER_LEAD_SECONDS, ROTATION_MODE, VIEW_EVENTS_KEEPALIVE_SECONDS, VIEW_EVENTS_ROUTE,
+    VIEW_RENDER_TIME_BUCKETS, VIEW_UPDATE_MODE
+)
+from data.data_refresher import TournamentDataRefresher
+from data.tournament_data import (
+    bracket_resolver, goalscorer_leaderboard, next_gen_reader, player_index, snapshot_cache, standings_engine
 )
+from layouts.prerender_scheduler import PrerenderScheduler
+from layouts.rotation_plan import ROTATION_PLANS
 
 # Initialize Dash app with Bootstrap theme
 app = dash.Dash(
@@ -46,6 +59,10 @@ class TournamentVisualizationApp:
         """Initialize the tournament visualization app."""
         self.app = app
         self.layout_manager = MainLayoutManager()
+        self.data_refresher = TournamentDataRefresher(
+            next_gen_reader, DATA_REFRESH_INTERVAL_SECONDS, snapshot_cache, CHANGE_DETECTION_ENABLED,
+            bracket_resolver, standings_engine, goalscorer_leaderboard, player_index
+        )
         self.setup_app()
 
     def setup_app(self):
@@ -53,6 +70,21 @@ class TournamentVisualizationApp:
         self.configure_layout()
         self.register_callbacks()
         self.configure_meta_tags()
+        self.start_data_refresher()
+        self.start_prerender_scheduler()
+
+    def start_data_refresher(self):
+        """Start the background refresh of tournament data if enabled."""
+        if DATA_REFRESH_ENABLED:
+            self.data_refresher.start()
+
+    def start_prerender_scheduler(self):
+        """Start rendering views ahead of their rotation slots if enabled."""
+        self.prerender_scheduler = PrerenderScheduler(
+            self.rotation_callbacks, ROTATION_PLANS.values(), PRERENDER_LEAD_SECONDS, VIEW_RENDER_TIME_BUCKETS
+        )
+        if PRERENDER_ENABLED:
+            self.prerender_scheduler.start()
 
     def configure_layout(self):
         """Configure the main application layout."""
@@ -64,7 +96,7 @@ class TournamentVisualizationApp:
     def register_callbacks(self):
         """Register all application callbacks."""
         # Register rotation callbacks
-        register_rotation_callbacks(self.app, self.layout_manager)
+        self.rotation_callbacks = register_rotation_callbacks(self.app, self.layout_manager)
 
         # Additional callbacks can be registered here
         self.register_additional_callbacks()
@@ -76,8 +108,46 @@ class TournamentVisualizationApp:
         This method can be extended to add more interactive features
         such as team selection, match result updates, etc.
         """
-        # Placeholder for future callback registrations
-        pass
+        self.register_view_stats_route()
+        self.register_display_routes()
+        if ROTATION_MODE == "client" and VIEW_UPDATE_MODE == "push":
+            self.register_view_events_route()
+
+    def register_view_stats_route(self):
+        """
+        Serve the construction and build timings of the views and the render cache counters.
+        """
+        @server.route("/_stats/views")
+        def serve_view_stats():
+            return {
+                "views": self.layout_manager.views.timings(),
+                "render_cache": self.rotation_callbacks.render_cache.stats(),
+            }
+
+    def register_display_routes(self):
+        """
+        Serve the server clock.
+
+        Screens correct their clock against the clock route, so all screens
+        of a display group switch views together.
+        """
+        @server.route(DISPLAY_CLOCK_ROUTE)
+        def serve_clock():
+            return {"now": time.time() * 1000}, 200, {"Cache-Control": "no-store"}
+
+    def register_view_events_route(self):
+        """
+        Serve the server-sent events stream announcing changed views.
+
+        Each screen keeps one connection open; it carries an event per
+        published snapshot and keepalive comments in between.
+        """
+        view_events = ViewEventStream(self.rotation_callbacks, VIEW_EVENTS_KEEPALIVE_SECONDS)
+
+        @server.route(VIEW_EVENTS_ROUTE)
+        def stream_view_events():
+            return Response(stream_with_context(view_events.events()), mimetype="text/event-stream",
+                            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
     def configure_meta_tags(self):
         """Configure meta tags for the application."""
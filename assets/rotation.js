@@ -0,0 +1,65 @@
+/*
+ * Client-side view rotation.
+ *
+ * All views are preloaded into #view-stack and shown one at a time. The view
+ * is not advanced per tick but derived from the server clock and the rotation
+ * plan of the screen's display group (?group=<name>), so all screens of a
+ * group show the same view and switch together. The offset between the local
+ * and the server clock is measured on load and re-measured periodically.
+ * Ticks while the page is hidden are skipped; the right view is picked again
+ * once it is visible.
+ */
+(function () {
+    let clockOffsetMs = 0;
+    let clockSyncStarted = false;
+
+    function syncClock(url) {
+        const sentAt = Date.now();
+        fetch(url, {cache: "no-store"})
+            .then(function (response) { return response.json(); })
+            .then(function (data) {
+                const receivedAt = Date.now();
+                // Assume the server read its clock halfway through the round trip
+                clockOffsetMs = data.now - (sentAt + receivedAt) / 2;
+            })
+            .catch(function () { /* keep the previous offset */ });
+    }
+
+    function groupPlan(config) {
+        const group = new URLSearchParams(window.location.search).get("group");
+        return config.groups[group] || config.groups[config.defaultGroup];
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        rotation: {
+            rotateViews: function (nIntervals, currentView, config) {
+                const views = Array.from(document.querySelectorAll("#view-stack > .rotating-view"))
+                    .map(function (element) { return element.id.replace(/^view-/, ""); });
+                const noUpdate = window.dash_clientside.no_update;
+                const unchanged = views.map(function () { return noUpdate; }).concat([noUpdate]);
+
+                if (!config || views.length === 0) {
+                    return unchanged;
+                }
+                if (!clockSyncStarted) {
+                    clockSyncStarted = true;
+                    syncClock(config.clockUrl);
+                    setInterval(function () { syncClock(config.clockUrl); }, config.clockSyncSeconds * 1000);
+                }
+                if (document.hidden) {
+                    return unchanged;
+                }
+
+                const plan = groupPlan(config);
+                const slot = Math.floor((Date.now() + clockOffsetMs) / 1000 / plan.slotSeconds);
+                const nextView = plan.views[slot % plan.views.length];
+                if (nextView === currentView) {
+                    return unchanged;
+                }
+                return views.map(function (view) {
+                    return view === nextView ? "rotating-view active" : "rotating-view";
+                }).concat([nextView]);
+            }
+        }
+    });
+})();
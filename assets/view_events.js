@@ -0,0 +1,43 @@
+/*
+ * Pushed view updates.
+ *
+ * Opens the server-sent events stream once per page. Every "views" event is
+ * written to view-event-store, which makes Dash ask the server for the views
+ * whose payload key changed. EventSource reconnects on its own after a drop
+ * and the server answers a new connection with the current keys. Browsers
+ * without EventSource fall back to checking on a timer. Only used with
+ * VIEW_UPDATE_MODE = "push", the default, which needs Dash >= 2.16 for
+ * set_props.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    viewEvents: {
+        subscribe: function (config) {
+            const noUpdate = window.dash_clientside.no_update;
+            if (!config || window.viewEventsSubscribed) {
+                return noUpdate;
+            }
+            window.viewEventsSubscribed = true;
+
+            const notify = function (data) {
+                window.dash_clientside.set_props("view-event-store", {data: data});
+            };
+
+            if (!window.EventSource) {
+                setInterval(function () { notify({checkedAt: Date.now()}); }, config.fallbackIntervalMs);
+                return noUpdate;
+            }
+
+            let lastKeys = null;
+            const source = new EventSource(config.url);
+            source.addEventListener("views", function (event) {
+                const data = JSON.parse(event.data);
+                const keys = JSON.stringify(data.keys);
+                if (keys !== lastKeys) {
+                    lastKeys = keys;
+                    notify(data);
+                }
+            });
+            return noUpdate;
+        }
+    }
+});
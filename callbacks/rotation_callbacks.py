@@ -5,11 +5,40 @@ This module provides callback functions for automatic view rotation and
 manual view switching in the tournament visualization app.
 """
 
-from dash import Input, Output, State
+import json
+import logging
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs
+
+from dash import ClientsideFunction, Input, no_update, Output, State
 from dash.exceptions import PreventUpdate
 from dash import html
 from layouts.main_layout import MainLayoutManager
-from config.app_config import AVAILABLE_VIEWS, VIEW_DISPLAY_NAMES
+from layouts.render_cache import compute_render_version, SharedViewPayloadCache, ViewRenderCache
+from layouts.rotation_plan import get_rotation_plan
+from layouts.view_patch import build_view_patch, count_patched, find_patch_targets
+from config.app_config import (
+    AVAILABLE_VIEWS, ROTATION_MODE, VIEW_DISPLAY_NAMES, VIEW_PAYLOAD_CACHE_DIR, VIEW_RENDER_TIME_BUCKETS,
+    VIEW_UPDATE_MODE
+)
+from data.snapshot_diff import SnapshotDiffCache
+from data.tournament_data import get_current_snapshot, get_recent_snapshot, player_index, TournamentSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+def display_group(search: Optional[str]) -> Optional[str]:
+    """
+    Get the display group a screen joined with ?group=<name>.
+
+    Args:
+        search (Optional[str]): Query string of the page
+
+    Returns:
+        Optional[str]: Group name, None if the page has none
+    """
+    return parse_qs((search or "").lstrip("?")).get("group", [None])[0]
 
 
 class RotationCallbackManager:
@@ -17,7 +46,7 @@ class RotationCallbackManager:
     Manages callbacks for view rotation and switching functionality.
 
     This class handles the automatic rotation between different views
-    (tournament tree, schedule, goalscorers) and provides manual controls.
+    (tournament tree, schedule, goalscorers, live & next) and provides manual controls.
     """
 
     def __init__(self, app, layout_manager: MainLayoutManager):
@@ -30,10 +59,22 @@ class RotationCallbackManager:
         """
         self.app = app
         self.layout_manager = layout_manager
+        self.render_cache = ViewRenderCache(VIEW_RENDER_TIME_BUCKETS)
+        self.payload_cache = SharedViewPayloadCache(
+            VIEW_PAYLOAD_CACHE_DIR, compute_render_version([player_index.fingerprint()]), VIEW_RENDER_TIME_BUCKETS
+        )
+        self.diff_cache = SnapshotDiffCache()
+        self._view_targets: Dict[str, Dict] = {}
         self.register_callbacks()
 
     def register_callbacks(self):
         """Register all rotation-related callbacks."""
+        if ROTATION_MODE == "client":
+            self.register_client_rotation_callback()
+            if VIEW_UPDATE_MODE == "push":
+                self.register_view_events_callback()
+            self.register_preloaded_views_callback()
+            return
         self.register_view_rotation_callback()
         # self.register_rotation_toggle_callback()
         self.register_view_content_callback()
@@ -43,26 +84,29 @@ class RotationCallbackManager:
         """
         Register callback for automatic view rotation.
 
-        This callback triggers every 30 seconds to switch between views
-        when auto-rotation is enabled.
+        This callback triggers on every rotation timer tick and switches to
+        the view of the display group's current time slot when auto-rotation
+        is enabled.
         """
         @self.app.callback(
             Output('current-view-store', 'data'),
             [Input('rotation-timer', 'n_intervals'),
              State('current-view-store', 'data'),
-             State('rotation-enabled-store', 'data')],
+             State('rotation-enabled-store', 'data'),
+             State('display-url', 'search')],
         )
-        def rotate_views(n_intervals, current_view, rotation_enabled):
+        def rotate_views(n_intervals, current_view, rotation_enabled, search):
             """
-            Automatically rotate between available views.
+            Show the view the screen's display group is due to show.
 
             Args:
                 n_intervals (int): Number of timer intervals elapsed
                 current_view (str): Currently active view
                 rotation_enabled (bool): Whether auto-rotation is enabled
+                search (str): Query string of the page, selects the display group
 
             Returns:
-                str: Next view to display
+                str: View of the group's current time slot
             """
             # Allow initial update even if n_intervals is 0 to set the first view
             if n_intervals is None:
@@ -71,13 +115,10 @@ class RotationCallbackManager:
             if not rotation_enabled and n_intervals > 0:
                 raise PreventUpdate
 
-            try:
-                current_index = AVAILABLE_VIEWS.index(current_view)
-                next_index = (current_index + 1) % len(AVAILABLE_VIEWS)
-                return AVAILABLE_VIEWS[next_index]
-            except ValueError:
-                # If current view not found, default to first view
-                return AVAILABLE_VIEWS[0]
+            next_view = get_rotation_plan(display_group(search)).view_at()
+            if next_view == current_view:
+                raise PreventUpdate
+            return next_view
 
     def register_rotation_toggle_callback(self):
         """
@@ -112,11 +153,213 @@ class RotationCallbackManager:
 
             return new_state, button_text, timer_disabled
 
+    def get_view_builder(self, view_name: str) -> Tuple[str, Callable]:
+        """
+        Get the function building a view from the layout manager's view registry.
+
+        Args:
+            view_name (str): Requested view, unknown views fall back to the tournament tree
+
+        Returns:
+            Tuple[str, Callable]: Resolved view name and its build function taking a snapshot
+        """
+        view_name = self.layout_manager.views.resolve(view_name)
+        return view_name, partial(self.layout_manager.views.build, view_name)
+
+    def render_view(self, view_name: str, snapshot: TournamentSnapshot):
+        """
+        Get a view's content for a snapshot through the render cache.
+
+        Each new rendering is also written to the shared payload cache, so
+        every worker can patch screens that received it.
+
+        Args:
+            view_name (str): Requested view
+            snapshot (TournamentSnapshot): Snapshot to render
+
+        Returns:
+            Content for the view
+        """
+        view_name, create_view = self.get_view_builder(view_name)
+
+        def build_view():
+            tree = create_view(snapshot)
+            self.payload_cache.store(view_name, snapshot.fingerprint, tree)
+            return tree
+
+        return self.render_cache.get_or_render(view_name, snapshot.version, build_view)
+
+    def get_view_targets(self, view_key: str, load_tree: Callable[[], Optional[object]]) -> Optional[Dict]:
+        """
+        Get the patch target paths of a rendered view.
+
+        Args:
+            view_key (str): Payload key of the rendering
+            load_tree (Callable[[], Optional[object]]): Returns the decoded view tree, None if it is gone
+
+        Returns:
+            Optional[Dict]: Target paths keyed by target key, None if the rendering is gone
+        """
+        targets = self._view_targets.get(view_key)
+        if targets is None:
+            tree = load_tree()
+            if tree is None:
+                return None
+            targets = find_patch_targets(tree)
+            if len(self._view_targets) >= 4 * len(AVAILABLE_VIEWS):
+                self._view_targets.pop(next(iter(self._view_targets)), None)
+            self._view_targets[view_key] = targets
+        return targets
+
+    def load_view_tree(self, view_key: str):
+        """
+        Decode a cached view payload.
+
+        Args:
+            view_key (str): Payload key
+
+        Returns:
+            The view tree, None if the payload was pruned
+        """
+        payload = self.payload_cache.load(view_key)
+        return None if payload is None else json.loads(payload)
+
+    def render_view_update(self, view_name: str, view_key: Optional[str], snapshot: TournamentSnapshot):
+        """
+        Get what a screen holding an older rendering of a view needs to show the snapshot.
+
+        If the screen's snapshot is still known and the changes between the
+        two snapshots leave the view's layout as it is, only the table cells,
+        bracket slots, team cards and goalscorer rows showing changed records
+        are sent as a Patch.
+
+        Args:
+            view_name (str): View identifier
+            view_key (Optional[str]): Payload key of the rendering the screen holds
+            snapshot (TournamentSnapshot): Snapshot to show
+
+        Returns:
+            A Patch, no_update if none of the view's records changed, or the whole view
+        """
+        tree = self.render_view(view_name, snapshot)
+        fingerprint = self.payload_cache.key_fingerprint(view_name, view_key) if view_key else None
+        previous_snapshot = get_recent_snapshot(fingerprint) if fingerprint else None
+        if previous_snapshot is None:
+            return tree
+        diff = self.diff_cache.get(previous_snapshot, snapshot)
+        if diff.structural:
+            return tree
+
+        previous_targets = self.get_view_targets(view_key, partial(self.load_view_tree, view_key))
+        if previous_targets is None:
+            return tree
+        targets = self.get_view_targets(self.payload_cache.payload_key(view_name, snapshot.fingerprint), lambda: tree)
+        changed_targets = diff.target_keys()
+        patch = build_view_patch(tree, targets, previous_targets, changed_targets)
+        if patch is None:
+            return tree
+        patched = count_patched(changed_targets, targets)
+        logger.debug("Patching %s elements of %s for snapshot v%s", patched, view_name, snapshot.version)
+        return patch if patched else no_update
+
+    def register_client_rotation_callback(self):
+        """
+        Register the clientside callback rotating the preloaded views.
+
+        The browser derives the view from the server clock and the rotation
+        plan of its display group; ticks while the page is hidden are
+        skipped (see assets/rotation.js).
+        """
+        self.app.clientside_callback(
+            ClientsideFunction(namespace="rotation", function_name="rotateViews"),
+            [Output(f"view-{view_name}", "className") for view_name in AVAILABLE_VIEWS]
+            + [Output("current-view-store", "data")],
+            [Input("rotation-timer", "n_intervals")],
+            [State("current-view-store", "data"), State("display-plan-store", "data")],
+        )
+
+    def register_view_events_callback(self):
+        """
+        Register the clientside callback subscribing the screen to view events.
+
+        It runs once when the page loads and opens the server-sent events
+        stream; each event is written to view-event-store, which triggers
+        the preloaded views callback (see assets/view_events.js).
+        """
+        self.app.clientside_callback(
+            ClientsideFunction(namespace="viewEvents", function_name="subscribe"),
+            Output("view-event-store", "data"),
+            [Input("view-events-config", "data")],
+        )
+
+    def view_keys(self, snapshot: TournamentSnapshot) -> Dict[str, str]:
+        """
+        Get the payload keys of all views for a snapshot.
+
+        Args:
+            snapshot (TournamentSnapshot): Snapshot the views are rendered from
+
+        Returns:
+            Dict[str, str]: Payload keys keyed by view name
+        """
+        return {
+            view_name: self.payload_cache.payload_key(view_name, snapshot.fingerprint)
+            for view_name in AVAILABLE_VIEWS
+        }
+
+    def register_preloaded_views_callback(self):
+        """
+        Register the callback delivering the views for client-side rotation.
+
+        Screens send the payload keys of the views they hold; only views
+        whose key changed (new snapshot, or a new time bucket for clock
+        dependent views) are sent back, and nothing at all if none changed.
+        Views are patched where possible (see render_view_update). Screens
+        check when the server pushes a view event, or on every tick of the
+        view version timer when VIEW_UPDATE_MODE is "poll".
+        """
+        if VIEW_UPDATE_MODE == "push":
+            trigger = Input("view-event-store", "data")
+        else:
+            trigger = Input("view-version-timer", "n_intervals")
+
+        @self.app.callback(
+            [Output(f"view-{view_name}", "children") for view_name in AVAILABLE_VIEWS]
+            + [Output("view-keys-store", "data")],
+            [trigger],
+            [State("view-keys-store", "data")],
+        )
+        def update_preloaded_views(_, view_keys):
+            """
+            Send the views that changed since the screen last received them.
+
+            Args:
+                _: Pushed view event or number of version checks elapsed
+                view_keys (dict): Payload keys of the views the screen holds
+
+            Returns:
+                list: Content or Patch per view (no_update if unchanged) and the new payload keys
+            """
+            snapshot = get_current_snapshot()
+            view_keys = view_keys or {}
+            current_keys = self.view_keys(snapshot)
+            if current_keys == view_keys:
+                raise PreventUpdate
+
+            contents = [
+                self.render_view_update(view_name, view_keys.get(view_name), snapshot)
+                if current_keys[view_name] != view_keys.get(view_name)
+                else no_update
+                for view_name in AVAILABLE_VIEWS
+            ]
+            return contents + [current_keys]
+
     def register_view_content_callback(self):
         """
         Register callback for updating view content based on current view.
 
         This callback switches the main content area between different views.
+        Rendered views are reused until a new tournament snapshot is published.
         """
         @self.app.callback(
             Output('view-content', 'children'),
@@ -132,15 +375,8 @@ class RotationCallbackManager:
             Returns:
                 html.Div: Content for the selected view
             """
-            if current_view == "tournament_tree":
-                return self.layout_manager.create_tournament_tree_view()
-            elif current_view == "tournament_schedule":
-                return self.layout_manager.create_tournament_matches_view()
-            elif current_view == "goalscorers":
-                return self.layout_manager.create_goal_scorers_view()
-            else:
-                # Default to tournament tree view
-                return self.layout_manager.create_tournament_tree_view()
+            # Render from the snapshot the cache keys refer to, even if a refresh publishes meanwhile
+            return self.render_view(current_view, get_current_snapshot())
 
     def register_view_indicator_callback(self):
         """
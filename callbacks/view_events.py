@@ -0,0 +1,78 @@
+"""
+View Events Module
+
+This module provides the ViewEventStream class, which pushes the payload keys
+of all views to screens as server-sent events. A screen only asks for views
+when it receives an event, so requests scale with data changes instead of
+with the number of screens times the polling interval.
+"""
+
+import json
+from typing import Dict, Iterator, Optional
+
+from data.tournament_data import get_current_snapshot, wait_for_snapshot
+
+
+def format_event(event: str, data) -> str:
+    """
+    Format a server-sent event.
+
+    Args:
+        event (str): Event name
+        data: JSON serializable event data
+
+    Returns:
+        str: Event in text/event-stream format
+    """
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+class ViewEventStream:
+    """
+    Server-sent events announcing new view payload keys.
+
+    Every connection gets the current keys right away, so a screen that
+    reconnects after a network drop catches up immediately. After that an
+    event is only sent when a snapshot is published or a clock dependent
+    view enters a new time bucket; in between the stream only carries
+    keepalive comments.
+    """
+
+    def __init__(self, rotation_callbacks, keepalive_seconds: float, retry_seconds: float = 5):
+        """
+        Initialize the event stream.
+
+        Args:
+            rotation_callbacks (RotationCallbackManager): Provides the payload keys of the views
+            keepalive_seconds (float): Longest silence before a keepalive comment is sent
+            retry_seconds (float): Delay before browsers reconnect a dropped stream
+        """
+        self.rotation_callbacks = rotation_callbacks
+        self.keepalive_seconds = keepalive_seconds
+        self.retry_seconds = retry_seconds
+
+    def _wait_seconds(self) -> float:
+        seconds_until_key_change = self.rotation_callbacks.payload_cache.seconds_until_key_change()
+        if seconds_until_key_change is None:
+            return self.keepalive_seconds
+        # Wake up just after the bucket starts, so the new key is already in effect
+        return min(self.keepalive_seconds, seconds_until_key_change + 0.05)
+
+    def events(self) -> Iterator[str]:
+        """
+        Generate the event stream of one connection.
+
+        Yields:
+            str: Events and keepalive comments in text/event-stream format
+        """
+        yield f"retry: {int(self.retry_seconds * 1000)}\n\n"
+        sent_keys: Optional[Dict[str, str]] = None
+        snapshot = get_current_snapshot()
+        while True:
+            view_keys = self.rotation_callbacks.view_keys(snapshot)
+            if view_keys != sent_keys:
+                sent_keys = view_keys
+                yield format_event("views", {"version": snapshot.version, "keys": view_keys})
+            else:
+                yield ": keepalive\n\n"
+            snapshot = wait_for_snapshot(snapshot.version, self._wait_seconds())
@@ -1,21 +1,35 @@
+from typing import Mapping, Optional, Sequence, Tuple
+
 import pandas as pd
 from dash import html
 
+from data.goalscorer_leaderboard import GoalscorerEntry
+from data.player_index import PlayerInfo
+from data.snapshot_diff import patch_target
+
 
 class GoalScorerComponent:
     def __init(self, goalscorers: pd.DataFrame):
         self.goalscorers = goalscorers
 
     @staticmethod
-    def create_player_card(team_id: int, player_name: str) -> html.Div:
+    def create_player_card(team_id: int, player_name: str, details: Optional[PlayerInfo] = None) -> html.Div:
         team_logo = f"assets/images/team_logos/{team_id}.png"
+        player_text = [html.Div(player_name, className="goalscorer-table player-name")]
+        if details is not None:
+            detail_parts = [f"#{details.shirt_number}" if details.shirt_number is not None else None, details.position]
+            player_text.append(html.Div(" · ".join(part for part in detail_parts if part),
+                                        className="goalscorer-table player-details"))
         return html.Div([
             html.Img(src=team_logo, className="goalscorer-table team-logo"),
-            html.Div(player_name, className="goalscorer-table player-name"),
+            html.Div(player_text, className="goalscorer-table player-text"),
         ], className="goalscorer-table player-card"
         )
 
-    def create_goalscorer_table(self, players: pd.DataFrame) -> html.Div:
+    def create_goalscorer_table(self, players: Sequence[GoalscorerEntry],
+                                player_details: Optional[Mapping[Tuple[int, str], PlayerInfo]] = None,
+                                first_position: int = 0) -> html.Div:
+        player_details = player_details or {}
         table_rows = []
 
         table_header = [
@@ -29,7 +43,8 @@ class GoalScorerComponent:
             )
         ]
 
-        for _, player in players.iterrows():
+        # Rows are patch targets by ranking position, which continues across tables
+        for position, player in enumerate(players, start=first_position):
             table_rows.append(
                 html.Tr([
                     html.Td(str(player.place), className=f"goalscorer-table-body-cell"),
@@ -38,12 +53,13 @@ class GoalScorerComponent:
                             self.create_player_card(
                                 team_id=player.team_id,
                                 player_name=player.player_name,
+                                details=player_details.get((player.team_id, player.player_name)),
                             ),
                         ], className=f"goalscorer-table-body-cell player-cell-container"),
                         className=f"goalscorer-table-body-cell-player-cell-images"),
                     # html.Td(player.team_name, className=f"goalscorer-table-body-cell"),
                     html.Td(str(player.total_goals), className=f"goalscorer-table-body-cell")
-                ], className=f"goalscorer-table-body-row-tr")
+                ], className=f"goalscorer-table-body-row-tr", **patch_target("scorer", position))
             )
 
         table_body = [html.Tbody(table_rows)]
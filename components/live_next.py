@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import Optional
+
+from dash import html
+
+from components.tournament_matches import TournamentMatchesComponent
+from config.app_config import LIVE_NEXT_UPCOMING_COUNT
+from data.match_schedule import venue_now
+from data.tournament_data import get_current_snapshot, TournamentSnapshot
+
+
+class LiveNextComponent:
+    def __init__(self, upcoming_count: int = LIVE_NEXT_UPCOMING_COUNT):
+        self.upcoming_count = upcoming_count
+        self.matches_renderer = TournamentMatchesComponent()
+
+    @staticmethod
+    def create_live_next_header() -> html.Div:
+        """
+        Create the tournament header with title.
+
+        Returns:
+            html.Div: Tournament header component
+        """
+        return html.Div([
+            html.H2("next generation trophy 25/26", className="tournament-title")
+        ], className="tournament-header")
+
+    def create_live_section(self, snapshot: TournamentSnapshot, now: datetime) -> html.Div:
+        """
+        Create the table of matches currently played, one per pitch.
+
+        Args:
+            snapshot (TournamentSnapshot): Tournament data to render
+            now (datetime): Current time
+
+        Returns:
+            html.Div: Live matches table
+        """
+        live_matches = list(snapshot.schedule.live_matches(now).values())
+        if not live_matches:
+            return self.create_empty_section("Live now", "No match in progress")
+        return self.matches_renderer.create_table(title="Live now", matches=live_matches)
+
+    def create_next_section(self, snapshot: TournamentSnapshot, now: datetime) -> html.Div:
+        """
+        Create the table of the next kickoffs.
+
+        Args:
+            snapshot (TournamentSnapshot): Tournament data to render
+            now (datetime): Current time
+
+        Returns:
+            html.Div: Upcoming matches table
+        """
+        upcoming = snapshot.schedule.next_kickoffs(now, self.upcoming_count)
+        if not upcoming:
+            return self.create_empty_section("Up next", "No upcoming matches")
+        return self.matches_renderer.create_table(title="Up next", matches=upcoming)
+
+    @staticmethod
+    def create_empty_section(title: str, message: str) -> html.Div:
+        return html.Div([
+            html.Div([
+                html.Div(title, className="table-section-title1"),
+            ], className="table-title-container1"),
+            html.Div(message, className="live-next-empty")
+        ], className="table-container-wrapper1")
+
+    def create_complete_live_next(self, snapshot: Optional[TournamentSnapshot] = None,
+                                  now: Optional[datetime] = None) -> html.Div:
+        """
+        Create the Live & Next layout.
+
+        Args:
+            snapshot (Optional[TournamentSnapshot]): Tournament data to render, defaults to the current one
+            now (Optional[datetime]): Venue-local time to render for, defaults to the current time at the venue
+
+        Returns:
+            html.Div: Live matches per pitch and the next kickoffs
+        """
+        snapshot = snapshot or get_current_snapshot()
+        now = now or venue_now()
+        return html.Div([
+            self.create_live_next_header(),
+            html.Div([
+                self.create_live_section(snapshot, now),
+                self.create_next_section(snapshot, now),
+            ], className="live-next-body")
+        ], className="live-next-container")
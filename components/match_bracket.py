@@ -9,6 +9,8 @@ import os
 from dash import html
 from typing import Optional, Tuple, Dict
 
+from data.snapshot_diff import patch_target
+
 
 class MatchBracketComponent:
     """
@@ -78,6 +80,7 @@ class MatchBracketComponent:
                                      background_color_2: str,
                                      team1_logo: Optional[str] = None,
                                      team2_logo: Optional[str] = None,
+                                     match_key: Optional[str] = None,
                                      ) -> html.Div:
         """
         Create a quarter-final specific bracket layout.
@@ -90,6 +93,7 @@ class MatchBracketComponent:
             background_color_2 (str): Background color for QF2
             team1_logo (str): Team 1 logo
             team2_logo (str): Team 2 logo
+            match_key (Optional[str]): Match the bracket shows, marks it as a patch target
             
         Returns:
             html.Div: Quarter-final bracket component
@@ -123,7 +127,7 @@ class MatchBracketComponent:
                         }
                     )
                 ], className="qf-matchup")
-            ], className="quarter-final-bracket")
+            ], className="quarter-final-bracket", **patch_target("bracket", match_key))
         else:
             return html.Div([
                 html.Div(qf_name, className="qf-label"),
@@ -151,7 +155,7 @@ class MatchBracketComponent:
                         }
                     )
                 ], className="qf-matchup")
-            ], className="quarter-final-bracket")
+            ], className="quarter-final-bracket", **patch_target("bracket", match_key))
 
     def create_semin_final_bracket(self,
                                    sf_name: str,
@@ -161,6 +165,7 @@ class MatchBracketComponent:
                                    background_color_2: str,
                                    team1_logo: Optional[str] = None,
                                    team2_logo: Optional[str] = None,
+                                   match_key: Optional[str] = None,
                                    ) -> html.Div:
         """
         Create a semi-final specific bracket layout.
@@ -173,7 +178,7 @@ class MatchBracketComponent:
             background_color_2 (str): Background color for QF2
             team1_logo (str): Team 1 logo
             team2_logo (str): Team 2 logo
-
+            match_key (Optional[str]): Match the bracket shows, marks it as a patch target
 
         Returns:
             html.Div: Quarter-final bracket component
@@ -205,7 +210,7 @@ class MatchBracketComponent:
                         }
                     )
                 ], className="sf-matchup")
-            ], className="semi-final-bracket")
+            ], className="semi-final-bracket", **patch_target("bracket", match_key))
         else:
             return html.Div([
                 html.Div(sf_name, className="sf-label"),
@@ -231,7 +236,7 @@ class MatchBracketComponent:
                         }
                     )
                 ], className="sf-matchup")
-            ], className="semi-final-bracket")
+            ], className="semi-final-bracket", **patch_target("bracket", match_key))
 
     @staticmethod
     def create_progression_line(start_pos: Tuple[int, int],
@@ -287,7 +292,8 @@ class MatchBracketComponent:
             team1: str,
             team2: str,
             team1_logo: Optional[str] = None,
-            team2_logo: Optional[str] = None
+            team2_logo: Optional[str] = None,
+            match_key: Optional[str] = None
     ) -> html.Div:
         """
         Create the final match bracket with trophy styling.
@@ -297,6 +303,7 @@ class MatchBracketComponent:
             team2 (str): Second finalist
             team1_logo (Optional[str], optional): First finalist logo
             team2_logo (Optional[str], optional): Second finalist logo
+            match_key (Optional[str], optional): Match the bracket shows, marks it as a patch target
             
         Returns:
             html.Div: Final bracket with trophy decoration
@@ -311,7 +318,7 @@ class MatchBracketComponent:
                 ], className="final-matchup"),
                 # html.Div("Final", className="final-label"),
                 html.Div("🏆", className="trophy-icon")
-            ], className="final-bracket")
+            ], className="final-bracket", **patch_target("bracket", match_key))
         else:
             return html.Div([
                 html.Div("🏆", className="trophy-icon"),
@@ -322,7 +329,7 @@ class MatchBracketComponent:
                 ], className="final-matchup"),
                 # html.Div("Final", className="final-label"),
                 html.Div("🏆", className="trophy-icon")
-            ], className="final-bracket")
+            ], className="final-bracket", **patch_target("bracket", match_key))
 
     @staticmethod
     def create_placement_bracket(
@@ -330,7 +337,8 @@ class MatchBracketComponent:
             team1: str,
             team2: str,
             team1_logo: Optional[str] = None,
-            team2_logo: Optional[str] = None
+            team2_logo: Optional[str] = None,
+            match_key: Optional[str] = None
     ) -> html.Div:
         """
         Create a placement match bracket (3rd-4th, 5th-8th, etc.).
@@ -341,6 +349,7 @@ class MatchBracketComponent:
             team2 (str): Second team
             team1_logo (Optional[str], optional): First team logo
             team2_logo (Optional[str], optional): Second team logo
+            match_key (Optional[str], optional): Match the bracket shows, marks it as a patch target
             
         Returns:
             html.Div: Placement bracket component
@@ -353,7 +362,7 @@ class MatchBracketComponent:
                     html.Div("VS", className="placement-vs"),
                     html.Img(src=team2_logo, className="placement-team-logo")
                 ], className="placement-matchup")
-            ], className="placement-bracket")
+            ], className="placement-bracket", **patch_target("bracket", match_key))
         else:
             return html.Div([
                 html.Div(placement, className="placement-label"),
@@ -362,7 +371,7 @@ class MatchBracketComponent:
                     html.Div("VS", className="placement-vs"),
                     html.Div(team2, className="placement-team")
                 ], className="placement-matchup")
-            ], className="placement-bracket")
+            ], className="placement-bracket", **patch_target("bracket", match_key))
 
     @staticmethod
     def create_placement_bracket_matches(
@@ -8,6 +8,8 @@ display cards in the tournament visualization.
 from dash import html
 from typing import Dict, Optional  # , Any
 
+from data.snapshot_diff import patch_target
+
 
 class TeamCardRenderer:
     """
@@ -33,7 +35,9 @@ class TeamCardRenderer:
                          is_winner: bool = False,
                          is_eliminated: bool = False,
                          card_size: str = "normal",
-                         team_logo: Optional[str] = None) -> html.Div:
+                         team_logo: Optional[str] = None,
+                         group_id: Optional[str] = None,
+                         row: Optional[int] = None) -> html.Div:
         """
         Create a team card component.
         
@@ -45,6 +49,8 @@ class TeamCardRenderer:
             is_eliminated (bool): Whether this team is eliminated
             card_size (str): Size variant ("small", "normal", "large")
             team_logo (Optional[str]): Team logo
+            group_id (Optional[str]): Group of the standings row the card shows
+            row (Optional[int]): Index of the standings row, with group_id marks the card as a patch target
             
         Returns:
             html.Div: Dash HTML component representing the team card
@@ -72,7 +78,8 @@ class TeamCardRenderer:
                 style={
                     "backgroundColor": background_color,
                     "border": f"2px solid {background_color}"
-                })
+                },
+                **patch_target("standing", group_id, row))
         else:
             return html.Div([
                 html.Div([
@@ -84,7 +91,8 @@ class TeamCardRenderer:
                 style={
                     "backgroundColor": background_color,
                     "border": f"2px solid {background_color}"
-                })
+                },
+                **patch_target("standing", group_id, row))
 
     def create_group_header(self, group_name: str, group_color: str) -> html.Div:
         """
@@ -108,7 +116,8 @@ class TeamCardRenderer:
                 "color": "white"
             })
 
-    def create_team_group(self, group_name: str, teams: list, group_color: str) -> html.Div:
+    def create_team_group(self, group_name: str, teams: list, group_color: str,
+                          group_id: Optional[str] = None) -> html.Div:
         """
         Create a complete team group with header and team cards.
         
@@ -116,6 +125,7 @@ class TeamCardRenderer:
             group_name (str): Name of the group
             teams (list): List of team data
             group_color (str): Color identifier for the group
+            group_id (Optional[str]): Group identifier, marks the team cards as patch targets
             
         Returns:
             html.Div: Complete group component with header and teams
@@ -129,8 +139,10 @@ class TeamCardRenderer:
                 team.position,
                 team.is_winner,
                 team.is_eliminated,
-                team_logo=team.team_logo
-            ) for team in teams
+                team_logo=team.team_logo,
+                group_id=group_id,
+                row=row
+            ) for row, team in enumerate(teams)
         ]
 
         return html.Div([
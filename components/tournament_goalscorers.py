@@ -1,13 +1,15 @@
-import pandas as pd
+from typing import Optional
+
 from dash import html
 
 from .goalscorer import GoalScorerComponent
-from data.tournament_data import GOALSCORERS
+from config.app_config import GOALSCORERS_TOP_N
+from data.tournament_data import get_current_snapshot, TournamentSnapshot
 
 
 class TournamentGoalscorersComponent:
-    def __init__(self, top_n: int = 14):
-        self.players = GOALSCORERS.head(n=top_n)
+    def __init__(self, top_n: int = GOALSCORERS_TOP_N):
+        self.top_n = top_n
         self.goalscorer_renderer = GoalScorerComponent()
 
     @staticmethod
@@ -22,14 +24,17 @@ class TournamentGoalscorersComponent:
             html.H2("next generation trophy 25/26", className="tournament-title")
         ], className="tournament-header-goalscorers")
 
-    def create_goalscorers_tables(self):
-        midpoint = len(self.players) // 2
-        df1 = self.players.iloc[:midpoint]
-        df2 = self.players.iloc[midpoint:]
+    def create_goalscorers_tables(self, snapshot: Optional[TournamentSnapshot] = None):
+        snapshot = snapshot or get_current_snapshot()
+        players = snapshot.goalscorers.top(self.top_n)
+        midpoint = len(players) // 2
 
         tables = [
-            self.goalscorer_renderer.create_goalscorer_table(players=df1),
-            self.goalscorer_renderer.create_goalscorer_table(players=df2)
+            self.goalscorer_renderer.create_goalscorer_table(players=players[:midpoint],
+                                                             player_details=snapshot.player_details),
+            self.goalscorer_renderer.create_goalscorer_table(players=players[midpoint:],
+                                                             player_details=snapshot.player_details,
+                                                             first_position=midpoint)
         ]
 
         return html.Div([
@@ -1,18 +1,20 @@
-from typing import List
+from datetime import date
+from typing import List, Optional
 
 from dash import html
 
 from components.match_bracket import MatchBracketComponent
 from components.team_card import TeamCardRenderer
 from config.tournament_config import TEAM_COLORS, TOURNAMENT_GROUPS
-from data.tournament_data import get_tournament_structure, get_teams_by_group, MatchData
+from data.match_schedule import format_match_day_title
+from data.snapshot_diff import patch_target
+from data.tournament_data import get_current_snapshot, get_teams_by_group, MatchData, TournamentSnapshot
 
 
 class TournamentMatchesComponent:
     def __init__(self):
         self.team_renderer = TeamCardRenderer(TEAM_COLORS)
         self.match_renderer = MatchBracketComponent(TEAM_COLORS)
-        self.tournament_data = get_tournament_structure()
 
     @staticmethod
     def create_matches_header() -> html.Div:
@@ -26,10 +28,13 @@ class TournamentMatchesComponent:
             html.H2("next generation trophy 25/26", className="tournament-title")
         ], className="tournament-header")
 
-    def create_group_section(self) -> html.Div:
+    def create_group_section(self, snapshot: TournamentSnapshot) -> html.Div:
         """
         Create the group stage section with all team groups.
 
+        Args:
+            snapshot (TournamentSnapshot): Tournament data to render
+
         Returns:
             html.Div: Complete group section layout
         """
@@ -38,10 +43,10 @@ class TournamentMatchesComponent:
         # Main groups (A, B, C, D)
         main_groups = []
         for group_id in ["A", "B", "C", "D"]:
-            group_teams = get_teams_by_group(group_id)
+            group_teams = get_teams_by_group(group_id, snapshot)
             group_color = TOURNAMENT_GROUPS[group_id]["color"]
             group_component = self.team_renderer.create_team_group(
-                f"Group {group_id}", group_teams, group_color
+                f"Group {group_id}", group_teams, group_color, group_id=group_id
             )
             main_groups.append(group_component)
 
@@ -49,48 +54,31 @@ class TournamentMatchesComponent:
             html.Div(main_groups, className="tournament-matches-main-groups")
         ], className="tournament-matches group-section")
 
-    def create_group_stage_matches(self) -> html.Div:
-        group_matches_ids = ['A1', 'A5', 'A9', 'B2', 'B6', 'B10', 'C3', 'C7', 'C11', 'D4', 'D8', 'D12']
-        group_stage_matches = [
-            match_data
-            for match, match_data in self.tournament_data["matches"].items()
-            if match in group_matches_ids
-        ]
-        table = self.create_table(title='Thursday, 15th August 2024', matches=group_stage_matches)
+    def create_match_day_table(self, snapshot: TournamentSnapshot, match_day: int) -> html.Div:
+        """
+        Create the schedule table of one match day.
 
-        return table
+        Args:
+            snapshot (TournamentSnapshot): Tournament data to render
+            match_day (int): Match day number, 1 for the first day in the schedule
 
-    def create_knockout_matches_1(self) -> html.Div:
-        group_matches_ids = [
-            'QF1', 'QF2', 'QF3', 'QF4',
-            '9-12-17', '9-12-18', '9-12-22', '9-12-23',
-            '5-8-1', '5-8-2',
-            'SF1', 'SF2'
-        ]
-        group_stage_matches = [
-            match_data
-            for match, match_data in self.tournament_data["matches"].items()
-            if match in group_matches_ids
-        ]
-        table = self.create_table(title='Friday, 16th August 2024', matches=group_stage_matches)
+        Returns:
+            html.Div: Schedule table for the day, empty if the schedule has fewer days
+        """
+        days = snapshot.schedule.days
+        if match_day > len(days):
+            return html.Div()
+        day: date = days[match_day - 1]
+        return self.create_table(title=format_match_day_title(day), matches=list(snapshot.schedule.matches_on(day)))
 
-        return table
+    def create_group_stage_matches(self, snapshot: TournamentSnapshot) -> html.Div:
+        return self.create_match_day_table(snapshot, match_day=1)
 
-    def create_knockout_matches_2(self) -> html.Div:
-        group_matches_ids = [
-            '9-12-25', '9-12-26',
-            '7-8', '5-6',
-            '3rd-4th',
-            'Final'
-        ]
-        group_stage_matches = [
-            match_data
-            for match, match_data in self.tournament_data["matches"].items()
-            if match in group_matches_ids
-        ]
-        table = self.create_table(title='Saturday, 17th August 2024', matches=group_stage_matches)
+    def create_knockout_matches_1(self, snapshot: TournamentSnapshot) -> html.Div:
+        return self.create_match_day_table(snapshot, match_day=2)
 
-        return table
+    def create_knockout_matches_2(self, snapshot: TournamentSnapshot) -> html.Div:
+        return self.create_match_day_table(snapshot, match_day=3)
 
     def create_table(self, title: str, matches: List[MatchData], class_name_suffix: int = 1) -> html.Div:
         table_rows = []
@@ -129,8 +117,10 @@ class TournamentMatchesComponent:
                                 html.Div([match.team1 + ' vs ' + match.team2],
                                          className=f"table-body-cell fixture-cell-text{class_name_suffix}")
                             ], className=f"table-body-cell fixture-cell-container{class_name_suffix}"),
-                            className=f"table-body-cell-fixture-cell-images{class_name_suffix}"),
-                        html.Td(match.match_score, className=f"table-body-cell result-cell{class_name_suffix}")
+                            className=f"table-body-cell-fixture-cell-images{class_name_suffix}",
+                            **patch_target("fixture", match.match_id)),
+                        html.Td(match.match_score, className=f"table-body-cell result-cell{class_name_suffix}",
+                                **patch_target("score", match.match_id))
                     ], className=f"table-body-row-tr{class_name_suffix}")
                 )
             else:
@@ -141,8 +131,10 @@ class TournamentMatchesComponent:
                         # html.Td(match.group, className="table-body-cell"),
                         html.Td(match.match_time, className=f"table-body-cell{class_name_suffix}"),
                         html.Td(html.Div(match.team1 + ' vs ' + match.team2,  className=f"table-body-cell fixture-cell-text{class_name_suffix}"),
-                                className=f"table-body-cell fixture-cell{class_name_suffix}"),
-                        html.Td(match.match_score, className=f"table-body-cell result-cell{class_name_suffix}")
+                                className=f"table-body-cell fixture-cell{class_name_suffix}",
+                                **patch_target("fixture", match.match_id)),
+                        html.Td(match.match_score, className=f"table-body-cell result-cell{class_name_suffix}",
+                                **patch_target("score", match.match_id))
                     ], className=f"table-body-row-tr{class_name_suffix}")
                 )
 
@@ -155,25 +147,29 @@ class TournamentMatchesComponent:
             html.Table(table_header + table_body, className=f"tournament-table{class_name_suffix}")
         ], className=f"table-container-wrapper{class_name_suffix}")
 
-    def create_complete_tournament_matches(self) -> html.Div:
+    def create_complete_tournament_matches(self, snapshot: Optional[TournamentSnapshot] = None) -> html.Div:
         """
         Create the complete tournament matches layout.
 
+        Args:
+            snapshot (Optional[TournamentSnapshot]): Tournament data to render, defaults to the current one
+
         Returns:
             html.Div: Complete tournament visualization
         """
+        snapshot = snapshot or get_current_snapshot()
         return html.Div([
             self.create_matches_header(),
 
             html.Div([
                 html.Div([
-                    self.create_group_section(),
-                    self.create_group_stage_matches(),
+                    self.create_group_section(snapshot),
+                    self.create_group_stage_matches(snapshot),
                 ], className="tournament-matches-groups"
                 ),
                 html.Div([
-                    self.create_knockout_matches_1(),
-                    self.create_knockout_matches_2(),
+                    self.create_knockout_matches_1(snapshot),
+                    self.create_knockout_matches_2(snapshot),
                 ], className="tournament-matches-knockouts")
             ], className="tournament-matches-body")
 
@@ -4,13 +4,13 @@ Tournament Tree Component
 This module provides the TournamentTreeComponent class for creating the complete
 tournament bracket visualization based on the provided sketch design.
 """
-from typing import List
+from typing import List, Optional
 
 from dash import html
 from .team_card import TeamCardRenderer
 from .match_bracket import MatchBracketComponent
 from config.tournament_config import TEAM_COLORS, TOURNAMENT_GROUPS
-from data.tournament_data import get_tournament_structure, get_teams_by_group, SAMPLE_MATCHES
+from data.tournament_data import get_current_snapshot, get_teams_by_group, TournamentSnapshot
 
 
 class TournamentTreeComponent:
@@ -25,7 +25,6 @@ class TournamentTreeComponent:
         """Initialize the tournament tree component."""
         self.team_renderer = TeamCardRenderer(TEAM_COLORS)
         self.match_renderer = MatchBracketComponent(TEAM_COLORS)
-        self.tournament_data = get_tournament_structure()
 
     @staticmethod
     def create_tournament_header() -> html.Div:
@@ -39,10 +38,13 @@ class TournamentTreeComponent:
             html.H2("next generation trophy 25/26", className="tournament-title")
         ], className="tournament-header")
 
-    def create_group_section(self) -> html.Div:
+    def create_group_section(self, snapshot: TournamentSnapshot) -> html.Div:
         """
         Create the group stage section with all team groups.
         
+        Args:
+            snapshot (TournamentSnapshot): Tournament data to render
+
         Returns:
             html.Div: Complete group section layout
         """
@@ -51,10 +53,10 @@ class TournamentTreeComponent:
         # Main groups (A, B, C, D)
         main_groups = []
         for group_id in ["A", "B", "C", "D"]:
-            group_teams = get_teams_by_group(group_id)
+            group_teams = get_teams_by_group(group_id, snapshot)
             group_color = TOURNAMENT_GROUPS[group_id]["color"]
             group_component = self.team_renderer.create_team_group(
-                f"Group {group_id}", group_teams, group_color
+                f"Group {group_id}", group_teams, group_color, group_id=group_id
             )
             main_groups.append(group_component)
 
@@ -63,33 +65,41 @@ class TournamentTreeComponent:
             html.Div(main_groups, className="main-groups")
         ], className="group-section")
 
-    def create_quarter_finals_section(self) -> html.Div:
+    def create_quarter_finals_section(self, snapshot: TournamentSnapshot) -> html.Div:
         """
         Create the quarter-finals section.
         
+        Args:
+            snapshot (TournamentSnapshot): Tournament data to render
+
         Returns:
             html.Div: Quarter-finals layout
         """
+        matches = snapshot.matches
         qf_brackets = [
             self.match_renderer.create_quarter_final_bracket(
-                SAMPLE_MATCHES["QF1"].match_id, SAMPLE_MATCHES["QF1"].team1, SAMPLE_MATCHES["QF1"].team2,
+                matches["QF1"].match_id, matches["QF1"].team1, matches["QF1"].team2,
                 background_color_1='orange', background_color_2='blue',
-                team1_logo=SAMPLE_MATCHES["QF1"].team1_logo, team2_logo=SAMPLE_MATCHES["QF1"].team2_logo,
+                team1_logo=matches["QF1"].team1_logo, team2_logo=matches["QF1"].team2_logo,
+                match_key=matches["QF1"].match_id,
             ),
             self.match_renderer.create_quarter_final_bracket(
-                SAMPLE_MATCHES["QF2"].match_id, SAMPLE_MATCHES["QF2"].team1, SAMPLE_MATCHES["QF2"].team2,
+                matches["QF2"].match_id, matches["QF2"].team1, matches["QF2"].team2,
                 background_color_1='blue', background_color_2='orange',
-                team1_logo=SAMPLE_MATCHES["QF2"].team1_logo, team2_logo=SAMPLE_MATCHES["QF2"].team2_logo,
+                team1_logo=matches["QF2"].team1_logo, team2_logo=matches["QF2"].team2_logo,
+                match_key=matches["QF2"].match_id,
             ),
             self.match_renderer.create_quarter_final_bracket(
-                SAMPLE_MATCHES["QF3"].match_id, SAMPLE_MATCHES["QF3"].team1, SAMPLE_MATCHES["QF3"].team2,
+                matches["QF3"].match_id, matches["QF3"].team1, matches["QF3"].team2,
                 background_color_1='pink', background_color_2='green',
-                team1_logo=SAMPLE_MATCHES["QF3"].team1_logo, team2_logo=SAMPLE_MATCHES["QF3"].team2_logo,
+                team1_logo=matches["QF3"].team1_logo, team2_logo=matches["QF3"].team2_logo,
+                match_key=matches["QF3"].match_id,
             ),
             self.match_renderer.create_quarter_final_bracket(
-                SAMPLE_MATCHES["QF4"].match_id, SAMPLE_MATCHES["QF4"].team1, SAMPLE_MATCHES["QF4"].team2,
+                matches["QF4"].match_id, matches["QF4"].team1, matches["QF4"].team2,
                 background_color_1='green', background_color_2='pink',
-                team1_logo=SAMPLE_MATCHES["QF4"].team1_logo, team2_logo=SAMPLE_MATCHES["QF4"].team2_logo,
+                team1_logo=matches["QF4"].team1_logo, team2_logo=matches["QF4"].team2_logo,
+                match_key=matches["QF4"].match_id,
             )
         ]
 
@@ -98,23 +108,29 @@ class TournamentTreeComponent:
             html.Div([qf_brackets[2], qf_brackets[3]], className="qf-right")
         ], className="quarter-finals-section")
 
-    def create_semi_finals_section(self) -> html.Div:
+    def create_semi_finals_section(self, snapshot: TournamentSnapshot) -> html.Div:
         """
         Create the semi-finals section.
         
+        Args:
+            snapshot (TournamentSnapshot): Tournament data to render
+
         Returns:
             html.Div: Semi-finals layout
         """
+        matches = snapshot.matches
         sf_brackets = [
             self.match_renderer.create_semin_final_bracket(
-                SAMPLE_MATCHES["SF1"].match_id, SAMPLE_MATCHES["SF1"].team1, SAMPLE_MATCHES["SF1"].team2,
+                matches["SF1"].match_id, matches["SF1"].team1, matches["SF1"].team2,
                 background_color_1='None', background_color_2='None',
-                team1_logo=SAMPLE_MATCHES["SF1"].team1_logo, team2_logo=SAMPLE_MATCHES["SF1"].team2_logo,
+                team1_logo=matches["SF1"].team1_logo, team2_logo=matches["SF1"].team2_logo,
+                match_key=matches["SF1"].match_id,
             ),
             self.match_renderer.create_semin_final_bracket(
-                SAMPLE_MATCHES["SF2"].match_id, SAMPLE_MATCHES["SF2"].team1, SAMPLE_MATCHES["SF2"].team2,
+                matches["SF2"].match_id, matches["SF2"].team1, matches["SF2"].team2,
                 background_color_1='None', background_color_2='None',
-                team1_logo=SAMPLE_MATCHES["SF2"].team1_logo, team2_logo=SAMPLE_MATCHES["SF2"].team2_logo
+                team1_logo=matches["SF2"].team1_logo, team2_logo=matches["SF2"].team2_logo,
+                match_key=matches["SF2"].match_id
             ),
         ]
 
@@ -123,21 +139,27 @@ class TournamentTreeComponent:
             html.Div([sf_brackets[1]], className="semi-final-bottom")
         ], className="semi-finals-section")
 
-    def create_finals_section(self) -> html.Div:
+    def create_finals_section(self, snapshot: TournamentSnapshot) -> html.Div:
         """
         Create the finals section with trophy.
         
+        Args:
+            snapshot (TournamentSnapshot): Tournament data to render
+
         Returns:
             html.Div: Finals layout
         """
+        matches = snapshot.matches
         final_bracket = self.match_renderer.create_final_bracket(
-            SAMPLE_MATCHES["Final"].team1, SAMPLE_MATCHES["Final"].team2,
-            team1_logo=SAMPLE_MATCHES["Final"].team1_logo, team2_logo=SAMPLE_MATCHES["Final"].team2_logo
+            matches["Final"].team1, matches["Final"].team2,
+            team1_logo=matches["Final"].team1_logo, team2_logo=matches["Final"].team2_logo,
+            match_key=matches["Final"].match_id
         )
 
         placement_3rd_4th = self.match_renderer.create_placement_bracket(
-            "3rd-4th", SAMPLE_MATCHES["3rd-4th"].team1, SAMPLE_MATCHES["3rd-4th"].team2,
-            team1_logo=SAMPLE_MATCHES["3rd-4th"].team1_logo, team2_logo=SAMPLE_MATCHES["3rd-4th"].team2_logo
+            "3rd-4th", matches["3rd-4th"].team1, matches["3rd-4th"].team2,
+            team1_logo=matches["3rd-4th"].team1_logo, team2_logo=matches["3rd-4th"].team2_logo,
+            match_key=matches["3rd-4th"].match_id
         )
 
         return html.Div([
@@ -169,14 +191,18 @@ class TournamentTreeComponent:
 
         return html.Div(placement_brackets, className="placement-section")
 
-    def create_complete_tournament_tree(self) -> html.Div:
+    def create_complete_tournament_tree(self, snapshot: Optional[TournamentSnapshot] = None) -> html.Div:
         """
         Create the complete tournament tree layout.
         
+        Args:
+            snapshot (Optional[TournamentSnapshot]): Tournament data to render, defaults to the current one
+
         Returns:
             html.Div: Complete tournament visualization
         """
-        group_9_12_teams = get_teams_by_group("9-12")
+        snapshot = snapshot or get_current_snapshot()
+        group_9_12_teams = get_teams_by_group("9-12", snapshot)
         group_9_12 = self.team_renderer.create_team_group(
             "Group 9-12", group_9_12_teams, "indigo"
         )
@@ -187,16 +213,16 @@ class TournamentTreeComponent:
             html.Div([
                 # Left side: Group Stage
                 html.Div([
-                    self.create_group_section(),
+                    self.create_group_section(snapshot),
                 ], className="tournament-left"),
 
                 # Center Left: Quarter Finals & 9-12
                 html.Div([
-                    self.create_quarter_finals_section(),
+                    self.create_quarter_finals_section(snapshot),
                     # html.Div([group_9_12], className="side-group"),
                 ], className="tournament-center-left"),
                 html.Div([
-                    self.create_semi_finals_section(),
+                    self.create_semi_finals_section(snapshot),
                     # self.create_placement_section(
                     #     match_1_name="Placement (5th-8th) Match 1", match_2_name="Placement (5th-8th) Match 2",
                     #     match_1_teams=["Loser QF1", "Loser QF3"], match_2_teams=["Loser QF2", "Loser QF4"]
@@ -205,7 +231,7 @@ class TournamentTreeComponent:
 
                 # Right side: Placement matches
                 html.Div([
-                    self.create_finals_section(),
+                    self.create_finals_section(snapshot),
                     # self.create_placement_section(
                     #     match_1_name="5th-6th", match_2_name="7th-8th",
                     #     match_1_teams=["Winner Placement 1", "Winner Placement 2"],
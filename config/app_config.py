@@ -14,19 +14,112 @@ DEBUG_MODE = True
 # View Rotation Settings
 ROTATION_INTERVAL_SECONDS = 30
 AUTO_ROTATION_ENABLED = True
+# "client" delivers all views once and rotates them in the browser, "server" swaps views
+# with a callback on every rotation tick
+ROTATION_MODE = "client"
+# How screens in client rotation mode learn that views changed: "poll" asks every
+# VIEW_VERSION_CHECK_INTERVAL_SECONDS. "push" keeps a server-sent events connection open
+# per screen; it needs Dash >= 2.16 (dash_clientside.set_props) and a server that does not
+# block a worker per connection: the threaded dev server, or gunicorn with the gthread
+# workers configured in gunicorn.conf.py
+VIEW_UPDATE_MODE = "push"
+# How often screens in client rotation mode ask whether the views changed when polling,
+# also used by browsers without EventSource support
+VIEW_VERSION_CHECK_INTERVAL_SECONDS = 15
+# Route of the server-sent events stream and how often it sends a keepalive comment,
+# so proxies do not close connections that are idle between snapshots
+VIEW_EVENTS_ROUTE = "/_events/views"
+VIEW_EVENTS_KEEPALIVE_SECONDS = 20
+
+# Data Refresh Settings
+DATA_REFRESH_ENABLED = True
+DATA_REFRESH_INTERVAL_SECONDS = 60
+# Check mart metadata first and only re-query marts that changed
+CHANGE_DETECTION_ENABLED = True
+# Fixtures column with the row update time (e.g. "updated_at"). When set, fixtures are synced
+# incrementally by watermark and merged by match_id instead of reloaded in full.
+FIXTURES_WATERMARK_COLUMN = None
+
+# Mart source: "bigquery", or "local" to read <table>.parquet files from LOCAL_DATA_DIR
+# (export them with `python -m data_reader.NextGenDataReader local_data`)
+DATA_BACKEND = "bigquery"
+LOCAL_DATA_DIR = "local_data"
+
+# "arrow" streams Arrow record batches (Storage Read API when installed), "rest" uses to_dataframe()
+DATA_READ_MODE = "arrow"
+
+# Number of players shown on the goalscorers view, also pushed down as a query LIMIT
+GOALSCORERS_TOP_N = 14
+
+# Local Parquet snapshot of the marts used for warm starts and offline fallback
+SNAPSHOT_CACHE_DIR = ".snapshot_cache"
+SNAPSHOT_CACHE_TTL_SECONDS = 300
+
+# Fixtures column holding the match date, only read when the fixtures mart has it.
+# Without it (or with None) dates are derived from TOURNAMENT_START_DATE and
+# ROUND_MATCH_DAYS, so TOURNAMENT_START_DATE must then be set for the tournament.
+FIXTURES_DATE_COLUMN = "match_date"
+
+# Number of upcoming kickoffs shown on the Live & Next view
+LIVE_NEXT_UPCOMING_COUNT = 8
+
+# Rendered views are cached per snapshot version. Views that also depend on
+# the clock are re-rendered at most once per this many seconds.
+VIEW_RENDER_TIME_BUCKETS = {
+    "live_next": 30,
+}
+# Serialized views shared by all worker processes
+VIEW_PAYLOAD_CACHE_DIR = ".view_cache"
+# Published snapshots kept in memory, so screens still showing one of them
+# receive a patch of the changed elements instead of whole views
+SNAPSHOT_HISTORY_SIZE = 4
+
+# Squad Settings
+# Directory with one squad workbook per team, parsed with `python -m data_reader.squad_parser`
+SQUAD_SOURCE_DIR = "squads"
+SQUAD_STORE_DIR = "squad_store"
+
+# Group Standings Settings
+# "mart" reads the group tables from BigQuery, "fixtures" computes them locally. Computing
+# them relies on MATCH_STATUS_FINISHED matching the status the fixtures mart reports for
+# finished matches, so keep the cross-check on until that is confirmed
+GROUP_STANDINGS_SOURCE = "mart"
+# With "fixtures", also read the standings mart and log teams whose computed position differs
+GROUP_STANDINGS_CROSS_CHECK = True
 
 # Available Views
 AVAILABLE_VIEWS = [
     "tournament_tree",
     "tournament_schedule",
     "goalscorers",
+    "live_next",
 ]
 
+# Display Groups
+# Screens join a group with ?group=<name> in their URL. A group's current view is derived
+# from the server clock and its rotation plan, so all screens of a group show the same view
+# and switch at the same moment. Slots are counted from the Unix epoch.
+DEFAULT_DISPLAY_GROUP = "default"
+DISPLAY_GROUPS = {
+    "default": {"views": AVAILABLE_VIEWS, "slot_seconds": ROTATION_INTERVAL_SECONDS},
+}
+# Render each display group's next view in the background this many seconds before its
+# slot starts, and all views again whenever a new snapshot is published
+PRERENDER_ENABLED = True
+PRERENDER_LEAD_SECONDS = 5
+# Route reporting the server clock, which screens use to correct their own clock
+DISPLAY_CLOCK_ROUTE = "/_clock"
+# How often screens check their group's slot in client rotation mode (no server requests)
+DISPLAY_TICK_MS = 250
+# How often screens re-measure their clock offset to the server
+DISPLAY_CLOCK_SYNC_SECONDS = 600
+
 # View Display Names
 VIEW_DISPLAY_NAMES = {
     "tournament_tree": "Tournament Tree",
     "tournament_schedule": "Tournament Schedule",
-    "goalscorers": "Goalscorers"
+    "goalscorers": "Goalscorers",
+    "live_next": "Live & Next"
 }
 
 # Layout Settings
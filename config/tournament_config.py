@@ -5,6 +5,9 @@ This module contains tournament-specific configuration including team data,
 groups, and tournament structure.
 """
 
+from datetime import date
+from typing import Optional
+
 # Team Colors (matching the sketch design)
 TEAM_COLORS = {
     # "orange": "#FF8C00",
@@ -58,3 +61,46 @@ SEMI_FINALS = ["SF1", "SF2"]
 FINALS = ["Final"]
 PLACEMENT_MATCHES = ["3rd-4th", "5th-8th"]
 
+
+# First day of the tournament, e.g. date(2024, 8, 15). Only used to derive match
+# dates when FIXTURES_DATE_COLUMN is None.
+TOURNAMENT_START_DATE: Optional[date] = None
+
+# Timezone of the venue. Kickoff times in the fixtures mart are local to it, so
+# "now" is taken in this timezone whatever timezone the server runs in
+TOURNAMENT_TIMEZONE = "Europe/Vienna"
+
+# Playing time of a match including half time, used to tell whether a match is still live
+MATCH_DURATION_MINUTES = 25
+
+# Match day of each fixture round, counted from TOURNAMENT_START_DATE.
+# Only used when the fixtures mart is read without a date column.
+ROUND_MATCH_DAYS = {
+    "group_stage": 1,
+    "quarter_final_1": 2,
+    "quarter_final_2": 2,
+    "quarter_final_3": 2,
+    "quarter_final_4": 2,
+    "9th-12th_round_1": 2,
+    "9th-12th_round_2": 2,
+    "5th-8th_place_1": 2,
+    "5th-8th_place_2": 2,
+    "semi_final_1": 2,
+    "semi_final_2": 2,
+    "9th-12th_round_3": 3,
+    "7th-8th_place": 3,
+    "5th-6th_place": 3,
+    "3rd-4th_place": 3,
+    "final": 3,
+}
+
+# Match status values reported by the fixtures mart. Local standings, the bracket
+# resolver and Live & Next only count a match as finished when its status equals
+# MATCH_STATUS_FINISHED exactly
+MATCH_STATUS_LIVE = "live"
+MATCH_STATUS_FINISHED = "finished"
+
+# Team names whose squad workbook file name differs from the name used in the marts
+SQUAD_TEAM_NAMES = {
+    "Brondby IF": "Brøndby IF",
+}
@@ -0,0 +1,256 @@
+"""
+Bracket Resolver
+
+This module provides the BracketResolver class, an in-process dependency graph
+over the placeholder fixtures ("Winner Match 13", "3. Group A", ...). It fills
+in knockout pairings from known results as soon as they are final, instead of
+waiting for the fixtures mart to catch up.
+"""
+
+import re
+from collections import defaultdict, deque
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import pandas as pd
+
+from config.tournament_config import MATCH_STATUS_FINISHED
+
+MATCH_REFERENCE = re.compile(r"^(Winner|Loser) Match (\d+)$")
+GROUP_REFERENCE = re.compile(r"^(\d+)\. Group (\w+)$")
+
+SIDES = ("home", "away")
+
+
+class ResolvedTeam(NamedTuple):
+    team_id: int
+    team_name: str
+
+
+class SlotSource(NamedTuple):
+    """Where a fixture slot gets its team from: the winner/loser of a match or a group position."""
+    kind: str
+    key: object
+    position: int = 0
+
+    @property
+    def node(self) -> Tuple[str, object]:
+        return ("group", self.key) if self.kind == "group" else ("match", self.key)
+
+
+def parse_placeholder(placeholder: str) -> Optional[SlotSource]:
+    """
+    Parse a placeholder team name into the slot it depends on.
+
+    Args:
+        placeholder (str): e.g. "Winner Match 13", "Loser Match 21" or "3. Group A"
+
+    Returns:
+        Optional[SlotSource]: Parsed source, None for empty or unknown placeholders
+    """
+    match_reference = MATCH_REFERENCE.match(placeholder)
+    if match_reference:
+        return SlotSource(match_reference.group(1).lower(), int(match_reference.group(2)))
+    group_reference = GROUP_REFERENCE.match(placeholder)
+    if group_reference:
+        return SlotSource("group", group_reference.group(2), int(group_reference.group(1)))
+    return None
+
+
+def _value(value):
+    # Normalise pandas missing values so scores and teams compare safely
+    return None if pd.isna(value) else value
+
+
+def _decide(home_goals, away_goals, home_penalties, away_penalties) -> Optional[str]:
+    if home_goals is None or away_goals is None:
+        return None
+    if home_goals != away_goals:
+        return "home" if home_goals > away_goals else "away"
+    if home_penalties is None or away_penalties is None or home_penalties == away_penalties:
+        return None
+    return "home" if home_penalties > away_penalties else "away"
+
+
+class BracketResolver:
+    """
+    Resolves placeholder fixture slots from match results and final group positions.
+
+    Each match and each group is a node; every placeholder slot is an edge from
+    the node it references to the match it belongs to. When a result or a group
+    table changes, only the nodes reachable from it are recomputed.
+
+    Teams already provided by the fixtures mart always take precedence over
+    resolved ones.
+    """
+
+    def __init__(self, placeholders: Dict[int, Dict[str, str]]):
+        """
+        Initialize the resolver from the placeholder table.
+
+        Args:
+            placeholders (Dict[int, Dict[str, str]]): Placeholder names per match id and side
+        """
+        self.sources: Dict[Tuple[int, str], SlotSource] = {}
+        self.dependents: Dict[Tuple[str, object], List[Tuple[int, str]]] = defaultdict(list)
+        for match_id, sides in placeholders.items():
+            for side in SIDES:
+                source = parse_placeholder(sides[side])
+                if source is not None:
+                    self.sources[(match_id, side)] = source
+                    self.dependents[source.node].append((match_id, side))
+
+        self.reset()
+
+    def reset(self):
+        """Forget all results, so the next update ingests every fixture again."""
+        self._mart_teams: Dict[Tuple[int, str], Optional[ResolvedTeam]] = {}
+        self._scores: Dict[int, Tuple] = {}
+        self._outcomes: Dict[int, Optional[Tuple[ResolvedTeam, ResolvedTeam]]] = {}
+        self._group_positions: Dict[str, Dict[int, ResolvedTeam]] = {}
+        self._resolved: Dict[Tuple[int, str], ResolvedTeam] = {}
+        self._ingested_all = False
+
+    def team(self, match_id: int, side: str) -> Optional[ResolvedTeam]:
+        """
+        Get the team playing in a fixture slot.
+
+        Args:
+            match_id (int): Fixture id
+            side (str): "home" or "away"
+
+        Returns:
+            Optional[ResolvedTeam]: Team from the mart or from resolution, None if still open
+        """
+        return self._mart_teams.get((match_id, side)) or self._resolved.get((match_id, side))
+
+    def _source_team(self, source: SlotSource) -> Optional[ResolvedTeam]:
+        if source.kind == "group":
+            return self._group_positions.get(source.key, {}).get(source.position)
+        outcome = self._outcomes.get(source.key)
+        if outcome is None:
+            return None
+        return outcome[0] if source.kind == "winner" else outcome[1]
+
+    def _recompute_outcome(self, match_id: int) -> bool:
+        home, away = self.team(match_id, "home"), self.team(match_id, "away")
+        score = self._scores.get(match_id)
+        outcome = None
+        if home is not None and away is not None and score is not None:
+            decision = _decide(*score)
+            if decision is not None:
+                outcome = (home, away) if decision == "home" else (away, home)
+        if outcome == self._outcomes.get(match_id):
+            return False
+        self._outcomes[match_id] = outcome
+        return True
+
+    def _propagate(self, dirty: Iterable[Tuple[str, object]]) -> Set[int]:
+        affected = set()
+        queue = deque(dirty)
+        while queue:
+            for match_id, side in self.dependents.get(queue.popleft(), ()):
+                team = self._source_team(self.sources[(match_id, side)])
+                if team == self._resolved.get((match_id, side)):
+                    continue
+                if team is None:
+                    del self._resolved[(match_id, side)]
+                else:
+                    self._resolved[(match_id, side)] = team
+                affected.add(match_id)
+                if self._recompute_outcome(match_id):
+                    queue.append(("match", match_id))
+        return affected
+
+    def _ingest_fixtures(self, fixtures_df: pd.DataFrame) -> Set[Tuple[str, object]]:
+        dirty = set()
+        columns = [
+            "match_id", "match_status",
+            "home_team_id", "home_team_name", "home_team_goals", "home_team_penalty_goals",
+            "away_team_id", "away_team_name", "away_team_goals", "away_team_penalty_goals",
+        ]
+        for (match_id, status, home_id, home_name, home_goals, home_penalties,
+             away_id, away_name, away_goals, away_penalties) in zip(*(fixtures_df[c].tolist() for c in columns)):
+            changed = False
+            for side, team_id, team_name in (("home", home_id, home_name), ("away", away_id, away_name)):
+                team = None if pd.isna(team_id) else ResolvedTeam(int(team_id), team_name)
+                if self._mart_teams.get((match_id, side)) != team:
+                    self._mart_teams[(match_id, side)] = team
+                    changed = True
+            score = None
+            if status == MATCH_STATUS_FINISHED:
+                score = tuple(_value(goals) for goals in (home_goals, away_goals, home_penalties, away_penalties))
+            if self._scores.get(match_id) != score:
+                self._scores[match_id] = score
+                changed = True
+            if changed and self._recompute_outcome(match_id):
+                dirty.add(("match", match_id))
+        return dirty
+
+    def _ingest_group_standings(self, fixtures_df: pd.DataFrame, group_standings: pd.DataFrame) -> Set[Tuple[str, object]]:
+        # Group positions only count once every group match is finished
+        group_matches = fixtures_df[fixtures_df["round_name"] == "group_stage"]
+        finished = group_matches["match_status"].eq(MATCH_STATUS_FINISHED).groupby(group_matches["group_name"]).all()
+
+        dirty = set()
+        for group_name in set(finished.index) | set(self._group_positions):
+            positions = {}
+            if finished.get(group_name, False):
+                rows = group_standings[group_standings["group_name"] == group_name]
+                positions = {
+                    int(position): ResolvedTeam(int(team_id), team_name)
+                    for position, team_id, team_name in zip(
+                        rows["group_position"].tolist(), rows["team_id"].tolist(), rows["team_name"].tolist()
+                    )
+                }
+            if positions != self._group_positions.get(group_name, {}):
+                self._group_positions[group_name] = positions
+                dirty.add(("group", group_name))
+        return dirty
+
+    def update(self,
+               fixtures_df: pd.DataFrame,
+               group_standings: pd.DataFrame,
+               changed_match_ids: Optional[FrozenSet[int]] = None) -> Set[int]:
+        """
+        Feed new fixtures and standings and resolve everything downstream of what changed.
+
+        Args:
+            fixtures_df (pd.DataFrame): Fixtures as read from the mart
+            group_standings (pd.DataFrame): Group standings with group_position
+            changed_match_ids (Optional[FrozenSet[int]]): Fixtures known to have changed,
+                all fixtures are compared when None or after a reset
+
+        Returns:
+            Set[int]: Ids of matches whose resolved teams changed
+        """
+        rows = fixtures_df
+        if changed_match_ids is not None and self._ingested_all:
+            rows = fixtures_df[fixtures_df["match_id"].isin(changed_match_ids)]
+        dirty = self._ingest_fixtures(rows) | self._ingest_group_standings(fixtures_df, group_standings)
+        affected = self._propagate(dirty)
+        self._ingested_all = True
+        return affected
+
+    def apply(self, fixtures_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fill fixture slots the mart has not resolved yet with resolved teams.
+
+        Args:
+            fixtures_df (pd.DataFrame): Fixtures with placeholder team names
+
+        Returns:
+            pd.DataFrame: Copy of the fixtures with resolved team ids and names
+        """
+        if not self._resolved:
+            return fixtures_df
+
+        fixtures_df = fixtures_df.copy()
+        for side in SIDES:
+            resolved = {match_id: team for (match_id, slot_side), team in self._resolved.items() if slot_side == side}
+            id_column, name_column = f"{side}_team_id", f"{side}_team_name"
+            resolved_ids = fixtures_df["match_id"].map({k: team.team_id for k, team in resolved.items()})
+            resolved_names = fixtures_df["match_id"].map({k: team.team_name for k, team in resolved.items()})
+            open_slots = fixtures_df[id_column].isna() & resolved_ids.notna()
+            fixtures_df[id_column] = fixtures_df[id_column].mask(open_slots, resolved_ids.astype(fixtures_df[id_column].dtype))
+            fixtures_df[name_column] = fixtures_df[name_column].mask(open_slots, resolved_names)
+        return fixtures_df
@@ -0,0 +1,149 @@
+"""
+Tournament Data Refresher
+
+This module provides the TournamentDataRefresher class which periodically
+rebuilds the tournament snapshot in a background thread and publishes it
+with a single atomic swap, keeping BigQuery off the request path.
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Optional
+
+from data.bracket_resolver import BracketResolver
+from data.goalscorer_leaderboard import GoalscorerLeaderboard
+from data.group_standings import GroupStandingsEngine
+from data.player_index import PlayerIndex
+from data.tournament_data import (
+    build_tournament_snapshot, get_current_snapshot, publish_snapshot, TournamentSnapshot
+)
+from data_reader.NextGenDataReader import NextGenDataReader
+from data_reader.snapshot_cache import MartSnapshotCache
+
+logger = logging.getLogger(__name__)
+
+
+class TournamentDataRefresher:
+    """
+    Rebuilds the tournament snapshot on a fixed interval.
+
+    Failed refreshes are logged and the last good snapshot keeps being served.
+    Snapshots whose data did not change are not published, so downstream
+    consumers keyed on the snapshot version are left untouched. Every
+    load that built a snapshot is written to the snapshot cache for the next
+    start.
+    """
+
+    def __init__(self, reader: NextGenDataReader, interval_seconds: float,
+                 cache: Optional[MartSnapshotCache] = None, change_detection: bool = True,
+                 resolver: Optional[BracketResolver] = None,
+                 standings_engine: Optional[GroupStandingsEngine] = None,
+                 leaderboard: Optional[GoalscorerLeaderboard] = None,
+                 player_index: Optional[PlayerIndex] = None):
+        """
+        Initialize the refresher.
+
+        Args:
+            reader (NextGenDataReader): Reader used to query the marts
+            interval_seconds (float): Seconds to wait between refreshes
+            cache (Optional[MartSnapshotCache]): Snapshot cache updated after each load
+            change_detection (bool): Only re-query marts whose table metadata changed
+            resolver (Optional[BracketResolver]): Fills knockout slots the mart has not resolved yet
+            standings_engine (Optional[GroupStandingsEngine]): Computes standings from fixtures,
+                the standings mart is used when None
+            leaderboard (Optional[GoalscorerLeaderboard]): Leaderboard kept up to date with the goalscorer totals
+            player_index (Optional[PlayerIndex]): Squad players used to add details to the goalscorers
+        """
+        self.reader = reader
+        self.interval_seconds = interval_seconds
+        self.cache = cache
+        self.change_detection = change_detection
+        self.resolver = resolver
+        self.standings_engine = standings_engine
+        self.leaderboard = leaderboard
+        self.player_index = player_index
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self) -> Optional[TournamentSnapshot]:
+        """
+        Build a new snapshot and publish it if the data changed.
+
+        Returns:
+            Optional[TournamentSnapshot]: The published snapshot, or None if nothing changed
+        """
+        current = get_current_snapshot()
+        if self.change_detection:
+            marts = self.reader.read_changed_marts()
+            if marts is None:
+                # Nothing changed: skip the rebuild, only record that the data was revalidated
+                if self.cache is not None:
+                    self.cache.touch(datetime.now())
+                return None
+        else:
+            marts = self.reader.read_all_marts()
+
+        try:
+            snapshot = build_tournament_snapshot(marts, version=current.version + 1, resolver=self.resolver,
+                                                 standings_engine=self.standings_engine, leaderboard=self.leaderboard,
+                                                 player_index=self.player_index)
+        except Exception:
+            self._reset_engines()
+            raise
+        changed = snapshot.fingerprint != current.fingerprint
+        if changed and not publish_snapshot(snapshot):
+            return None
+        # Only a load that made it this far becomes the baseline of the next change detection
+        self.reader.commit_load()
+        if self.cache is not None:
+            self.cache.save(marts)
+        if not changed:
+            return None
+        logger.info("Published tournament snapshot v%s", snapshot.version)
+        return snapshot
+
+    def _reset_engines(self):
+        # A failed build may have left part of the load in the engines; the
+        # reader did not commit it, so the next refresh rebuilds them in full
+        for engine in (self.resolver, self.standings_engine, self.leaderboard):
+            if engine is not None:
+                engine.reset()
+
+    def _first_delay(self) -> float:
+        # Revalidate straight away when the startup snapshot came from a stale cache
+        snapshot = get_current_snapshot()
+        if self.cache is None:
+            return self.interval_seconds
+        age = (snapshot.created_at - snapshot.fetched_at).total_seconds()
+        return 0 if age >= self.cache.ttl_seconds else self.interval_seconds
+
+    def _run(self):
+        delay = self._first_delay()
+        while not self._stop_event.wait(delay):
+            delay = self.interval_seconds
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Tournament data refresh failed, keeping snapshot v%s",
+                                 get_current_snapshot().version)
+
+    def start(self):
+        """Start refreshing in a daemon thread. Calling start twice is a no-op."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="tournament-data-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop the refresher thread.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the thread to finish
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
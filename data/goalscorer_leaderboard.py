@@ -0,0 +1,215 @@
+"""
+Goalscorer Leaderboard
+
+This module keeps the goalscorer ranking sorted as the mart's goal totals
+change, so a new goal moves a single player instead of re-sorting the whole
+leaderboard. Places are dense: players with the same number of goals share
+a place and the next total takes the following place.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import pandas as pd
+from sortedcontainers import SortedList
+
+# Sort key of a player: most goals first, then alphabetically
+RankKey = Tuple[int, str, int]
+
+
+@dataclass(frozen=True, slots=True)
+class GoalscorerEntry:
+    """A player's row in the goalscorer leaderboard."""
+    place: int
+    player_name: str
+    team_id: int
+    total_goals: int
+
+
+@dataclass(frozen=True)
+class GoalscorerRanking:
+    """
+    Immutable copy of the leaderboard taken when a snapshot is built.
+
+    Rendering reads from the ranking, so later goals never change a view
+    that is already being built.
+    """
+    entries: Tuple[GoalscorerEntry, ...]
+    by_team: Mapping[int, Tuple[GoalscorerEntry, ...]]
+
+    def top(self, n: Optional[int] = None) -> Tuple[GoalscorerEntry, ...]:
+        """
+        Get the best n players.
+
+        Args:
+            n (Optional[int]): Number of players, all players if None
+
+        Returns:
+            Tuple[GoalscorerEntry, ...]: Players ordered by goals
+        """
+        return self.entries if n is None else self.entries[:n]
+
+    def for_team(self, team_id: int) -> Tuple[GoalscorerEntry, ...]:
+        """
+        Get the scorers of one team.
+
+        Args:
+            team_id (int): Team identifier
+
+        Returns:
+            Tuple[GoalscorerEntry, ...]: The team's players ordered by goals
+        """
+        return self.by_team.get(team_id, ())
+
+
+class GoalscorerLeaderboard:
+    """
+    Goalscorer ranking maintained incrementally.
+
+    Players are kept in SortedLists, so moving a player to a new total and
+    looking up a dense place are both O(log n).
+    """
+
+    def __init__(self):
+        """Initialize an empty leaderboard."""
+        self.reset()
+
+    def reset(self):
+        """Remove all players."""
+        self._totals: Dict[Tuple[str, int], int] = {}
+        self._order = SortedList()
+        self._team_order: Dict[int, SortedList] = {}
+        # Distinct goal totals, negated so the list is ascending
+        self._distinct_totals = SortedList()
+        self._total_counts: Counter = Counter()
+        self._ranking: Optional[GoalscorerRanking] = None
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def set_total(self, player_name: str, team_id: int, total_goals: int):
+        """
+        Set a player's goal total, removing the player when it drops to zero.
+
+        Args:
+            player_name (str): Name of the scorer
+            team_id (int): Team of the scorer
+            total_goals (int): New number of goals
+        """
+        player = (player_name, team_id)
+        previous = self._totals.get(player, 0)
+        if total_goals == previous:
+            return
+        if previous > 0:
+            self._remove((-previous, player_name, team_id))
+            del self._totals[player]
+        if total_goals > 0:
+            self._insert((-total_goals, player_name, team_id))
+            self._totals[player] = total_goals
+        self._ranking = None
+
+    def sync_totals(self, goalscorers: pd.DataFrame) -> int:
+        """
+        Bring the leaderboard in line with goal totals read from the goalscorers mart.
+
+        Only players whose total differs are moved; players missing from the
+        mart are removed.
+
+        Args:
+            goalscorers (pd.DataFrame): Rows with player_name, team_id and total_goals
+
+        Returns:
+            int: Number of players whose total changed
+        """
+        rows = goalscorers.dropna(subset=["player_name", "team_id", "total_goals"])
+        totals = {
+            (str(player_name), int(team_id)): int(total_goals)
+            for player_name, team_id, total_goals in zip(
+                rows["player_name"].tolist(), rows["team_id"].tolist(), rows["total_goals"].tolist()
+            )
+        }
+        changes = {player: 0 for player in self._totals if player not in totals}
+        changes.update({player: total for player, total in totals.items() if self._totals.get(player) != total})
+        for (player_name, team_id), total_goals in changes.items():
+            self.set_total(player_name, team_id, total_goals)
+        return len(changes)
+
+    def place(self, total_goals: int) -> int:
+        """
+        Get the dense place of a goal total.
+
+        Args:
+            total_goals (int): Number of goals
+
+        Returns:
+            int: 1 for the highest total, 2 for the next distinct total, ...
+        """
+        return self._distinct_totals.bisect_left(-total_goals) + 1
+
+    def top(self, n: Optional[int] = None) -> List[GoalscorerEntry]:
+        """
+        Get the best n players.
+
+        Args:
+            n (Optional[int]): Number of players, all players if None
+
+        Returns:
+            List[GoalscorerEntry]: Players ordered by goals
+        """
+        return [self._entry(key) for key in self._order[:n]]
+
+    def for_team(self, team_id: int) -> List[GoalscorerEntry]:
+        """
+        Get the scorers of one team.
+
+        Args:
+            team_id (int): Team identifier
+
+        Returns:
+            List[GoalscorerEntry]: The team's players ordered by goals
+        """
+        return [self._entry(key) for key in self._team_order.get(team_id, [])]
+
+    def ranking(self) -> GoalscorerRanking:
+        """
+        Get an immutable copy of the current leaderboard.
+
+        The copy is reused until the next change.
+
+        Returns:
+            GoalscorerRanking: Current ranking
+        """
+        if self._ranking is None:
+            entries = tuple(self.top())
+            by_team: Dict[int, List[GoalscorerEntry]] = {}
+            for entry in entries:
+                by_team.setdefault(entry.team_id, []).append(entry)
+            self._ranking = GoalscorerRanking(
+                entries=entries,
+                by_team=MappingProxyType({team_id: tuple(team) for team_id, team in by_team.items()}),
+            )
+        return self._ranking
+
+    def _entry(self, key: RankKey) -> GoalscorerEntry:
+        negative_goals, player_name, team_id = key
+        return GoalscorerEntry(self.place(-negative_goals), player_name, team_id, -negative_goals)
+
+    def _insert(self, key: RankKey):
+        self._order.add(key)
+        self._team_order.setdefault(key[2], SortedList()).add(key)
+        if self._total_counts[key[0]] == 0:
+            self._distinct_totals.add(key[0])
+        self._total_counts[key[0]] += 1
+
+    def _remove(self, key: RankKey):
+        self._order.remove(key)
+        team_order = self._team_order[key[2]]
+        team_order.remove(key)
+        if not team_order:
+            del self._team_order[key[2]]
+        self._total_counts[key[0]] -= 1
+        if self._total_counts[key[0]] == 0:
+            del self._total_counts[key[0]]
+            self._distinct_totals.remove(key[0])
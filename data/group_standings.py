@@ -0,0 +1,153 @@
+"""
+Group Standings Engine
+
+This module derives the group tables for groups A-D directly from the
+fixtures, so standings always match the fixtures they were computed from
+and do not need a separate mart query.
+"""
+
+from typing import Dict, FrozenSet, Optional
+
+import pandas as pd
+
+from config.tournament_config import MATCH_STATUS_FINISHED
+
+STANDINGS_COLUMNS = [
+    "team_id", "team_name", "group_name", "group_position",
+    "played", "won", "drawn", "lost", "goals_for", "goals_against", "goal_difference", "points",
+]
+
+
+def compute_group_standings(group_fixtures: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute group tables from group stage fixtures with vectorized groupby operations.
+
+    Only finished matches count. Teams are ordered by points, then teams level
+    on points by the head-to-head points, goal difference and goals scored in
+    the matches between them, then by overall goal difference, goals scored
+    and finally team name. The head-to-head comparison is applied once to all
+    teams level on points; it is not repeated for a subset still tied after it.
+
+    Args:
+        group_fixtures (pd.DataFrame): Group stage fixtures of one or more groups
+
+    Returns:
+        pd.DataFrame: One row per team with STANDINGS_COLUMNS
+    """
+    counted = group_fixtures["match_status"].eq(MATCH_STATUS_FINISHED).to_numpy()
+    sides = []
+    for side, opponent in (("home", "away"), ("away", "home")):
+        goals_for = group_fixtures[f"{side}_team_goals"].astype("Float64").fillna(0).to_numpy()
+        goals_against = group_fixtures[f"{opponent}_team_goals"].astype("Float64").fillna(0).to_numpy()
+        sides.append(pd.DataFrame({
+            "team_id": group_fixtures[f"{side}_team_id"].astype("Int64").to_numpy(),
+            "team_name": group_fixtures[f"{side}_team_name"].astype(object).to_numpy(),
+            "opponent_id": group_fixtures[f"{opponent}_team_id"].astype("Int64").to_numpy(),
+            "group_name": group_fixtures["group_name"].astype(object).to_numpy(),
+            "played": counted,
+            "won": counted & (goals_for > goals_against),
+            "drawn": counted & (goals_for == goals_against),
+            "lost": counted & (goals_for < goals_against),
+            "goals_for": goals_for * counted,
+            "goals_against": goals_against * counted,
+        }))
+
+    team_matches = pd.concat(sides, ignore_index=True).dropna(subset=["team_id"])
+    team_matches["points"] = 3 * team_matches["won"] + team_matches["drawn"]
+    standings = team_matches.drop(columns="opponent_id").groupby(
+        ["group_name", "team_id", "team_name"], as_index=False
+    ).sum()
+    standings = standings.astype({column: "int64" for column in ["played", "won", "drawn", "lost", "goals_for", "goals_against"]})
+    standings["goal_difference"] = standings["goals_for"] - standings["goals_against"]
+    standings["points"] = 3 * standings["won"] + standings["drawn"]
+
+    # Matches between teams level on points; group matches never cross groups
+    points = standings.set_index("team_id")["points"]
+    level = team_matches["team_id"].map(points).eq(team_matches["opponent_id"].map(points)).fillna(False)
+    head_to_head = team_matches[level.to_numpy(dtype=bool)].groupby("team_id")[["points", "goals_for", "goals_against"]].sum()
+    standings["h2h_points"] = standings["team_id"].map(head_to_head["points"]).fillna(0)
+    standings["h2h_goals_for"] = standings["team_id"].map(head_to_head["goals_for"]).fillna(0)
+    standings["h2h_goal_difference"] = (
+        standings["h2h_goals_for"] - standings["team_id"].map(head_to_head["goals_against"]).fillna(0)
+    )
+
+    standings = standings.sort_values(
+        ["group_name", "points", "h2h_points", "h2h_goal_difference", "h2h_goals_for",
+         "goal_difference", "goals_for", "team_name"],
+        ascending=[True, False, False, False, False, False, False, True],
+        ignore_index=True,
+    )
+    standings["group_position"] = standings.groupby("group_name").cumcount() + 1
+    return standings[STANDINGS_COLUMNS]
+
+
+class GroupStandingsEngine:
+    """
+    Keeps group tables up to date from fixtures.
+
+    Tables are cached per group; when the changed match ids are known only the
+    groups containing those matches are recomputed.
+    """
+
+    def __init__(self):
+        """Initialize the engine with no cached tables."""
+        self._tables: Dict[str, pd.DataFrame] = {}
+
+    def reset(self):
+        """Drop the cached tables, so the next update recomputes every group."""
+        self._tables = {}
+
+    def update(self, fixtures_df: pd.DataFrame, changed_match_ids: Optional[FrozenSet[int]] = None) -> pd.DataFrame:
+        """
+        Recompute the standings of groups affected by changed fixtures.
+
+        Args:
+            fixtures_df (pd.DataFrame): All fixtures
+            changed_match_ids (Optional[FrozenSet[int]]): Fixtures known to have changed,
+                every group is recomputed when None
+
+        Returns:
+            pd.DataFrame: Standings of all groups
+        """
+        group_fixtures = fixtures_df[fixtures_df["round_name"] == "group_stage"]
+        if changed_match_ids is None or not self._tables:
+            groups = set(group_fixtures["group_name"].tolist())
+        else:
+            groups = set(group_fixtures.loc[group_fixtures["match_id"].isin(changed_match_ids), "group_name"].tolist())
+
+        if groups:
+            updated = compute_group_standings(group_fixtures[group_fixtures["group_name"].isin(groups)])
+            for group_name in groups:
+                self._tables[group_name] = updated[updated["group_name"] == group_name]
+
+        return self.standings
+
+    @property
+    def standings(self) -> pd.DataFrame:
+        """
+        Current standings of all groups.
+
+        Returns:
+            pd.DataFrame: One row per team, ordered by group and position
+        """
+        if not self._tables:
+            return pd.DataFrame(columns=STANDINGS_COLUMNS)
+        return pd.concat([self._tables[group_name] for group_name in sorted(self._tables)], ignore_index=True)
+
+
+def find_standings_mismatches(computed: pd.DataFrame, mart: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compare locally computed group positions against the standings mart.
+
+    Args:
+        computed (pd.DataFrame): Standings from GroupStandingsEngine
+        mart (pd.DataFrame): Standings from the group standings mart
+
+    Returns:
+        pd.DataFrame: Teams whose group position differs, empty if both agree
+    """
+    merged = computed[["team_id", "group_name", "group_position"]].merge(
+        mart[["team_id", "group_position"]].astype({"team_id": "Int64", "group_position": "Int64"}),
+        on="team_id", how="outer", suffixes=("", "_mart"),
+    )
+    return merged[merged["group_position"].ne(merged["group_position_mart"]).fillna(True)]
@@ -0,0 +1,200 @@
+"""
+Match Schedule
+
+This module provides the MatchSchedule class, a time-ordered index over one
+snapshot's matches. Matches are sorted by kickoff once per snapshot and all
+time based lookups (live match per pitch, next kickoffs, matches of a day)
+are bisect searches on the sorted kickoffs.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from config.tournament_config import MATCH_STATUS_FINISHED, MATCH_STATUS_LIVE, TOURNAMENT_TIMEZONE
+
+VENUE_TIMEZONE = ZoneInfo(TOURNAMENT_TIMEZONE)
+
+
+def venue_now() -> datetime:
+    """
+    Get the current time at the venue.
+
+    Returns:
+        datetime: Naive venue-local time, comparable with the kickoff times
+    """
+    return datetime.now(VENUE_TIMEZONE).replace(tzinfo=None)
+
+
+def format_match_day_title(day: date) -> str:
+    """
+    Format a match day as shown above the schedule tables.
+
+    Args:
+        day (date): Match day
+
+    Returns:
+        str: Title such as "Thursday, 15th August 2024"
+    """
+    suffix = "th" if 11 <= day.day <= 13 else {1: "st", 2: "nd", 3: "rd"}.get(day.day % 10, "th")
+    return f"{day:%A}, {day.day}{suffix} {day:%B %Y}"
+
+
+def parse_match_time(match_time) -> Optional[time]:
+    """
+    Normalise a fixture's match_time to a time of day.
+
+    Args:
+        match_time: time, datetime or "HH:MM[:SS]" string as read from the mart
+
+    Returns:
+        Optional[time]: Kickoff time, None if the match has no (valid) time
+    """
+    if isinstance(match_time, datetime):
+        return match_time.time()
+    if isinstance(match_time, time):
+        return match_time
+    if isinstance(match_time, str):
+        try:
+            return time.fromisoformat(match_time.strip())
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass(frozen=True)
+class MatchSchedule:
+    """
+    Matches ordered by kickoff, with bisect lookups by time.
+
+    The kickoff tuples run parallel to the match tuples they index. Matches
+    without a kickoff time are listed at the end of their day but never
+    count as live or upcoming.
+    """
+    days: Tuple[date, ...]
+    day_starts: Tuple[datetime, ...]
+    day_matches: Tuple
+    kickoffs: Tuple[datetime, ...]
+    matches: Tuple
+    pitch_kickoffs: Mapping[object, Tuple[datetime, ...]]
+    pitch_matches: Mapping[object, Tuple]
+    match_duration: timedelta
+
+    @classmethod
+    def build(cls, matches: Iterable, match_duration: timedelta) -> "MatchSchedule":
+        """
+        Sort matches by kickoff and build the per-pitch lists.
+
+        Args:
+            matches (Iterable): MatchData records with match_date and kickoff
+            match_duration (timedelta): Playing time of a match including breaks
+
+        Returns:
+            MatchSchedule: Schedule over the given matches
+        """
+        dated = sorted(
+            (
+                (match.kickoff or datetime.combine(match.match_date, time.max), match.match_number or 0, match)
+                for match in matches if match.match_date is not None
+            ),
+            key=lambda entry: entry[:2],
+        )
+        timed = [(start, match) for start, _, match in dated if match.kickoff is not None]
+
+        pitches = {}
+        for start, match in timed:
+            if match.match_pitch is not None:
+                pitches.setdefault(match.match_pitch, []).append((start, match))
+
+        return cls(
+            days=tuple(sorted({match.match_date for _, _, match in dated})),
+            day_starts=tuple(start for start, _, _ in dated),
+            day_matches=tuple(match for _, _, match in dated),
+            kickoffs=tuple(start for start, _ in timed),
+            matches=tuple(match for _, match in timed),
+            pitch_kickoffs=MappingProxyType({
+                pitch: tuple(start for start, _ in entries) for pitch, entries in pitches.items()
+            }),
+            pitch_matches=MappingProxyType({
+                pitch: tuple(match for _, match in entries) for pitch, entries in pitches.items()
+            }),
+            match_duration=match_duration,
+        )
+
+    def matches_on(self, day: date) -> Tuple:
+        """
+        Get the matches of one day in kickoff order.
+
+        Args:
+            day (date): Match day
+
+        Returns:
+            Tuple: Matches played on the day
+        """
+        start = bisect_left(self.day_starts, datetime.combine(day, time.min))
+        end = bisect_left(self.day_starts, datetime.combine(day + timedelta(days=1), time.min))
+        return self.day_matches[start:end]
+
+    def live_on_pitch(self, pitch, now: datetime):
+        """
+        Get the match being played on a pitch.
+
+        The latest match that kicked off on the pitch is live if the mart
+        reports it live, or if it is not finished and still within its
+        playing time.
+
+        Args:
+            pitch: Pitch identifier
+            now (datetime): Current time
+
+        Returns:
+            Optional[MatchData]: Live match, None if the pitch is idle
+        """
+        kickoffs = self.pitch_kickoffs.get(pitch, ())
+        position = bisect_right(kickoffs, now) - 1
+        if position < 0:
+            return None
+        match = self.pitch_matches[pitch][position]
+        if match.match_status == MATCH_STATUS_LIVE:
+            return match
+        if match.match_status != MATCH_STATUS_FINISHED and now < kickoffs[position] + self.match_duration:
+            return match
+        return None
+
+    def live_matches(self, now: datetime) -> Mapping:
+        """
+        Get the live match of every pitch.
+
+        Args:
+            now (datetime): Current time
+
+        Returns:
+            Mapping: Live matches keyed by pitch, idle pitches are left out
+        """
+        live = {}
+        for pitch in sorted(self.pitch_kickoffs, key=str):
+            match = self.live_on_pitch(pitch, now)
+            if match is not None:
+                live[pitch] = match
+        return live
+
+    def next_kickoffs(self, now: datetime, count: int) -> List:
+        """
+        Get the next matches to kick off.
+
+        Args:
+            now (datetime): Current time
+            count (int): Maximum number of matches
+
+        Returns:
+            List: Upcoming matches in kickoff order
+        """
+        upcoming = (
+            match for match in islice(self.matches, bisect_right(self.kickoffs, now), None)
+            if match.match_status not in (MATCH_STATUS_LIVE, MATCH_STATUS_FINISHED)
+        )
+        return list(islice(upcoming, count))
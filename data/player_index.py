@@ -0,0 +1,152 @@
+"""
+Player Index
+
+This module provides the PlayerIndex class, an in-memory lookup of squad
+players keyed by normalized team and player name. Names that do not match
+exactly (accents, spelling, nicknames in the goalscorer mart) are matched
+fuzzily once and remembered, so rendering only does dictionary lookups.
+"""
+
+import difflib
+import hashlib
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+# Minimum difflib similarity for a fuzzy name match
+PLAYER_MATCH_CUTOFF = 0.85
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerInfo:
+    """Squad details of a player."""
+    player_name: str
+    team_name: str
+    shirt_number: Optional[int] = None
+    position: Optional[str] = None
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a team or player name for matching.
+
+    Accents and punctuation are removed, case and whitespace are folded
+    ("Brøndby IF" and "brondby  if" both become "brondby if").
+
+    Args:
+        name (str): Name as written in a squad workbook or mart
+
+    Returns:
+        str: Normalized name
+    """
+    decomposed = unicodedata.normalize("NFKD", str(name).replace("ø", "o").replace("Ø", "O"))
+    ascii_name = "".join(character for character in decomposed if not unicodedata.combining(character))
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", " ", ascii_name.casefold())).strip()
+
+
+def _sorted_tokens(normalized_name: str) -> str:
+    return " ".join(sorted(normalized_name.split()))
+
+
+class PlayerIndex:
+    """
+    Squad players indexed by (normalized team name, normalized player name).
+
+    Exact matches, and names whose words are in a different order ("Last
+    First"), are a single dictionary lookup prepared at load time. Other
+    misses fall back to a difflib match against the same team's squad, and
+    the result (including "no match") is cached, so each name is only ever
+    matched once.
+
+    Fuzzy matches cannot be computed when the squads are loaded, because the
+    goalscorer mart's spellings are not known yet. They are computed the
+    first time a snapshot containing the name is built. That happens on the
+    refresher thread, so no request ever waits for difflib.
+    """
+
+    def __init__(self, players: Iterable[PlayerInfo], cutoff: float = PLAYER_MATCH_CUTOFF):
+        """
+        Initialize the index.
+
+        Args:
+            players (Iterable[PlayerInfo]): Squad players of all teams
+            cutoff (float): Minimum difflib similarity for a fuzzy match
+        """
+        self.cutoff = cutoff
+        self._players: Dict[Tuple[str, str], PlayerInfo] = {}
+        self._players_by_tokens: Dict[Tuple[str, str], PlayerInfo] = {}
+        self._team_player_names: Dict[str, List[str]] = {}
+        for player in players:
+            key = (normalize_name(player.team_name), normalize_name(player.player_name))
+            self._players.setdefault(key, player)
+            self._players_by_tokens.setdefault((key[0], _sorted_tokens(key[1])), player)
+            self._team_player_names.setdefault(key[0], []).append(key[1])
+        self._fuzzy_matches: Dict[Tuple[str, str], Optional[PlayerInfo]] = {}
+
+    @classmethod
+    def from_squads(cls, squads: pd.DataFrame, cutoff: float = PLAYER_MATCH_CUTOFF) -> "PlayerIndex":
+        """
+        Build the index from the squad store.
+
+        Args:
+            squads (pd.DataFrame): Squads with team_name, player_name, shirt_number and position
+            cutoff (float): Minimum difflib similarity for a fuzzy match
+
+        Returns:
+            PlayerIndex: Index over all squad players
+        """
+        squads = squads.astype(object).where(squads.notna(), None)
+        return cls(
+            (
+                PlayerInfo(player_name, team_name, shirt_number, position)
+                for team_name, player_name, shirt_number, position in zip(
+                    squads["team_name"].tolist(),
+                    squads["player_name"].tolist(),
+                    squads["shirt_number"].tolist(),
+                    squads["position"].tolist(),
+                )
+                if team_name is not None and player_name is not None
+            ),
+            cutoff=cutoff,
+        )
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def fingerprint(self) -> str:
+        """
+        Get a hash of the indexed players.
+
+        Returns:
+            str: Hex digest, equal for indexes over the same squads
+        """
+        digest = hashlib.sha1()
+        for player in sorted(self._players.values(), key=repr):
+            digest.update(repr(player).encode())
+        return digest.hexdigest()
+
+    def lookup(self, team_name: str, player_name: str) -> Optional[PlayerInfo]:
+        """
+        Find a player's squad details.
+
+        Args:
+            team_name (str): Team of the player
+            player_name (str): Player name as written in the mart
+
+        Returns:
+            Optional[PlayerInfo]: Squad details, None if the player is not in the team's squad
+        """
+        key = (normalize_name(team_name), normalize_name(player_name))
+        player = self._players.get(key) or self._players_by_tokens.get((key[0], _sorted_tokens(key[1])))
+        if player is not None:
+            return player
+        if key in self._fuzzy_matches:
+            return self._fuzzy_matches[key]
+
+        candidates = difflib.get_close_matches(key[1], self._team_player_names.get(key[0], []), n=1, cutoff=self.cutoff)
+        player = self._players[(key[0], candidates[0])] if candidates else None
+        self._fuzzy_matches[key] = player
+        return player
@@ -0,0 +1,197 @@
+"""
+Snapshot Diff
+
+This module compares two tournament snapshots and reports which matches,
+standings rows and goalscorer rows changed between them. Components mark the
+elements showing these records as patch targets, so a new snapshot can reach
+the screens as a patch of the changed elements instead of whole views.
+"""
+
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Tuple
+
+# Component attribute holding the patch target key
+PATCH_TARGET_ATTRIBUTE = "data-patch"
+
+# MatchData fields shown in the result cell of the schedule tables
+MATCH_SCORE_FIELDS = frozenset({"match_score"})
+# MatchData fields shown in the bracket slots of the tournament tree
+MATCH_BRACKET_FIELDS = frozenset({"team1", "team2", "team1_logo", "team2_logo", "winner"})
+# MatchData fields shown in the fixture cell of the schedule tables (teams, logos, live dot)
+MATCH_FIXTURE_FIELDS = MATCH_BRACKET_FIELDS | {"match_status"}
+
+
+def target_key(*parts) -> str:
+    """
+    Build a patch target key, e.g. "score:QF1" or "standing:A:0".
+
+    Args:
+        *parts: Target kind followed by the record's key parts
+
+    Returns:
+        str: Target key
+    """
+    return ":".join(str(part) for part in parts)
+
+
+def patch_target(*parts) -> Dict[str, str]:
+    """
+    Get the attribute marking a component as a patch target.
+
+    Args:
+        *parts: Target kind followed by the record's key parts
+
+    Returns:
+        Dict[str, str]: Component keyword arguments, empty if any part is None
+    """
+    if any(part is None for part in parts):
+        return {}
+    return {PATCH_TARGET_ATTRIBUTE: target_key(*parts)}
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    """
+    Records that changed between two snapshots.
+
+    A structural diff changed something that moves or regroups elements
+    (a kickoff, a pitch, a match added or removed), so views have to be
+    rendered in full instead of patched.
+    """
+    old_fingerprint: str
+    new_fingerprint: str
+    # Changed MatchData field names, keyed by match key
+    changed_matches: Mapping[str, FrozenSet[str]]
+    # (group, row index) of changed standings rows
+    changed_standings: FrozenSet[Tuple[str, int]]
+    # Ranking positions of changed goalscorer rows
+    changed_scorers: FrozenSet[int]
+    structural: bool
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.changed_matches or self.changed_standings or self.changed_scorers or self.structural)
+
+    def target_keys(self) -> FrozenSet[str]:
+        """
+        Get the patch targets showing the changed records.
+
+        Returns:
+            FrozenSet[str]: Target keys, see patch_target
+        """
+        keys = set()
+        for match_key, changed_fields in self.changed_matches.items():
+            if changed_fields & MATCH_SCORE_FIELDS:
+                keys.add(target_key("score", match_key))
+            if changed_fields & MATCH_FIXTURE_FIELDS:
+                keys.add(target_key("fixture", match_key))
+            if changed_fields & MATCH_BRACKET_FIELDS:
+                keys.add(target_key("bracket", match_key))
+        keys.update(target_key("standing", group, row) for group, row in self.changed_standings)
+        keys.update(target_key("scorer", position) for position in self.changed_scorers)
+        return frozenset(keys)
+
+
+def _same_value(old_value, new_value) -> bool:
+    # Missing mart values are NaN, which never equals itself
+    return old_value == new_value or (old_value != old_value and new_value != new_value)
+
+
+def _changed_fields(old_record, new_record) -> FrozenSet[str]:
+    return frozenset(
+        record_field.name for record_field in fields(new_record)
+        if not _same_value(getattr(old_record, record_field.name), getattr(new_record, record_field.name))
+    )
+
+
+def _changed_rows(old_rows: Tuple, new_rows: Tuple) -> FrozenSet[int]:
+    # Rows only present on one side count as changed, views showing them fail the layout check
+    return frozenset(
+        row for row in range(max(len(old_rows), len(new_rows)))
+        if row >= len(old_rows) or row >= len(new_rows) or old_rows[row] != new_rows[row]
+    )
+
+
+def diff_snapshots(old, new) -> SnapshotDiff:
+    """
+    Compare two snapshots record by record.
+
+    Args:
+        old (TournamentSnapshot): Snapshot the screen shows
+        new (TournamentSnapshot): Current snapshot
+
+    Returns:
+        SnapshotDiff: Changed matches, standings rows and goalscorer rows
+    """
+    structural = old.matches.keys() != new.matches.keys()
+    changed_matches = {}
+    for match_key, new_match in new.matches.items():
+        old_match = old.matches.get(match_key)
+        if old_match is None or old_match == new_match:
+            continue
+        changed_fields = _changed_fields(old_match, new_match)
+        if not changed_fields:
+            continue
+        changed_matches[match_key] = changed_fields
+        if changed_fields - MATCH_SCORE_FIELDS - MATCH_FIXTURE_FIELDS:
+            structural = True
+
+    changed_standings = frozenset(
+        (group, row)
+        for group in old.index.teams_by_group.keys() | new.index.teams_by_group.keys()
+        for row in _changed_rows(old.index.teams_by_group.get(group, ()), new.index.teams_by_group.get(group, ()))
+    )
+
+    def scorer_rows(snapshot) -> Tuple:
+        return tuple(
+            (entry, snapshot.player_details.get((entry.team_id, entry.player_name)))
+            for entry in snapshot.goalscorers.entries
+        )
+
+    return SnapshotDiff(
+        old_fingerprint=old.fingerprint,
+        new_fingerprint=new.fingerprint,
+        changed_matches=MappingProxyType(changed_matches),
+        changed_standings=changed_standings,
+        changed_scorers=_changed_rows(scorer_rows(old), scorer_rows(new)),
+        structural=structural,
+    )
+
+
+class SnapshotDiffCache:
+    """
+    Diffs between recent snapshot pairs, so screens showing the same old
+    snapshot share one comparison.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Diffs kept before the oldest is dropped
+        """
+        self.max_entries = max_entries
+        self._diffs: Dict[Tuple[str, str], SnapshotDiff] = {}
+
+    def get(self, old, new) -> SnapshotDiff:
+        """
+        Get the diff between two snapshots, comparing them on a miss.
+
+        Args:
+            old (TournamentSnapshot): Snapshot the screen shows
+            new (TournamentSnapshot): Current snapshot
+
+        Returns:
+            SnapshotDiff: Changes from old to new
+        """
+        key = (old.fingerprint, new.fingerprint)
+        diff = self._diffs.get(key)
+        if diff is None:
+            diff = diff_snapshots(old, new)
+            if len(self._diffs) >= self.max_entries:
+                self._diffs.pop(next(iter(self._diffs)), None)
+            self._diffs[key] = diff
+        return diff
+
@@ -5,15 +5,41 @@ This module contains the data structures and sample data for the tournament
 visualization, based on the provided tournament tree sketch.
 """
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import hashlib
+import logging
+import threading
+from collections import deque
+from datetime import date, datetime, time, timedelta
+from time import perf_counter
+from types import MappingProxyType
+from typing import Deque, Dict, List, Mapping, Optional, Tuple, Union
+from dataclasses import dataclass, field
 
 import pandas as pd
 
-from data_reader.NextGenDataReader import NextGenDataReader
+from config.app_config import (
+    DATA_BACKEND, DATA_READ_MODE, FIXTURES_DATE_COLUMN, FIXTURES_WATERMARK_COLUMN, GOALSCORERS_TOP_N, GROUP_STANDINGS_CROSS_CHECK,
+    GROUP_STANDINGS_SOURCE, LOCAL_DATA_DIR, SNAPSHOT_CACHE_DIR, SNAPSHOT_CACHE_TTL_SECONDS, SNAPSHOT_HISTORY_SIZE,
+    SQUAD_STORE_DIR
+)
+from config.tournament_config import MATCH_DURATION_MINUTES, ROUND_MATCH_DAYS, TOURNAMENT_START_DATE
+from data.bracket_resolver import BracketResolver
+from data.goalscorer_leaderboard import GoalscorerLeaderboard, GoalscorerRanking
+from data.group_standings import find_standings_mismatches, GroupStandingsEngine
+from data.match_schedule import MatchSchedule, parse_match_time
+from data.player_index import PlayerIndex, PlayerInfo
+from data.tournament_index import TournamentIndex
+from data_reader.backends import BACKEND_LOCAL, create_backend
+from data_reader.NextGenDataReader import (
+    fixture_team_name_placeholder, MART_TABLES, MartLoadResult, NextGenDataReader
+)
+from data_reader.snapshot_cache import MartSnapshotCache
+from data_reader.squad_store import SquadStore
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TeamData:
     """Represents a team in the tournament."""
     name: str
@@ -25,22 +51,29 @@ class TeamData:
     team_logo: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchData:
-    """Represents a match between two teams."""
+    """
+    Represents a match between two teams.
+
+    Records are immutable and slotted, so snapshots can share them across
+    threads without copying and without a per-instance __dict__.
+    """
     match_id: str
     team1: str
     team2: str
     winner: Optional[str] = None
     round_name: str = ""
-    position: tuple = (0, 0),
+    position: Tuple[int, int] = (0, 0)
     team1_logo: Optional[str] = None
-    team2_logo: Optional[str] = None,
-    match_number: Optional[int] = None,
-    match_pitch: Optional[int] = None,
-    match_score: Optional[str] = None,
-    match_time: Optional[str] = None,
+    team2_logo: Optional[str] = None
+    match_number: Optional[int] = None
+    match_pitch: Optional[int] = None
+    match_score: Optional[str] = None
+    match_time: Optional[Union[time, str]] = None
     match_status: Optional[str] = None
+    match_date: Optional[date] = None
+    kickoff: Optional[datetime] = None
 
 
 GROUP_COLORS = {
@@ -114,21 +147,10 @@ ROUND_NAMES_MAPPING = {
 #     "Team D2": TeamData("LOREM IPSUM", "D", "green", 2),
 #     "Team D3": TeamData("LOREM IPSUM", "D", "green", 3),
 # }
-next_gen_reader = NextGenDataReader()
-fixtures_df = next_gen_reader.read_next_gen_fixtures()
-group_standings = next_gen_reader.read_next_gen_group_standings()
-SAMPLE_TEAMS = {
-    row['team_id']: TeamData(
-        row['team_name'],
-        row['group_name'],
-        GROUP_COLORS[row['group_name']],
-        row["group_position"],
-        False,
-        False,
-        f"assets/images/team_logos/{row['team_id']}.png",
-    )
-    for ix, row in group_standings.iterrows()
-}
+
+
+ROUNDS_KEYED_BY_MATCH_ID = ['group_stage', '9th-12th_round_1', '9th-12th_round_2', '9th-12th_round_3']
+FALLBACK_LOGO = 'assets/images/fallback.png'
 
 
 def format_result(home_team_goals, away_team_goals, home_penalty_goals=None, away_penalty_goals=None):
@@ -146,76 +168,493 @@ def format_result(home_team_goals, away_team_goals, home_penalty_goals=None, awa
 
 
 def format_match_key(round_name, group_name, match_id):
-    match_key = round_name + str(group_name).replace('None', '')
-    if round_name in ['group_stage', '9th-12th_round_1', '9th-12th_round_2', '9th-12th_round_3']:
+    match_key = round_name + ('' if pd.isna(group_name) else str(group_name).replace('None', ''))
+    if round_name in ROUNDS_KEYED_BY_MATCH_ID:
         match_key += str(match_id)
     return match_key
 
 
-SAMPLE_MATCHES = {
-    ROUND_NAMES_MAPPING[
-        format_match_key(row['round_name'], row['group_name'], row['match_id'])
-    ]:
-    MatchData(
-        ROUND_NAMES_MAPPING[format_match_key(row['round_name'], row['group_name'], row['match_id'])],
-        row['home_team_name'],
-        row['away_team_name'],
-        None,
-        row["round_name"],
-        (0, 0),
-        f"assets/images/team_logos/{row['home_team_id']}.png" if pd.notna(row['home_team_id']) else 'assets/images/fallback.png',
-        f"assets/images/team_logos/{row['away_team_id']}.png" if pd.notna(row['away_team_id']) else 'assets/images/fallback.png',
-        row['match_id'],
-        row['pitch'],
-        format_result(row['home_team_goals'], row['away_team_goals'], row['home_team_penalty_goals'], row['away_team_penalty_goals']),
-        row['match_time'],
-        row['match_status'],
+def _integer_text(values: pd.Series) -> pd.Series:
+    return values.astype("Int64").astype("string")
+
+
+def format_match_key_column(fixtures_df: pd.DataFrame) -> pd.Series:
+    """
+    Vectorized format_match_key over a fixtures DataFrame.
+
+    Args:
+        fixtures_df (pd.DataFrame): Fixtures as read from the mart
+
+    Returns:
+        pd.Series: Match key per fixture, as used in ROUND_NAMES_MAPPING
+    """
+    round_names = fixtures_df['round_name'].astype("string")
+    group_names = fixtures_df['group_name'].astype("string").fillna('').str.replace('None', '', regex=False)
+    match_ids = _integer_text(fixtures_df['match_id']).where(round_names.isin(ROUNDS_KEYED_BY_MATCH_ID), '')
+    return round_names + group_names + match_ids
+
+
+def format_result_column(fixtures_df: pd.DataFrame) -> pd.Series:
+    """
+    Vectorized format_result over a fixtures DataFrame.
+
+    Args:
+        fixtures_df (pd.DataFrame): Fixtures as read from the mart
+
+    Returns:
+        pd.Series: Score text per fixture, e.g. "2:1" or "1:1 (4:3)"
+    """
+    def goals_text(column):
+        return _integer_text(fixtures_df[column]).fillna('')
+
+    result = goals_text('home_team_goals') + ':' + goals_text('away_team_goals')
+    has_penalties = fixtures_df['home_team_penalty_goals'].notna() | fixtures_df['away_team_penalty_goals'].notna()
+    penalties = ' (' + goals_text('home_team_penalty_goals') + ':' + goals_text('away_team_penalty_goals') + ')'
+    return result + penalties.where(has_penalties, '')
+
+
+def format_logo_column(team_ids: pd.Series) -> pd.Series:
+    """
+    Vectorized team logo paths, falling back for fixtures without a team yet.
+
+    Args:
+        team_ids (pd.Series): Team ids, missing for unresolved fixtures
+
+    Returns:
+        pd.Series: Logo path per team id
+    """
+    return ('assets/images/team_logos/' + _integer_text(team_ids) + '.png').fillna(FALLBACK_LOGO)
+
+
+def format_match_date_column(fixtures_df: pd.DataFrame) -> pd.Series:
+    """
+    Get the match date of every fixture.
+
+    Dates are read from FIXTURES_DATE_COLUMN when the fixtures carry it. As a
+    fallback they are derived from TOURNAMENT_START_DATE and the round's match
+    day, and are unknown when no start date is configured (e.g. for a cached
+    snapshot from before the date column was read).
+
+    Args:
+        fixtures_df (pd.DataFrame): Fixtures as read from the mart
+
+    Returns:
+        pd.Series: Match dates as date objects, None where unknown
+    """
+    if FIXTURES_DATE_COLUMN is not None and FIXTURES_DATE_COLUMN in fixtures_df.columns:
+        dates = pd.to_datetime(fixtures_df[FIXTURES_DATE_COLUMN].astype(object), errors="coerce")
+    elif TOURNAMENT_START_DATE is None:
+        return pd.Series(None, index=fixtures_df.index, dtype=object)
+    else:
+        day_offsets = fixtures_df["round_name"].map(ROUND_MATCH_DAYS).astype("Float64") - 1
+        dates = pd.Timestamp(TOURNAMENT_START_DATE) + pd.to_timedelta(day_offsets.astype(object), unit="D")
+    return dates.dt.date.astype(object).where(dates.notna(), None)
+
+
+def build_teams(group_standings: pd.DataFrame) -> Dict[str, TeamData]:
+    """
+    Build the team lookup from the group standings mart.
+
+    Args:
+        group_standings (pd.DataFrame): Group standings, computed from fixtures or read from the mart
+
+    Returns:
+        Dict[str, TeamData]: Teams keyed by team id
+    """
+    return {
+        team_id: TeamData(team_name, group_name, GROUP_COLORS[group_name], group_position, False, False, team_logo)
+        for team_id, team_name, group_name, group_position, team_logo in zip(
+            group_standings['team_id'].tolist(),
+            group_standings['team_name'].tolist(),
+            group_standings['group_name'].tolist(),
+            group_standings['group_position'].tolist(),
+            format_logo_column(group_standings['team_id']).tolist(),
+        )
+    }
+
+
+def _kickoff(match_date: Optional[date], match_time) -> Optional[datetime]:
+    kickoff_time = parse_match_time(match_time)
+    if match_date is None or kickoff_time is None:
+        return None
+    return datetime.combine(match_date, kickoff_time)
+
+
+def build_matches(fixtures_df: pd.DataFrame) -> Dict[str, MatchData]:
+    """
+    Build the match lookup from the fixtures mart.
+
+    Keys, scores and logos are formatted column-wise, then the records are
+    created in a single pass over plain Python lists.
+
+    Args:
+        fixtures_df (pd.DataFrame): Fixtures as read from the mart
+
+    Returns:
+        Dict[str, MatchData]: Matches keyed by display match id (e.g. "QF1")
+    """
+    match_keys = format_match_key_column(fixtures_df).map(ROUND_NAMES_MAPPING)
+    if match_keys.isna().any():
+        unknown = format_match_key_column(fixtures_df)[match_keys.isna()].tolist()
+        raise KeyError(f"Fixtures with unknown round keys: {unknown}")
+
+    return {
+        match_key: MatchData(
+            match_key, team1, team2, None, round_name, (0, 0), team1_logo, team2_logo,
+            match_number, match_pitch, match_score, match_time, match_status, match_date,
+            _kickoff(match_date, match_time),
+        )
+        for match_key, team1, team2, round_name, team1_logo, team2_logo,
+            match_number, match_pitch, match_score, match_time, match_status, match_date in zip(
+            match_keys.tolist(),
+            fixtures_df['home_team_name'].tolist(),
+            fixtures_df['away_team_name'].tolist(),
+            fixtures_df['round_name'].tolist(),
+            format_logo_column(fixtures_df['home_team_id']).tolist(),
+            format_logo_column(fixtures_df['away_team_id']).tolist(),
+            fixtures_df['match_id'].tolist(),
+            fixtures_df['pitch'].tolist(),
+            format_result_column(fixtures_df).tolist(),
+            fixtures_df['match_time'].tolist(),
+            fixtures_df['match_status'].tolist(),
+            format_match_date_column(fixtures_df).tolist(),
+        )
+    }
+
+
+def compute_fingerprint(*frames: pd.DataFrame) -> str:
+    """
+    Compute a content hash over the mart DataFrames.
+
+    Two snapshots built from identical mart contents share a fingerprint, which
+    lets the refresher skip publishing when nothing changed.
+
+    Args:
+        *frames (pd.DataFrame): Mart DataFrames making up a snapshot
+
+    Returns:
+        str: Hex digest identifying the data
+    """
+    digest = hashlib.sha1()
+    for frame in frames:
+        digest.update(",".join(map(str, frame.columns)).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class TournamentSnapshot:
+    """
+    Immutable, versioned view of the complete tournament state.
+
+    A snapshot is built entirely off the request path and then published in a
+    single reference swap, so readers always see one consistent version.
+    """
+    version: int
+    fingerprint: str
+    teams: Mapping[str, TeamData]
+    matches: Mapping[str, MatchData]
+    index: TournamentIndex
+    schedule: MatchSchedule
+    goalscorers: GoalscorerRanking
+    # Squad details of the ranked goalscorers, keyed by (team_id, player_name)
+    player_details: Mapping[Tuple[int, str], PlayerInfo]
+    fetched_at: datetime
+    build_seconds: float = 0.0
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+def build_player_details(ranking: GoalscorerRanking,
+                         teams: Mapping[int, TeamData],
+                         player_index: Optional[PlayerIndex]) -> Dict[Tuple[int, str], PlayerInfo]:
+    """
+    Look up the squad details of every ranked goalscorer.
+
+    Running the lookups while building the snapshot keeps fuzzy name matching
+    off the render path; views only read the resulting dictionary.
+
+    Args:
+        ranking (GoalscorerRanking): Goalscorers to look up
+        teams (Mapping[int, TeamData]): Teams keyed by team id, used to find the team name
+        player_index (Optional[PlayerIndex]): Squad players, no details are looked up when None
+
+    Returns:
+        Dict[Tuple[int, str], PlayerInfo]: Details keyed by (team_id, player_name), players
+            missing from their squad are left out
+    """
+    if player_index is None:
+        return {}
+    details = {}
+    for entry in ranking.entries:
+        team = teams.get(entry.team_id)
+        player = player_index.lookup(team.name, entry.player_name) if team is not None else None
+        if player is not None:
+            details[(entry.team_id, entry.player_name)] = player
+    return details
+
+
+def resolve_group_standings(marts: MartLoadResult,
+                            standings_engine: Optional[GroupStandingsEngine] = None) -> pd.DataFrame:
+    """
+    Get the group standings a snapshot is built from.
+
+    When an engine is given the standings are computed from the fixtures and,
+    if the standings mart was loaded as well, compared against it.
+
+    Args:
+        marts (MartLoadResult): Mart DataFrames, from BigQuery or the snapshot cache
+        standings_engine (Optional[GroupStandingsEngine]): Computes standings from fixtures,
+            the standings mart is used when None
+
+    Returns:
+        pd.DataFrame: Group standings with group_position
+    """
+    if standings_engine is None:
+        return marts.group_standings
+
+    group_standings = standings_engine.update(marts.fixtures, marts.changed_match_ids)
+    if marts.group_standings is not None:
+        mismatches = find_standings_mismatches(group_standings, marts.group_standings)
+        if not mismatches.empty:
+            logger.warning("Computed group standings differ from the mart for team ids %s",
+                           mismatches["team_id"].tolist())
+    return group_standings
+
+
+def build_tournament_snapshot(marts: MartLoadResult,
+                              version: int,
+                              resolver: Optional[BracketResolver] = None,
+                              standings_engine: Optional[GroupStandingsEngine] = None,
+                              leaderboard: Optional[GoalscorerLeaderboard] = None,
+                              player_index: Optional[PlayerIndex] = None) -> TournamentSnapshot:
+    """
+    Build a new tournament snapshot from loaded marts.
+
+    Args:
+        marts (MartLoadResult): Mart DataFrames, from BigQuery or the snapshot cache
+        version (int): Version number assigned to the snapshot
+        resolver (Optional[BracketResolver]): Fills knockout slots the mart has not resolved yet
+        standings_engine (Optional[GroupStandingsEngine]): Computes standings from fixtures,
+            the standings mart is used when None
+        leaderboard (Optional[GoalscorerLeaderboard]): Leaderboard updated with the goalscorer totals,
+            a new one is filled when None
+        player_index (Optional[PlayerIndex]): Squad players used to add details to the goalscorers
+
+    Returns:
+        TournamentSnapshot: Freshly built snapshot
+    """
+    start = perf_counter()
+    group_standings = resolve_group_standings(marts, standings_engine)
+    fixtures = marts.fixtures
+    if resolver is not None:
+        resolver.update(marts.fixtures, group_standings, marts.changed_match_ids)
+        fixtures = resolver.apply(marts.fixtures)
+    teams = build_teams(group_standings)
+    matches = build_matches(fixtures)
+    index = TournamentIndex.build(teams, matches)
+    schedule = MatchSchedule.build(matches.values(), timedelta(minutes=MATCH_DURATION_MINUTES))
+    leaderboard = leaderboard if leaderboard is not None else GoalscorerLeaderboard()
+    leaderboard.sync_totals(marts.goalscorers)
+    goalscorers = leaderboard.ranking()
+    player_details = build_player_details(goalscorers, teams, player_index)
+    build_seconds = perf_counter() - start
+    logger.debug("Built %s teams and %s matches in %.1f ms", len(teams), len(matches), build_seconds * 1000)
+
+    return TournamentSnapshot(
+        version=version,
+        fingerprint=compute_fingerprint(marts.fixtures, group_standings, marts.goalscorers),
+        teams=MappingProxyType(teams),
+        matches=MappingProxyType(matches),
+        index=index,
+        schedule=schedule,
+        goalscorers=goalscorers,
+        player_details=MappingProxyType(player_details),
+        fetched_at=marts.fetched_at,
+        build_seconds=build_seconds,
     )
-    for _, row in fixtures_df.iterrows()
-}
 
-GOALSCORERS = next_gen_reader.read_top_goalscorers()
+
+def load_initial_snapshot(reader: NextGenDataReader,
+                          cache: MartSnapshotCache,
+                          resolver: Optional[BracketResolver] = None,
+                          standings_engine: Optional[GroupStandingsEngine] = None,
+                          leaderboard: Optional[GoalscorerLeaderboard] = None,
+                          player_index: Optional[PlayerIndex] = None) -> TournamentSnapshot:
+    """
+    Build the first snapshot of the process.
+
+    The most recent cached snapshot is used when one exists, whatever its age,
+    so workers start without querying BigQuery and still come up when it is
+    unreachable. The refresher revalidates stale data in the background.
+
+    Args:
+        reader (NextGenDataReader): Reader used when no cached snapshot exists
+        cache (MartSnapshotCache): Local snapshot cache
+        resolver (Optional[BracketResolver]): Fills knockout slots the mart has not resolved yet
+        standings_engine (Optional[GroupStandingsEngine]): Computes standings from fixtures,
+            the standings mart is used when None
+        leaderboard (Optional[GoalscorerLeaderboard]): Leaderboard updated with the goalscorer totals
+        player_index (Optional[PlayerIndex]): Squad players used to add details to the goalscorers
+
+    Returns:
+        TournamentSnapshot: Snapshot to publish at startup
+    """
+    marts = cache.load()
+    if marts is not None:
+        return build_tournament_snapshot(marts, version=1, resolver=resolver, standings_engine=standings_engine,
+                                         leaderboard=leaderboard, player_index=player_index)
+    marts = reader.read_all_marts()
+    snapshot = build_tournament_snapshot(marts, version=1, resolver=resolver, standings_engine=standings_engine,
+                                         leaderboard=leaderboard, player_index=player_index)
+    reader.commit_load()
+    cache.save(marts)
+    return snapshot
+
+
+_snapshot_lock = threading.Lock()
+# Signalled on every publish, for clients waiting to be pushed new data
+_snapshot_published = threading.Condition(_snapshot_lock)
+_current_snapshot: Optional[TournamentSnapshot] = None
+# Recently published snapshots, newest last, kept to diff against what screens still show
+_recent_snapshots: Deque[TournamentSnapshot] = deque(maxlen=SNAPSHOT_HISTORY_SIZE)
+
+
+def publish_snapshot(snapshot: TournamentSnapshot) -> bool:
+    """
+    Atomically replace the current snapshot.
+
+    Args:
+        snapshot (TournamentSnapshot): Snapshot to publish
+
+    Returns:
+        bool: False if the snapshot was not newer than the current one
+    """
+    global _current_snapshot
+    with _snapshot_published:
+        if _current_snapshot is not None and snapshot.version <= _current_snapshot.version:
+            return False
+        _current_snapshot = snapshot
+        _recent_snapshots.append(snapshot)
+        _snapshot_published.notify_all()
+        return True
+
+
+def get_current_snapshot() -> TournamentSnapshot:
+    """
+    Get the most recently published snapshot.
+
+    Callers should fetch the snapshot once per render and read everything
+    from it, so a concurrent refresh cannot mix two versions in one view.
+
+    Returns:
+        TournamentSnapshot: Current tournament snapshot
+    """
+    return _current_snapshot
 
 
-def get_tournament_structure() -> Dict:
+def wait_for_snapshot(version: int, timeout: Optional[float] = None) -> TournamentSnapshot:
+    """
+    Block until a snapshot newer than a version is published.
+
+    Args:
+        version (int): Version the caller already has
+        timeout (Optional[float]): Seconds to wait at most, forever if None
+
+    Returns:
+        TournamentSnapshot: Current snapshot, still the old version if the timeout passed
+    """
+    with _snapshot_published:
+        _snapshot_published.wait_for(lambda: _current_snapshot.version > version, timeout)
+        return _current_snapshot
+
+
+def get_recent_snapshot(fingerprint: str) -> Optional[TournamentSnapshot]:
+    """
+    Find a recently published snapshot by fingerprint.
+
+    Args:
+        fingerprint (str): Fingerprint of the snapshot
+
+    Returns:
+        Optional[TournamentSnapshot]: Newest matching snapshot, None if it is no longer kept
+    """
+    for snapshot in reversed(list(_recent_snapshots)):
+        if snapshot.fingerprint == fingerprint:
+            return snapshot
+    return None
+
+
+if FIXTURES_DATE_COLUMN is None and TOURNAMENT_START_DATE is None:
+    raise ValueError("Match dates need FIXTURES_DATE_COLUMN, or TOURNAMENT_START_DATE for the fallback")
+if DATA_BACKEND == BACKEND_LOCAL:
+    data_backend = create_backend(DATA_BACKEND, directory=LOCAL_DATA_DIR)
+else:
+    data_backend = create_backend(DATA_BACKEND, read_mode=DATA_READ_MODE)
+compute_group_standings = GROUP_STANDINGS_SOURCE == "fixtures"
+next_gen_reader = NextGenDataReader(
+    data_backend,
+    goalscorers_limit=GOALSCORERS_TOP_N,
+    fixtures_watermark_column=FIXTURES_WATERMARK_COLUMN,
+    fixtures_date_column=FIXTURES_DATE_COLUMN,
+    marts=[
+        name for name in MART_TABLES
+        if name != "group_standings" or not compute_group_standings or GROUP_STANDINGS_CROSS_CHECK
+    ],
+)
+snapshot_cache = MartSnapshotCache(SNAPSHOT_CACHE_DIR, SNAPSHOT_CACHE_TTL_SECONDS)
+bracket_resolver = BracketResolver(fixture_team_name_placeholder)
+standings_engine = GroupStandingsEngine() if compute_group_standings else None
+goalscorer_leaderboard = GoalscorerLeaderboard()
+player_index = PlayerIndex.from_squads(SquadStore(SQUAD_STORE_DIR).load())
+publish_snapshot(load_initial_snapshot(
+    next_gen_reader, snapshot_cache, bracket_resolver, standings_engine, goalscorer_leaderboard, player_index
+))
+
+
+def get_tournament_structure(snapshot: Optional[TournamentSnapshot] = None) -> Dict:
     """
     Returns the complete tournament structure with teams and matches.
     
+    Args:
+        snapshot (Optional[TournamentSnapshot]): Snapshot to read, defaults to the current one
+
     Returns:
         Dict: Complete tournament data structure
     """
+    snapshot = snapshot or get_current_snapshot()
     return {
-        "teams": SAMPLE_TEAMS,
-        "matches": SAMPLE_MATCHES,
+        "teams": snapshot.teams,
+        "matches": snapshot.matches,
         "groups": ["9-12", "A", "B", "C", "D"],
         "rounds": ["Quarter Finals", "Semi Finals", "Final", "Placement"]
     }
 
 
-def get_teams_by_group(group: str) -> List[TeamData]:
+def get_teams_by_group(group: str, snapshot: Optional[TournamentSnapshot] = None) -> List[TeamData]:
     """
     Get all teams in a specific group.
     
     Args:
         group (str): Group identifier
+        snapshot (Optional[TournamentSnapshot]): Snapshot to read, defaults to the current one
         
     Returns:
         List[TeamData]: List of teams in the group
     """
-    return [team for team in SAMPLE_TEAMS.values() if team.group == group]
+    snapshot = snapshot or get_current_snapshot()
+    return list(snapshot.index.teams_by_group.get(group, ()))
 
 
-def get_matches_by_round(round_name: str) -> List[MatchData]:
+def get_matches_by_round(round_name: str, snapshot: Optional[TournamentSnapshot] = None) -> List[MatchData]:
     """
     Get all matches in a specific round.
     
     Args:
         round_name (str): Round name
+        snapshot (Optional[TournamentSnapshot]): Snapshot to read, defaults to the current one
         
     Returns:
         List[MatchData]: List of matches in the round
     """
-    return [match for match in SAMPLE_MATCHES.values() if match.round_name == round_name]
-
-
-print('')
+    snapshot = snapshot or get_current_snapshot()
+    return list(snapshot.index.matches_by_round.get(round_name, ()))
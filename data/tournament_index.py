@@ -0,0 +1,52 @@
+"""
+Tournament Index
+
+This module provides the TournamentIndex class, a set of lookup tables built
+once per tournament snapshot so views query matches and teams by key instead
+of scanning the whole tournament on every render.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Hashable, Iterable, Mapping, Tuple, TypeVar
+
+Record = TypeVar("Record")
+
+
+def _group_by(records: Iterable[Record], key_function: Callable[[Record], Hashable]) -> Mapping[Hashable, Tuple[Record, ...]]:
+    groups = defaultdict(list)
+    for record in records:
+        key = key_function(record)
+        if key is not None and key != "":
+            groups[key].append(record)
+    return MappingProxyType({key: tuple(values) for key, values in groups.items()})
+
+
+@dataclass(frozen=True)
+class TournamentIndex:
+    """
+    Read-only lookup tables over one snapshot's teams and matches.
+
+    Every table maps a key to a tuple of records in match (or standings) order.
+    Missing keys mean no records, so callers use .get(key, ()).
+    """
+    teams_by_group: Mapping[str, Tuple]
+    matches_by_round: Mapping[str, Tuple]
+
+    @classmethod
+    def build(cls, teams: Mapping, matches: Mapping) -> "TournamentIndex":
+        """
+        Build all lookup tables in one pass per table.
+
+        Args:
+            teams (Mapping): Teams keyed by team id
+            matches (Mapping): Matches keyed by display match id
+
+        Returns:
+            TournamentIndex: Index over the given records
+        """
+        return cls(
+            teams_by_group=_group_by(teams.values(), lambda team: team.group),
+            matches_by_round=_group_by(matches.values(), lambda match: match.round_name),
+        )
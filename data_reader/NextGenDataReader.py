@@ -1,6 +1,15 @@
-from google.cloud import bigquery
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from datetime import date, datetime
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
 
-from utils import get_gcp_credentials
+import pandas as pd
+
+from data_reader.backends import BigQueryBackend, DataBackend, Filter, TableMetadata, export_marts
 
 fixture_team_name_placeholder = {
     1: {"home": "", "away": ""},
@@ -45,36 +54,321 @@ fixture_team_name_placeholder = {
     30: {"home": "Winner Match 19", "away": "Winner Match 20"},
 }
 
+# Placeholder names as a table, merged onto fixtures in one vectorized pass
+FIXTURE_TEAM_NAME_PLACEHOLDERS = (
+    pd.DataFrame.from_dict(fixture_team_name_placeholder, orient="index")
+    .rename(columns={"home": "home_team_placeholder", "away": "away_team_placeholder"})
+    .rename_axis("match_id")
+    .reset_index()
+)
+
+
+FIXTURES_TABLE = "mrt_next_gen_all_fixtures"
+GROUP_STANDINGS_TABLE = "mrt_next_gen_group_standings"
+GOALSCORERS_TABLE = "mrt_next_gen_top_goalscorers"
+
+# Columns the app actually reads from each mart
+FIXTURES_COLUMNS = [
+    "match_id", "round_name", "group_name", "pitch", "match_time", "match_status",
+    "home_team_id", "home_team_name", "home_team_goals", "home_team_penalty_goals",
+    "away_team_id", "away_team_name", "away_team_goals", "away_team_penalty_goals",
+]
+GROUP_STANDINGS_COLUMNS = ["team_id", "team_name", "group_name", "group_position"]
+GOALSCORERS_COLUMNS = ["place", "player_name", "team_id", "total_goals"]
+
+# Columns used by the optional tournament and match day filters
+TOURNAMENT_COLUMN = "tournament_id"
+MATCH_DAY_COLUMN = "match_date"
+
+MART_TABLES = {
+    "fixtures": FIXTURES_TABLE,
+    "group_standings": GROUP_STANDINGS_TABLE,
+    "goalscorers": GOALSCORERS_TABLE,
+}
+
+logger = logging.getLogger(__name__)
+
+
+def fill_placeholder_team_names(fixtures_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fill missing team names of unresolved fixtures with their placeholder (e.g. "Winner Match 13").
+
+    Args:
+        fixtures_df (pd.DataFrame): Fixtures as read from the mart
+
+    Returns:
+        pd.DataFrame: Fixtures with home and away team names filled in
+    """
+    placeholders = FIXTURE_TEAM_NAME_PLACEHOLDERS.astype({"match_id": fixtures_df["match_id"].dtype})
+    merged = fixtures_df.merge(placeholders, on="match_id", how="left")
+    for side in ("home", "away"):
+        placeholder = merged.pop(f"{side}_team_placeholder")
+        merged[f"{side}_team_name"] = merged[f"{side}_team_name"].mask(merged[f"{side}_team_name"].isna(), placeholder)
+    return merged
+
+
+@dataclass
+class MartLoadResult:
+    """Results of a batched load of all next gen marts."""
+    fixtures: pd.DataFrame
+    # None when the reader does not query the group standings mart
+    group_standings: Optional[pd.DataFrame]
+    goalscorers: pd.DataFrame
+    latencies: Dict[str, float] = field(default_factory=dict)
+    total_seconds: float = 0.0
+    fetched_at: datetime = field(default_factory=datetime.now)
+    changed: Tuple[str, ...] = ()
+    # Fixtures whose rows changed in this load, None when fixtures were reloaded in full
+    changed_match_ids: Optional[FrozenSet[int]] = None
+
 
 class NextGenDataReader:
-    def __init__(self):
-        self.gcp_client = bigquery.Client(credentials=get_gcp_credentials())
-        self.project_id = "apds-fc-salzburg-plygnd"
-        self.dataset_id = "90_mart_sandbox"
-
-    def read_next_gen_fixtures(self):
-        fixtures_query = f"""
-        SELECT * FROM `{self.project_id}.{self.dataset_id}.mrt_next_gen_all_fixtures`
-"""
-        fixtures_df = self.gcp_client.query(fixtures_query).to_dataframe()
-
-        fixtures_df["home_team_name"] = fixtures_df["home_team_name"].mask(
-            fixtures_df["home_team_name"].isna(),
-            fixtures_df["match_id"].map(lambda x: fixture_team_name_placeholder[x]["home"])
-        )
-        fixtures_df["away_team_name"] = fixtures_df["away_team_name"].mask(
-            fixtures_df["away_team_name"].isna(),
-            fixtures_df["match_id"].map(lambda x: fixture_team_name_placeholder[x]["away"])
-        )
+    def __init__(self,
+                 backend: Optional[DataBackend] = None,
+                 tournament_id: Optional[object] = None,
+                 match_day: Optional[date] = None,
+                 goalscorers_limit: Optional[int] = None,
+                 fixtures_watermark_column: Optional[str] = None,
+                 fixtures_date_column: Optional[str] = None,
+                 marts: Optional[Sequence[str]] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            backend (Optional[DataBackend]): Source of the marts, BigQuery if None
+            tournament_id (Optional[object]): Only read rows of this tournament
+            match_day (Optional[date]): Only read fixtures played on this day
+            goalscorers_limit (Optional[int]): Only read the top N of the goalscorer leaderboard
+            fixtures_watermark_column (Optional[str]): Fixtures column holding the row update time.
+                When set, refreshes sync fixtures incrementally instead of reloading them.
+            fixtures_date_column (Optional[str]): Fixtures column holding the match date, read alongside
+                the fixtures when set and present in the fixtures mart
+            marts (Optional[Sequence[str]]): Names of the marts to query, all of MART_TABLES if None
+        """
+        self.backend = backend or BigQueryBackend()
+        self.tournament_id = tournament_id
+        self.match_day = match_day
+        self.goalscorers_limit = goalscorers_limit
+        self.fixtures_watermark_column = fixtures_watermark_column
+        self.fixtures_date_column = fixtures_date_column
+        # Whether the fixtures mart has fixtures_date_column, looked up on the first fixtures read
+        self._has_fixtures_date_column: Optional[bool] = None
+        self.mart_names = tuple(marts) if marts is not None else tuple(MART_TABLES)
+        self._table_metadata: Dict[str, Optional[TableMetadata]] = {}
+        self._fixtures: Optional[pd.DataFrame] = None
+        self._fixtures_watermark = None
+        # Fixtures and watermark of the latest sync, kept apart until commit_load()
+        self._pending_fixtures: Optional[Tuple[pd.DataFrame, object]] = None
+        self._last_result: Optional[MartLoadResult] = None
+        # Latest load and the table metadata it was read at, kept apart until commit_load()
+        self._pending_load: Optional[Tuple[Dict[str, Optional[TableMetadata]], MartLoadResult]] = None
+
+    @staticmethod
+    def _filters(**filters) -> List[Filter]:
+        return [(column, "=", value) for column, value in filters.items() if value is not None]
+
+    def read_next_gen_fixtures(self, since: Optional[datetime] = None):
+        """
+        Read the fixtures mart.
+
+        Args:
+            since (Optional[datetime]): Only read fixtures updated at or after this watermark.
+                Requires the reader to be created with a fixtures_watermark_column.
+
+        Returns:
+            pd.DataFrame: Fixtures with placeholder team names filled in
+        """
+        filters = self._filters(**{TOURNAMENT_COLUMN: self.tournament_id, MATCH_DAY_COLUMN: self.match_day})
+        columns = list(FIXTURES_COLUMNS)
+        if self.fixtures_date_column is not None and self._fixtures_date_column_available():
+            columns.append(self.fixtures_date_column)
+        if self.fixtures_watermark_column is not None:
+            columns.append(self.fixtures_watermark_column)
+            if since is not None:
+                filters.append((self.fixtures_watermark_column, ">=", since))
+        elif since is not None:
+            raise ValueError("Incremental fixture reads need a fixtures_watermark_column")
+
+        fixtures_df = self.backend.read_mart(FIXTURES_TABLE, columns, filters=filters, order_by=["match_id"])
+        return fill_placeholder_team_names(fixtures_df)
+
+    def _fixtures_date_column_available(self) -> bool:
+        if self._has_fixtures_date_column is None:
+            self._has_fixtures_date_column = (
+                self.fixtures_date_column in self.backend.get_table_columns(FIXTURES_TABLE)
+            )
+            if not self._has_fixtures_date_column:
+                logger.warning("Fixtures mart has no %s column, match dates fall back to TOURNAMENT_START_DATE",
+                               self.fixtures_date_column)
+        return self._has_fixtures_date_column
+
+    def sync_next_gen_fixtures(self) -> Tuple[pd.DataFrame, FrozenSet[int]]:
+        """
+        Bring the in-memory fixtures table up to date by watermark.
+
+        Only rows updated since the last watermark are fetched and merged by
+        match_id. The watermark filter is inclusive so rows written in the same
+        instant are never missed; unchanged rows are filtered out of the result
+        by comparing row hashes. The merged table and its watermark only become
+        the base of the next sync once commit_load() is called.
 
-        return fixtures_df
+        Returns:
+            Tuple[pd.DataFrame, FrozenSet[int]]: Merged fixtures and the ids of changed matches
+        """
+        if self._fixtures is None:
+            fixtures = self.read_next_gen_fixtures()
+            changed_ids = frozenset(fixtures["match_id"].tolist())
+        else:
+            delta = self.read_next_gen_fixtures(since=self._fixtures_watermark)
+            if delta.empty:
+                self._pending_fixtures = None
+                return self._fixtures, frozenset()
+
+            current = self._fixtures.set_index("match_id")
+            updates = delta.set_index("match_id")
+            new_hashes = pd.util.hash_pandas_object(updates, index=False)
+            old_hashes = pd.util.hash_pandas_object(current, index=False).reindex(new_hashes.index)
+            changed_ids = frozenset(new_hashes.index[new_hashes.ne(old_hashes)].tolist())
+
+            fixtures = pd.concat([
+                self._fixtures[~self._fixtures["match_id"].isin(delta["match_id"])],
+                delta,
+            ]).sort_values("match_id", ignore_index=True)
+
+        self._pending_fixtures = (fixtures, fixtures[self.fixtures_watermark_column].max())
+        return fixtures, changed_ids
 
     def read_next_gen_group_standings(self):
-        groups_query = f"""SELECT * FROM `{self.project_id}.{self.dataset_id}.mrt_next_gen_group_standings`"""
-        group_standings_df = self.gcp_client.query(groups_query).to_dataframe()
+        group_standings_df = self.backend.read_mart(
+            GROUP_STANDINGS_TABLE,
+            GROUP_STANDINGS_COLUMNS,
+            filters=self._filters(**{TOURNAMENT_COLUMN: self.tournament_id}),
+            order_by=["group_name", "group_position"],
+        )
         return group_standings_df
 
-    def read_top_goalscorers(self):
-        goalscorers_query = f"""SELECT * FROM `{self.project_id}.{self.dataset_id}.mrt_next_gen_top_goalscorers`"""
-        goalscorers_df = self.gcp_client.query(goalscorers_query).to_dataframe()
+    def read_top_goalscorers(self, limit: Optional[int] = None):
+        goalscorers_df = self.backend.read_mart(
+            GOALSCORERS_TABLE,
+            GOALSCORERS_COLUMNS,
+            filters=self._filters(**{TOURNAMENT_COLUMN: self.tournament_id}),
+            order_by=["place", "total_goals DESC", "player_name"],
+            limit=limit if limit is not None else self.goalscorers_limit,
+        )
         return goalscorers_df
+
+    @staticmethod
+    def _timed(read_function):
+        start = time.perf_counter()
+        result = read_function()
+        return result, time.perf_counter() - start
+
+    def _read_mart(self, name: str):
+        # Metadata is taken before the query, so a change landing mid-query is picked up next time
+        metadata = self.backend.get_table_metadata(MART_TABLES[name])
+        if name == "fixtures":
+            if self.fixtures_watermark_column is not None:
+                return (metadata, *self.sync_next_gen_fixtures())
+            fixtures = self.read_next_gen_fixtures()
+            return metadata, fixtures, None
+        if name == "group_standings":
+            return metadata, self.read_next_gen_group_standings(), None
+        return metadata, self.read_top_goalscorers(), None
+
+    def _load_marts(self, names: List[str]) -> MartLoadResult:
+        self._pending_fixtures = None
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="mart-query") as executor:
+            futures = {name: executor.submit(self._timed, partial(self._read_mart, name)) for name in names}
+            results = {name: future.result() for name, future in futures.items()}
+        total_seconds = time.perf_counter() - start
+
+        latencies = {name: latency for name, (_, latency) in results.items()}
+        logger.info(
+            "Loaded next gen marts in %.2fs (%s)", total_seconds,
+            ", ".join(f"{name}: {latency:.2f}s" for name, latency in latencies.items())
+        )
+
+        frames = {name: frame for name, ((_, frame, _), _) in results.items()}
+        metadata = {name: table_metadata for name, ((table_metadata, _, _), _) in results.items()}
+        changed_match_ids = results["fixtures"][0][2] if "fixtures" in results else frozenset()
+        if self._last_result is not None:
+            frames = {**{name: getattr(self._last_result, name) for name in MART_TABLES}, **frames}
+        else:
+            frames = {**dict.fromkeys(MART_TABLES), **frames}
+
+        result = MartLoadResult(
+            **frames,
+            latencies=latencies,
+            total_seconds=total_seconds,
+            changed=tuple(names),
+            changed_match_ids=changed_match_ids,
+        )
+        self._pending_load = (metadata, result)
+        return result
+
+    def commit_load(self):
+        """
+        Make the latest load the baseline for change detection.
+
+        Until a load is committed, read_changed_marts keeps comparing against
+        the previous committed load and fixture syncs start from the previous
+        watermark, so a refresh failing after the read picks up the same
+        changes again on the next attempt.
+        """
+        if self._pending_fixtures is not None:
+            self._fixtures, self._fixtures_watermark = self._pending_fixtures
+            self._pending_fixtures = None
+        if self._pending_load is None:
+            return
+        metadata, result = self._pending_load
+        self._table_metadata.update(metadata)
+        self._last_result = result
+        self._pending_load = None
+
+    def read_all_marts(self) -> MartLoadResult:
+        """
+        Run the fixtures, group standings and goalscorers queries concurrently.
+
+        The backends are thread-safe, so the reads are submitted at once and
+        the load takes as long as the slowest query. Marts the reader was not
+        configured to query are left as None.
+
+        Returns:
+            MartLoadResult: The DataFrames and the latency of each query in seconds
+        """
+        return self._load_marts(list(self.mart_names))
+
+    def read_changed_marts(self) -> Optional[MartLoadResult]:
+        """
+        Re-query only the marts whose table metadata changed since the last load.
+
+        Marts whose metadata cannot be trusted (e.g. views) are always re-queried.
+        Unchanged marts are carried over from the last committed load.
+
+        Returns:
+            Optional[MartLoadResult]: Updated marts, or None if no mart changed
+        """
+        if self._last_result is None:
+            return self.read_all_marts()
+
+        tables = [MART_TABLES[name] for name in self.mart_names]
+        with ThreadPoolExecutor(max_workers=len(tables), thread_name_prefix="mart-metadata") as executor:
+            metadata = dict(zip(self.mart_names, executor.map(self.backend.get_table_metadata, tables)))
+
+        changed = [
+            name for name, table_metadata in metadata.items()
+            if table_metadata is None or table_metadata != self._table_metadata.get(name)
+        ]
+        if not changed:
+            return None
+        return self._load_marts(changed)
+
+
+if __name__ == '__main__':
+    # Snapshot the BigQuery marts into a directory usable by LocalParquetBackend
+    export_marts(
+        NextGenDataReader().backend,
+        sys.argv[1] if len(sys.argv) > 1 else "local_data",
+        list(MART_TABLES.values()),
+    )
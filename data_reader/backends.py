@@ -0,0 +1,280 @@
+"""
+Data Backends
+
+This module provides the backends NextGenDataReader reads the next gen marts
+from: BigQuery in production, and a local Parquet directory exposing the
+same marts for running, profiling and load testing without GCP credentials.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    from google.cloud import bigquery
+except ImportError:  # only needed by BigQueryBackend
+    bigquery = None
+
+try:
+    from google.cloud import bigquery_storage
+except ImportError:  # Storage Read API is optional, REST is used without it
+    bigquery_storage = None
+
+READ_MODE_ARROW = "arrow"
+READ_MODE_REST = "rest"
+
+FILTER_OPERATORS = ("=", "!=", "<", "<=", ">", ">=")
+Filter = Tuple[str, str, object]
+
+BACKEND_BIGQUERY = "bigquery"
+BACKEND_LOCAL = "local"
+
+
+@dataclass(frozen=True)
+class TableMetadata:
+    """Cheap change marker of a mart table."""
+    modified: Optional[datetime]
+    num_rows: Optional[int]
+
+
+class DataBackend(ABC):
+    """
+    Source of the next gen marts.
+
+    Each read selects the given columns of one mart, keeps rows matching every
+    filter, then applies the ordering and limit. Filters are (column, operator,
+    value) triples with an operator from FILTER_OPERATORS. Order entries are
+    column names with an optional " DESC" suffix, as in SQL.
+    """
+
+    @abstractmethod
+    def read_mart(self,
+                  table: str,
+                  columns: Optional[Sequence[str]] = None,
+                  filters: Optional[Sequence[Filter]] = None,
+                  order_by: Sequence[str] = (),
+                  limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Read one mart into a DataFrame.
+
+        Args:
+            table (str): Mart table name
+            columns (Optional[Sequence[str]]): Columns to select, all if None
+            filters (Optional[Sequence[Filter]]): (column, operator, value) filters, all must match
+            order_by (Sequence[str]): Sort order
+            limit (Optional[int]): Maximum number of rows
+
+        Returns:
+            pd.DataFrame: Mart rows
+        """
+
+    @abstractmethod
+    def get_table_columns(self, table: str) -> List[str]:
+        """
+        Look up the column names of a mart without reading it.
+
+        Args:
+            table (str): Mart table name
+
+        Returns:
+            List[str]: Column names in schema order
+        """
+
+    @abstractmethod
+    def get_table_metadata(self, table: str) -> Optional[TableMetadata]:
+        """
+        Look up the last-modified time and row count of a mart without reading it.
+
+        Args:
+            table (str): Mart table name
+
+        Returns:
+            Optional[TableMetadata]: Change marker, or None if changes cannot be detected from metadata
+        """
+
+
+def _query_parameter(name: str, value):
+    if isinstance(value, bool):
+        parameter_type = "BOOL"
+    elif isinstance(value, int):
+        parameter_type = "INT64"
+    elif isinstance(value, datetime):
+        parameter_type = "TIMESTAMP"
+    elif isinstance(value, date):
+        parameter_type = "DATE"
+    else:
+        parameter_type = "STRING"
+    return bigquery.ScalarQueryParameter(name, parameter_type, value)
+
+
+class BigQueryBackend(DataBackend):
+    """Reads the marts from the BigQuery mart dataset."""
+
+    def __init__(self,
+                 project_id: str = "apds-fc-salzburg-plygnd",
+                 dataset_id: str = "90_mart_sandbox",
+                 read_mode: str = READ_MODE_ARROW):
+        """
+        Initialize the BigQuery backend.
+
+        Args:
+            project_id (str): GCP project holding the mart dataset
+            dataset_id (str): Mart dataset
+            read_mode (str): "arrow" to fetch Arrow record batches, "rest" for row-wise to_dataframe()
+        """
+        from utils import get_gcp_credentials
+
+        if bigquery is None:
+            raise ImportError("google-cloud-bigquery is required for the BigQuery backend")
+
+        credentials = get_gcp_credentials()
+        self.gcp_client = bigquery.Client(credentials=credentials)
+        self.project_id = project_id
+        self.dataset_id = dataset_id
+        self.read_mode = read_mode
+        self.bqstorage_client = None
+        if read_mode == READ_MODE_ARROW and bigquery_storage is not None:
+            self.bqstorage_client = bigquery_storage.BigQueryReadClient(credentials=credentials)
+
+    def build_query(self,
+                    table: str,
+                    columns: Optional[Sequence[str]] = None,
+                    filters: Optional[Sequence[Filter]] = None,
+                    order_by: Sequence[str] = (),
+                    limit: Optional[int] = None) -> Tuple[str, List]:
+        """
+        Build a projected, filtered query against one mart.
+
+        Filter values are bound as query parameters rather than formatted into the SQL.
+
+        Returns:
+            Tuple[str, List]: SQL text and its query parameters
+        """
+        query = f"SELECT {', '.join(columns) if columns else '*'} " \
+                f"FROM `{self.project_id}.{self.dataset_id}.{table}`"
+        conditions, parameters = [], []
+        for index, (column, operator, value) in enumerate(filters or ()):
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(f"Unsupported filter operator: {operator}")
+            conditions.append(f"{column} {operator} @p{index}")
+            parameters.append(_query_parameter(f"p{index}", value))
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        if order_by:
+            query += f" ORDER BY {', '.join(order_by)}"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return query, parameters
+
+    def _query_rows(self, *args, **kwargs):
+        query, parameters = self.build_query(*args, **kwargs)
+        job_config = bigquery.QueryJobConfig(query_parameters=parameters)
+        return self.gcp_client.query(query, job_config=job_config).result()
+
+    def read_mart(self, table, columns=None, filters=None, order_by=(), limit=None) -> pd.DataFrame:
+        rows = self._query_rows(table, columns, filters, order_by, limit)
+        if self.read_mode == READ_MODE_REST:
+            return rows.to_dataframe()
+
+        # Arrow-backed columns keep the data columnar instead of boxing every value
+        arrow_table = rows.to_arrow(bqstorage_client=self.bqstorage_client)
+        return arrow_table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def get_table_columns(self, table: str) -> List[str]:
+        bq_table = self.gcp_client.get_table(f"{self.project_id}.{self.dataset_id}.{table}")
+        return [schema_field.name for schema_field in bq_table.schema]
+
+    def get_table_metadata(self, table: str) -> Optional[TableMetadata]:
+        bq_table = self.gcp_client.get_table(f"{self.project_id}.{self.dataset_id}.{table}")
+        # A view's modified time tracks its definition, not the data behind it
+        if bq_table.table_type != "TABLE":
+            return None
+        return TableMetadata(modified=bq_table.modified, num_rows=bq_table.num_rows)
+
+
+class LocalParquetBackend(DataBackend):
+    """
+    Reads the marts from a local directory holding one <table>.parquet per mart.
+
+    Projection and filters are pushed into the Parquet reader, so the local
+    backend scans about as little data as the BigQuery one.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the local backend.
+
+        Args:
+            directory (str): Directory containing the mart Parquet files
+        """
+        self.directory = directory
+
+    def path(self, table: str) -> str:
+        return os.path.join(self.directory, f"{table}.parquet")
+
+    def _read_table(self, table, columns=None, filters=None, order_by=(), limit=None) -> pa.Table:
+        arrow_table = pq.read_table(
+            self.path(table),
+            columns=list(columns) if columns else None,
+            filters=list(filters) if filters else None,
+        )
+        if order_by:
+            sort_keys = []
+            for entry in order_by:
+                column, _, direction = entry.partition(" ")
+                sort_keys.append((column, "descending" if direction.upper() == "DESC" else "ascending"))
+            arrow_table = arrow_table.sort_by(sort_keys)
+        if limit is not None:
+            arrow_table = arrow_table.slice(0, int(limit))
+        return arrow_table
+
+    def read_mart(self, table, columns=None, filters=None, order_by=(), limit=None) -> pd.DataFrame:
+        return self._read_table(table, columns, filters, order_by, limit).to_pandas(types_mapper=pd.ArrowDtype)
+
+    def get_table_columns(self, table: str) -> List[str]:
+        return pq.read_schema(self.path(table)).names
+
+    def get_table_metadata(self, table: str) -> Optional[TableMetadata]:
+        path = self.path(table)
+        return TableMetadata(
+            modified=datetime.fromtimestamp(os.stat(path).st_mtime),
+            num_rows=pq.ParquetFile(path).metadata.num_rows,
+        )
+
+
+def export_marts(source: DataBackend, directory: str, tables: Sequence[str]):
+    """
+    Copy full marts from one backend into a local Parquet directory.
+
+    Args:
+        source (DataBackend): Backend to read from, usually BigQuery
+        directory (str): Target directory for LocalParquetBackend
+        tables (Sequence[str]): Mart tables to export
+    """
+    os.makedirs(directory, exist_ok=True)
+    for table in tables:
+        source.read_mart(table).to_parquet(os.path.join(directory, f"{table}.parquet"), index=False)
+
+
+def create_backend(backend: str, **kwargs) -> DataBackend:
+    """
+    Create a backend by name.
+
+    Args:
+        backend (str): "bigquery" or "local"
+        **kwargs: Backend constructor arguments
+
+    Returns:
+        DataBackend: Configured backend
+    """
+    if backend == BACKEND_BIGQUERY:
+        return BigQueryBackend(**kwargs)
+    if backend == BACKEND_LOCAL:
+        return LocalParquetBackend(**kwargs)
+    raise ValueError(f"Unknown data backend: {backend}")
@@ -0,0 +1,133 @@
+"""
+Mart Snapshot Cache
+
+This module persists the results of a mart load as a local Parquet snapshot
+so workers can start without waiting on BigQuery and keep serving the last
+good data when BigQuery is unreachable.
+"""
+
+import json
+import logging
+import os
+import shutil
+import time
+from datetime import datetime
+from typing import Optional
+
+import pandas as pd
+
+from data_reader.NextGenDataReader import MartLoadResult
+
+logger = logging.getLogger(__name__)
+
+MART_NAMES = ("fixtures", "group_standings", "goalscorers")
+# Marts the reader may be configured not to query
+OPTIONAL_MART_NAMES = ("group_standings",)
+LATEST_POINTER = "LATEST"
+MANIFEST_FILE = "manifest.json"
+
+
+class MartSnapshotCache:
+    """
+    Directory of Parquet snapshots with a TTL.
+
+    Every save writes a new snapshot directory and then atomically repoints
+    the LATEST file at it, so concurrent workers never read a half-written
+    snapshot. Only the newest few snapshots are kept on disk.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: float, keep: int = 2):
+        """
+        Initialize the snapshot cache.
+
+        Args:
+            directory (str): Directory holding the snapshots
+            ttl_seconds (float): Age after which a snapshot should be revalidated
+            keep (int): Number of snapshots to keep on disk
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.keep = keep
+
+    def save(self, marts: MartLoadResult) -> str:
+        """
+        Persist a mart load as the newest snapshot.
+
+        Args:
+            marts (MartLoadResult): Mart DataFrames to persist
+
+        Returns:
+            str: Path of the written snapshot directory
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"snapshot-{time.time_ns()}-{os.getpid()}"
+        staging_path = os.path.join(self.directory, f".{name}")
+        os.makedirs(staging_path)
+
+        for mart_name in MART_NAMES:
+            frame = getattr(marts, mart_name)
+            if frame is not None:
+                frame.to_parquet(os.path.join(staging_path, f"{mart_name}.parquet"), index=False)
+        with open(os.path.join(staging_path, MANIFEST_FILE), "w") as manifest:
+            json.dump({"fetched_at": marts.fetched_at.isoformat()}, manifest)
+
+        snapshot_path = os.path.join(self.directory, name)
+        os.rename(staging_path, snapshot_path)
+
+        pointer_tmp = os.path.join(self.directory, f".{LATEST_POINTER}-{os.getpid()}")
+        with open(pointer_tmp, "w") as pointer:
+            pointer.write(name)
+        os.replace(pointer_tmp, os.path.join(self.directory, LATEST_POINTER))
+
+        self._prune()
+        return snapshot_path
+
+    def load(self) -> Optional[MartLoadResult]:
+        """
+        Load the most recent snapshot.
+
+        Returns:
+            Optional[MartLoadResult]: Cached marts, or None if no readable snapshot exists
+        """
+        try:
+            with open(os.path.join(self.directory, LATEST_POINTER)) as pointer:
+                snapshot_path = os.path.join(self.directory, pointer.read().strip())
+            with open(os.path.join(snapshot_path, MANIFEST_FILE)) as manifest:
+                fetched_at = datetime.fromisoformat(json.load(manifest)["fetched_at"])
+            mart_paths = {mart_name: os.path.join(snapshot_path, f"{mart_name}.parquet") for mart_name in MART_NAMES}
+            frames = {
+                mart_name: None if mart_name in OPTIONAL_MART_NAMES and not os.path.exists(path) else pd.read_parquet(path)
+                for mart_name, path in mart_paths.items()
+            }
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.exception("Could not read mart snapshot cache in %s", self.directory)
+            return None
+
+        return MartLoadResult(**frames, fetched_at=fetched_at)
+
+    def touch(self, fetched_at: datetime):
+        """
+        Mark the latest snapshot as revalidated without rewriting its data.
+
+        Args:
+            fetched_at (datetime): Time the marts were confirmed unchanged
+        """
+        try:
+            with open(os.path.join(self.directory, LATEST_POINTER)) as pointer:
+                snapshot_path = os.path.join(self.directory, pointer.read().strip())
+        except FileNotFoundError:
+            return
+        manifest_tmp = os.path.join(snapshot_path, f".{MANIFEST_FILE}-{os.getpid()}")
+        with open(manifest_tmp, "w") as manifest:
+            json.dump({"fetched_at": fetched_at.isoformat()}, manifest)
+        os.replace(manifest_tmp, os.path.join(snapshot_path, MANIFEST_FILE))
+
+    def _prune(self):
+        snapshots = sorted(
+            (entry for entry in os.listdir(self.directory) if entry.startswith("snapshot-")),
+            key=lambda entry: int(entry.split("-")[1])
+        )
+        for entry in snapshots[:-self.keep]:
+            shutil.rmtree(os.path.join(self.directory, entry), ignore_errors=True)
@@ -1,19 +1,109 @@
+import argparse
+import os
+import re
+from typing import Optional
+
 import pandas as pd
 
+from config.tournament_config import SQUAD_TEAM_NAMES
+
+# Columns of a normalized squad
+SQUAD_COLUMNS = ["team_name", "player_name", "shirt_number", "position", "birth_date"]
+
+# Spellings of the squad workbook headers seen across teams, matched after lowercasing
+SQUAD_COLUMN_ALIASES = {
+    "player_name": ["player_name", "player", "name", "spieler", "spielername", "full name"],
+    "first_name": ["first_name", "first name", "firstname", "vorname"],
+    "last_name": ["last_name", "last name", "lastname", "surname", "nachname"],
+    "shirt_number": ["shirt_number", "shirt number", "number", "no", "no.", "nr", "nr.", "nummer", "rückennummer"],
+    "position": ["position", "pos", "pos."],
+    "birth_date": ["birth_date", "date of birth", "dob", "birthday", "geburtsdatum"],
+}
+
+
+def squad_team_name(squad_path: str) -> str:
+    """
+    Get the team name of a squad workbook from its file name.
+
+    Args:
+        squad_path (str): Path of the workbook, e.g. ".../Brondby IF.xlsx"
+
+    Returns:
+        str: Team name, with SQUAD_TEAM_NAMES applied
+    """
+    file_team_name = os.path.splitext(os.path.basename(squad_path))[0].strip()
+    return SQUAD_TEAM_NAMES.get(file_team_name, file_team_name)
+
+
+def normalize_squad(squad_df: pd.DataFrame, team_name: str) -> pd.DataFrame:
+    """
+    Rename squad workbook columns to SQUAD_COLUMNS and clean up their values.
+
+    Args:
+        squad_df (pd.DataFrame): Squad as read from the workbook
+        team_name (str): Team the squad belongs to
+
+    Returns:
+        pd.DataFrame: One row per player with SQUAD_COLUMNS
+    """
+    aliases = {alias: column for column, names in SQUAD_COLUMN_ALIASES.items() for alias in names}
+    renamed = squad_df.rename(columns=lambda header: aliases.get(re.sub(r"\s+", " ", str(header)).strip().lower(), header))
+    renamed = renamed.loc[:, ~renamed.columns.duplicated()]
+
+    if "player_name" not in renamed.columns and {"first_name", "last_name"} <= set(renamed.columns):
+        renamed["player_name"] = (
+            renamed["first_name"].fillna("").astype(str).str.strip() + " "
+            + renamed["last_name"].fillna("").astype(str).str.strip()
+        )
+    if "player_name" not in renamed.columns:
+        raise KeyError(f"No player name column in squad of {team_name}: {list(squad_df.columns)}")
+
+    def column(name: str) -> pd.Series:
+        # Optional columns missing from a workbook are filled with missing values
+        return renamed[name] if name in renamed.columns else pd.Series(None, index=renamed.index, dtype=object)
+
+    player_names = renamed["player_name"].astype("string").str.strip()
+    squad = pd.DataFrame({
+        "team_name": team_name,
+        "player_name": player_names,
+        "shirt_number": pd.to_numeric(column("shirt_number"), errors="coerce").astype("Int64"),
+        "position": column("position").astype("string").str.strip(),
+        "birth_date": pd.to_datetime(column("birth_date"), errors="coerce", dayfirst=True),
+    })
+    return squad[player_names.fillna("").ne("")].reset_index(drop=True)[SQUAD_COLUMNS]
+
 
 class SquadParser:
-    def __init__(self, squad_path: str, team_name: str):
+    def __init__(self, squad_path: str, team_name: Optional[str] = None):
         self.squad_path = squad_path
-        self.team_name = team_name
+        self.team_name = team_name or squad_team_name(squad_path)
 
     def read_excel(self):
         df = pd.read_excel(self.squad_path)
 
         return df
 
+    def parse(self) -> pd.DataFrame:
+        """
+        Read the squad workbook and normalize its columns.
+
+        Returns:
+            pd.DataFrame: One row per player with SQUAD_COLUMNS
+        """
+        return normalize_squad(self.read_excel(), self.team_name)
+
 
 if __name__ == '__main__':
-    path = '/Users/ammar.elsherebasy/Desktop/Next Gen/Squads/Brondby IF.xlsx'
-    sp = SquadParser(squad_path=path, team_name='Brøndby IF')
-    parsed_excel = sp.read_excel()
-    print(parsed_excel.head(40))
+    from config.app_config import SQUAD_SOURCE_DIR, SQUAD_STORE_DIR
+    from data_reader.squad_store import SquadStore
+
+    parser = argparse.ArgumentParser(description="Parse all squad workbooks into the Parquet squad store.")
+    parser.add_argument("squad_dir", nargs="?", default=SQUAD_SOURCE_DIR, help="Directory with one .xlsx per team")
+    parser.add_argument("--store", default=SQUAD_STORE_DIR, help="Directory of the squad store")
+    parser.add_argument("--workers", type=int, default=None, help="Number of parser processes")
+    parser.add_argument("--force", action="store_true", help="Re-parse every workbook")
+    args = parser.parse_args()
+
+    result = SquadStore(args.store).ingest(args.squad_dir, max_workers=args.workers, force=args.force)
+    print(f"Parsed {len(result.parsed)} workbooks, kept {len(result.unchanged)}, removed {len(result.removed)}; "
+          f"{result.players} players in {args.store}")
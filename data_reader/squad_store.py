@@ -0,0 +1,168 @@
+"""
+Squad Store
+
+This module provides the SquadStore class, which parses every team's squad
+workbook into a single Parquet file. Workbooks are only re-parsed when they
+changed, and changed workbooks are parsed in a process pool, so loading all
+squads costs one Parquet read instead of one openpyxl parse per team.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from data_reader.squad_parser import SQUAD_COLUMNS, SquadParser
+
+logger = logging.getLogger(__name__)
+
+SQUADS_FILE = "squads.parquet"
+MANIFEST_FILE = "manifest.json"
+SQUAD_WORKBOOK_EXTENSIONS = (".xlsx", ".xlsm", ".xls")
+
+
+@dataclass
+class SquadIngestResult:
+    """Outcome of a squad ingestion run, by workbook file name."""
+    parsed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    players: int = 0
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as workbook:
+        for chunk in iter(lambda: workbook.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _parse_squad_workbook(path: str) -> Tuple[str, pd.DataFrame]:
+    # Runs in a worker process, so it has to be a picklable module level function
+    squad = SquadParser(path).parse()
+    squad["source_file"] = os.path.basename(path)
+    return os.path.basename(path), squad
+
+
+class SquadStore:
+    """
+    Parquet store holding the normalized squads of all teams.
+
+    A manifest records the modification time, size and content hash of every
+    ingested workbook. A workbook is re-parsed only when its mtime or size
+    changed and its hash no longer matches, so touching a file without
+    editing it does not trigger a parse.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the squad store.
+
+        Args:
+            directory (str): Directory holding the Parquet file and its manifest
+        """
+        self.directory = directory
+        self.squads_path = os.path.join(directory, SQUADS_FILE)
+        self.manifest_path = os.path.join(directory, MANIFEST_FILE)
+
+    def _read_manifest(self) -> Dict[str, Dict]:
+        try:
+            with open(self.manifest_path) as manifest:
+                return json.load(manifest)
+        except FileNotFoundError:
+            return {}
+
+    def load(self) -> pd.DataFrame:
+        """
+        Load all squads.
+
+        Returns:
+            pd.DataFrame: One row per player with SQUAD_COLUMNS and source_file,
+                empty if nothing was ingested yet
+        """
+        if not os.path.exists(self.squads_path):
+            return pd.DataFrame(columns=SQUAD_COLUMNS + ["source_file"])
+        return pd.read_parquet(self.squads_path)
+
+    def ingest(self, squad_dir: str, max_workers: Optional[int] = None, force: bool = False) -> SquadIngestResult:
+        """
+        Bring the store up to date with the workbooks in a directory.
+
+        Args:
+            squad_dir (str): Directory with one squad workbook per team
+            max_workers (Optional[int]): Number of parser processes, one per CPU if None
+            force (bool): Re-parse every workbook regardless of the manifest
+
+        Returns:
+            SquadIngestResult: Which workbooks were parsed, kept and removed
+        """
+        # Without the Parquet file nothing can be kept, whatever the manifest says
+        manifest = {} if force or not os.path.exists(self.squads_path) else self._read_manifest()
+        result = SquadIngestResult()
+        new_manifest = {}
+        to_parse = []
+
+        for file_name in sorted(os.listdir(squad_dir)):
+            # Skip Excel lock files of workbooks that are open
+            if file_name.startswith("~$") or not file_name.lower().endswith(SQUAD_WORKBOOK_EXTENSIONS):
+                continue
+            path = os.path.join(squad_dir, file_name)
+            stat = os.stat(path)
+            entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            previous = manifest.get(file_name)
+
+            if previous is not None and (previous["mtime_ns"], previous["size"]) == (entry["mtime_ns"], entry["size"]):
+                entry["sha1"] = previous["sha1"]
+            else:
+                entry["sha1"] = _file_digest(path)
+            new_manifest[file_name] = entry
+
+            if previous is not None and previous["sha1"] == entry["sha1"]:
+                result.unchanged.append(file_name)
+            else:
+                to_parse.append(path)
+
+        result.removed = sorted(set(manifest) - set(new_manifest))
+        if not to_parse and not result.removed:
+            if new_manifest != manifest:
+                self._write_manifest(new_manifest)
+            result.players = len(self.load())
+            return result
+
+        if len(to_parse) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                parsed = dict(executor.map(_parse_squad_workbook, to_parse))
+        else:
+            parsed = dict(map(_parse_squad_workbook, to_parse))
+        result.parsed = sorted(parsed)
+
+        kept = self.load()
+        kept = kept[kept["source_file"].isin(result.unchanged)]
+        squads = pd.concat([kept, *parsed.values()], ignore_index=True)
+        squads = squads.sort_values(["team_name", "shirt_number", "player_name"], ignore_index=True)
+        self._write_squads(squads)
+        self._write_manifest(new_manifest)
+
+        result.players = len(squads)
+        logger.info("Parsed %s squad workbooks (%s unchanged, %s removed)",
+                    len(result.parsed), len(result.unchanged), len(result.removed))
+        return result
+
+    def _write_squads(self, squads: pd.DataFrame):
+        os.makedirs(self.directory, exist_ok=True)
+        squads_tmp = f"{self.squads_path}.{os.getpid()}.tmp"
+        squads.to_parquet(squads_tmp, index=False)
+        os.replace(squads_tmp, self.squads_path)
+
+    def _write_manifest(self, manifest: Dict[str, Dict]):
+        os.makedirs(self.directory, exist_ok=True)
+        manifest_tmp = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(manifest_tmp, "w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        os.replace(manifest_tmp, self.manifest_path)
@@ -0,0 +1,15 @@
+"""
+Gunicorn Configuration
+
+Loaded by gunicorn when it is started from the project root, e.g.
+``gunicorn app:server --bind 0.0.0.0:8060``. With VIEW_UPDATE_MODE = "push"
+every screen keeps a server-sent events connection open for as long as it
+is on, so workers serve requests from threads: an open stream holds one
+thread instead of a whole worker process.
+"""
+
+worker_class = "gthread"
+workers = 2
+# Open event streams plus concurrent Dash callbacks per worker; screens beyond
+# workers * threads wait for a free thread
+threads = 32
@@ -5,13 +5,22 @@ This module provides the main application layout and view management for the
 tournament tree visualization Dash application.
 """
 
+from typing import Optional
+
 from dash import html
 from dash import dcc
 
+from components.live_next import LiveNextComponent
 from components.tournament_goalscorers import TournamentGoalscorersComponent
 from components.tournament_matches import TournamentMatchesComponent
 from components.tournament_tree import TournamentTreeComponent
-# from config.app_config import VIEW_DISPLAY_NAMES, AVAILABLE_VIEWS
+from config.app_config import (
+    AVAILABLE_VIEWS, DEFAULT_DISPLAY_GROUP, DISPLAY_CLOCK_ROUTE, DISPLAY_CLOCK_SYNC_SECONDS, DISPLAY_TICK_MS,
+    ROTATION_MODE, VIEW_EVENTS_ROUTE, VIEW_UPDATE_MODE, VIEW_VERSION_CHECK_INTERVAL_SECONDS
+)
+from data.tournament_data import TournamentSnapshot
+from layouts.rotation_plan import ROTATION_PLANS
+from layouts.view_registry import ViewRegistry
 
 
 class MainLayoutManager:
@@ -23,10 +32,13 @@ class MainLayoutManager:
     """
     
     def __init__(self):
-        """Initialize the main layout manager."""
-        self.tournament_tree = TournamentTreeComponent()
-        self.tournament_matches = TournamentMatchesComponent()
-        self.goalscorers = TournamentGoalscorersComponent()
+        """Initialize the main layout manager and register the views, constructed on first use."""
+        self.views = ViewRegistry(default_view="tournament_tree")
+        self.views.register("tournament_tree", lambda: TournamentTreeComponent().create_complete_tournament_tree)
+        self.views.register("tournament_schedule",
+                            lambda: TournamentMatchesComponent().create_complete_tournament_matches)
+        self.views.register("goalscorers", lambda: TournamentGoalscorersComponent().create_goalscorers_tables)
+        self.views.register("live_next", lambda: LiveNextComponent().create_complete_live_next)
     
     @staticmethod
     def create_app_header() -> html.Div:
@@ -63,119 +75,60 @@ class MainLayoutManager:
             ], className="view-progress")
         ], className="view-indicator")
     
-    def create_tournament_tree_view(self) -> html.Div:
-        return self.tournament_tree.create_complete_tournament_tree()
-
-    def create_tournament_matches_view(self) -> html.Div:
-        return self.tournament_matches.create_complete_tournament_matches()
-
-    def create_goal_scorers_view(self) -> html.Div:
-        return self.goalscorers.create_goalscorers_tables()
+    def create_tournament_tree_view(self, snapshot: Optional[TournamentSnapshot] = None) -> html.Div:
+        return self.views.build("tournament_tree", snapshot)
 
     @staticmethod
-    def create_tournament_table_view() -> html.Div:
+    def create_preloaded_content_area() -> html.Div:
         """
-        Create the tournament table view layout.
-        
+        Create the main content area for client-side rotation.
+
+        Every view gets its own container, filled by the server only when the
+        view changes and shown or hidden in the browser when the screen's
+        display group enters a new time slot.
+
         Returns:
-            html.Div: Tournament table view
+            html.Div: Main content area
         """
         return html.Div([
-            html.H2("next generation trophy 25/26", className="view-title"),
+            dcc.Store(id="current-view-store", data=AVAILABLE_VIEWS[0]),
+            dcc.Store(id="view-keys-store", data={}),
+            dcc.Store(id="display-plan-store", data={
+                "groups": {group: plan.to_client() for group, plan in ROTATION_PLANS.items()},
+                "defaultGroup": DEFAULT_DISPLAY_GROUP,
+                "clockUrl": DISPLAY_CLOCK_ROUTE,
+                "clockSyncSeconds": DISPLAY_CLOCK_SYNC_SECONDS,
+            }),
+
             html.Div([
-                html.Table([
-                    html.Thead([
-                        html.Tr([
-                            html.Th("Match"),
-                            html.Th("Team 1"),
-                            html.Th("Team 2"),
-                            html.Th("Round"),
-                            html.Th("Status")
-                        ])
-                    ]),
-                    html.Tbody([
-                        html.Tr([
-                            html.Td("QF1"),
-                            html.Td("Team A1"),
-                            html.Td("Team C3"),
-                            html.Td("Quarter Finals"),
-                            html.Td("Pending")
-                        ]),
-                        html.Tr([
-                            html.Td("QF2"),
-                            html.Td("Team B1"),
-                            html.Td("Team D3"),
-                            html.Td("Quarter Finals"),
-                            html.Td("Pending")
-                        ]),
-                        html.Tr([
-                            html.Td("QF3"),
-                            html.Td("Team C1"),
-                            html.Td("Team A3"),
-                            html.Td("Quarter Finals"),
-                            html.Td("Pending")
-                        ]),
-                        html.Tr([
-                            html.Td("QF4"),
-                            html.Td("Team D1"),
-                            html.Td("Team B3"),
-                            html.Td("Quarter Finals"),
-                            html.Td("Pending")
-                        ])
-                    ])
-                ], className="tournament-table")
-            ], className="table-container")
-        ], className="tournament-table-view")
-    
+                html.Div(id=f"view-{view_name}", className="rotating-view active" if index == 0 else "rotating-view")
+                for index, view_name in enumerate(AVAILABLE_VIEWS)
+            ], id="view-stack", className="view-stack"),
+
+            # Rotation happens in the browser, this timer never reaches the server
+            dcc.Interval(id="rotation-timer", interval=DISPLAY_TICK_MS),
+            MainLayoutManager.create_view_update_trigger(),
+        ], className="main-content")
+
     @staticmethod
-    def create_statistics_view() -> html.Div:
+    def create_view_update_trigger():
         """
-        Create the statistics view layout.
-        
+        Create the component that makes a screen ask the server for changed views.
+
         Returns:
-            html.Div: Statistics view
+            Component: Store written by pushed view events, or the polling timer
         """
-        return html.Div([
-            html.H2("next generation trophy 25/26", className="view-title"),
-            html.Div([
-                html.Div([
-                    html.H3("Teams by Group"),
-                    html.Div([
-                        html.Div([
-                            html.Span("Group A: ", className="stat-label"),
-                            html.Span("3 teams", className="stat-value")
-                        ], className="stat-item"),
-                        html.Div([
-                            html.Span("Group B: ", className="stat-label"),
-                            html.Span("3 teams", className="stat-value")
-                        ], className="stat-item"),
-                        html.Div([
-                            html.Span("Group C: ", className="stat-label"),
-                            html.Span("3 teams", className="stat-value")
-                        ], className="stat-item"),
-                        html.Div([
-                            html.Span("Group D: ", className="stat-label"),
-                            html.Span("3 teams", className="stat-value")
-                        ], className="stat-item")
-                    ], className="stats-grid")
-                ], className="stats-section"),
-                
-                html.Div([
-                    html.H3("Tournament Progress"),
-                    html.Div([
-                        html.Div([
-                            html.Span("Matches Completed: ", className="stat-label"),
-                            html.Span("0/15", className="stat-value")
-                        ], className="stat-item"),
-                        html.Div([
-                            html.Span("Current Round: ", className="stat-label"),
-                            html.Span("Quarter Finals", className="stat-value")
-                        ], className="stat-item")
-                    ], className="stats-grid")
-                ], className="stats-section")
-            ], className="statistics-content")
-        ], className="statistics-view")
-    
+        if VIEW_UPDATE_MODE == "push":
+            return html.Div([
+                dcc.Store(id="view-events-config", data={
+                    "url": VIEW_EVENTS_ROUTE,
+                    "fallbackIntervalMs": VIEW_VERSION_CHECK_INTERVAL_SECONDS * 1000,
+                }),
+                dcc.Store(id="view-event-store"),
+            ])
+        # Asks the server whether any view changed
+        return dcc.Interval(id="view-version-timer", interval=VIEW_VERSION_CHECK_INTERVAL_SECONDS * 1000)
+
     def create_main_content_area(self) -> html.Div:
         """
         Create the main content area with view switching.
@@ -183,16 +136,19 @@ class MainLayoutManager:
         Returns:
             html.Div: Main content area
         """
+        if ROTATION_MODE == "client":
+            return self.create_preloaded_content_area()
+
         return html.Div([
             # Hidden stores for state management
             dcc.Store(id="current-view-store", data="tournament_tree"),
             dcc.Store(id="rotation-enabled-store", data=True),
+            # The display group is read from ?group=<name>
+            dcc.Location(id="display-url", refresh=False),
             
             # View content container
             html.Div(id="view-content", children=[
                 self.create_tournament_tree_view()  # default view
-                # self.create_tournament_matches_view()
-                # self.create_goal_scorers_view()
             ]),
             
             # Rotation timer
@@ -0,0 +1,171 @@
+"""
+Prerender Scheduler Module
+
+This module provides the PrerenderScheduler class, which renders and
+serializes views in a background thread before screens ask for them. The
+rotation plans say which view every display group shows next and when, so
+each view is put into the render caches shortly before its slot starts, and
+all views are rendered again as soon as a new snapshot is published.
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from data.tournament_data import get_current_snapshot, wait_for_snapshot
+from layouts.rotation_plan import RotationPlan
+
+logger = logging.getLogger(__name__)
+
+# Prerender job: when to render, which view, and an identifier so each job runs once
+PrerenderJob = Tuple[float, str, Tuple]
+
+# Longest sleep between checks, so stop() does not wait for a far away slot
+MAX_WAIT_SECONDS = 1.0
+
+
+class PrerenderScheduler:
+    """
+    Renders each display group's next view ahead of its time slot.
+
+    Views depending on the clock are cached per time bucket, so they are
+    prerendered no earlier than the start of the bucket their slot starts
+    in, and again at every bucket start.
+    """
+
+    def __init__(self, rotation_callbacks, plans: Iterable[RotationPlan], lead_seconds: float,
+                 time_buckets: Optional[Dict[str, float]] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            rotation_callbacks (RotationCallbackManager): Renders views through the render caches
+            plans (Iterable[RotationPlan]): Rotation plans of all display groups
+            lead_seconds (float): How long before a slot starts its view is rendered
+            time_buckets (Optional[Dict[str, float]]): Cache time bucket in seconds of clock dependent views
+        """
+        self.rotation_callbacks = rotation_callbacks
+        self.plans = list(plans)
+        self.lead_seconds = lead_seconds
+        self.time_buckets = {
+            view_name: bucket_seconds for view_name, bucket_seconds in (time_buckets or {}).items()
+            if any(view_name in plan.views for plan in self.plans)
+        }
+        self._done_jobs: Set[Tuple] = set()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _prerender_time(self, view_name: str, slot_start: float) -> float:
+        prerender_at = slot_start - self.lead_seconds
+        bucket_seconds = self.time_buckets.get(view_name)
+        if bucket_seconds is not None:
+            # Rendering earlier would cache the view under the previous bucket
+            prerender_at = max(prerender_at, math.floor(slot_start / bucket_seconds) * bucket_seconds)
+        return prerender_at
+
+    def _next_jobs(self, now: float) -> List[PrerenderJob]:
+        jobs = []
+        for plan in self.plans:
+            next_slot = plan.slot_at(now) + 1
+            view_name = plan.view_for_slot(next_slot)
+            jobs.append((self._prerender_time(view_name, next_slot * plan.slot_seconds), view_name,
+                         ("slot", plan.group, next_slot)))
+        for view_name, bucket_seconds in self.time_buckets.items():
+            next_bucket = math.floor(now / bucket_seconds) + 1
+            # Just after the boundary, so the render lands in the new bucket
+            jobs.append((next_bucket * bucket_seconds + 0.01, view_name, ("bucket", view_name, next_bucket)))
+        return jobs
+
+    def upcoming_jobs(self, now: float) -> List[PrerenderJob]:
+        """
+        Get the next prerender job of every display group and clock dependent view.
+
+        Args:
+            now (float): Unix time
+
+        Returns:
+            List[PrerenderJob]: Jobs not run yet, ordered by when they are due
+        """
+        return sorted(job for job in self._next_jobs(now) if job[2] not in self._done_jobs)
+
+    def views_by_due_time(self, now: float) -> List[str]:
+        """
+        Get every view of the rotation plans, the ones shown soonest first.
+
+        Args:
+            now (float): Unix time
+
+        Returns:
+            List[str]: View names
+        """
+        due = {}
+        for plan in self.plans:
+            current_slot = plan.slot_at(now)
+            for offset in range(len(plan.views)):
+                view_name = plan.view_for_slot(current_slot + offset)
+                due[view_name] = min(due.get(view_name, math.inf), (current_slot + offset) * plan.slot_seconds)
+        return sorted(due, key=due.get)
+
+    def prerender(self, view_name: str):
+        """
+        Render and serialize a view for the current snapshot.
+
+        Args:
+            view_name (str): View identifier
+        """
+        snapshot = get_current_snapshot()
+        start = time.perf_counter()
+        self.rotation_callbacks.render_view(view_name, snapshot)
+        logger.debug("Prerendered %s for snapshot v%s in %.1f ms",
+                     view_name, snapshot.version, (time.perf_counter() - start) * 1000)
+
+    def _prerender_all(self):
+        for view_name in self.views_by_due_time(time.time()):
+            self.prerender(view_name)
+
+    def _run(self):
+        # Snapshot versions start at 1, so the first pass prerenders everything
+        version = 0
+        while not self._stop_event.is_set():
+            try:
+                snapshot = get_current_snapshot()
+                if snapshot.version != version:
+                    version = snapshot.version
+                    self._prerender_all()
+                now = time.time()
+                for due_at, view_name, job_id in self.upcoming_jobs(now):
+                    if due_at > now:
+                        break
+                    self._done_jobs.add(job_id)
+                    self.prerender(view_name)
+                # Jobs of past slots and buckets cannot come up again
+                self._done_jobs &= {job_id for _, _, job_id in self._next_jobs(now)}
+            except Exception:
+                logger.exception("Prerendering failed, views will be rendered on request")
+
+            jobs = self.upcoming_jobs(time.time())
+            delay = jobs[0][0] - time.time() if jobs else MAX_WAIT_SECONDS
+            # Returns early when a snapshot is published
+            wait_for_snapshot(version, min(max(delay, 0), MAX_WAIT_SECONDS))
+
+    def start(self):
+        """Start prerendering in a daemon thread. Calling start twice is a no-op."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="view-prerender-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop the scheduler thread.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the thread to finish
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,281 @@
+"""
+Render Cache Module
+
+This module provides the ViewRenderCache class, which memoizes rendered view
+trees per tournament snapshot version so rotation ticks reuse the components
+built for the current data instead of rebuilding them, and the
+SharedViewPayloadCache class, which keeps serialized renderings on disk so
+every worker process can patch screens holding a view another worker built.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from plotly.io.json import to_json_plotly
+
+logger = logging.getLogger(__name__)
+
+# Packages whose code decides how a snapshot is turned into a view
+RENDER_SOURCE_PACKAGES = ("components", "config", "data", "layouts")
+
+
+def compute_render_version(extra: Iterable[str] = (),
+                           packages: Iterable[str] = RENDER_SOURCE_PACKAGES) -> str:
+    """
+    Hash the source code that renders views.
+
+    Args:
+        extra (Iterable[str]): Other state renderings depend on, e.g. the squad data fingerprint
+        packages (Iterable[str]): Packages of the app to hash the Python files of
+
+    Returns:
+        str: Short hex digest, changing whenever the code or the extra state changes
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digest = hashlib.sha1()
+    for package in packages:
+        package_dir = os.path.join(root, package)
+        for file_name in sorted(os.listdir(package_dir)):
+            if file_name.endswith(".py"):
+                digest.update(file_name.encode())
+                with open(os.path.join(package_dir, file_name), "rb") as source_file:
+                    digest.update(source_file.read())
+    for state in extra:
+        digest.update(state.encode())
+    return digest.hexdigest()[:12]
+
+
+class ViewRenderCache:
+    """
+    Cache of rendered views keyed by view name and snapshot version.
+
+    Only the latest rendering of each view is kept, so a new snapshot
+    version replaces the old entry on its first render and nothing has to
+    be evicted. Views that depend on the clock (e.g. Live & Next) can be
+    given a bucket size in seconds, which becomes part of the key.
+    """
+
+    def __init__(self, time_buckets: Optional[Dict[str, float]] = None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            time_buckets (Optional[Dict[str, float]]): Seconds a rendering of a
+                clock dependent view stays valid, keyed by view name
+        """
+        self.time_buckets = time_buckets or {}
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Tuple[Hashable, object]] = {}
+        self._view_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, view_name: str, version: int) -> Hashable:
+        bucket_seconds = self.time_buckets.get(view_name)
+        if bucket_seconds is None:
+            return version
+        return version, int(time.time() // bucket_seconds)
+
+    def get_or_render(self, view_name: str, version: int, render: Callable[[], object]):
+        """
+        Get the cached rendering of a view, rendering it on a miss.
+
+        Concurrent misses for the same view wait for a single render.
+
+        Args:
+            view_name (str): View identifier
+            version (int): Version of the snapshot the view is rendered from
+            render (Callable[[], object]): Builds the view's component tree
+
+        Returns:
+            The view's component tree
+        """
+        key = self._key(view_name, version)
+        entry = self._entries.get(view_name)
+        if entry is not None and entry[0] == key:
+            with self._lock:
+                self.hits += 1
+            return entry[1]
+
+        with self._lock:
+            view_lock = self._view_locks.setdefault(view_name, threading.Lock())
+        with view_lock:
+            entry = self._entries.get(view_name)
+            if entry is not None and entry[0] == key:
+                with self._lock:
+                    self.hits += 1
+                return entry[1]
+
+            start = time.perf_counter()
+            rendered = render()
+            self._entries[view_name] = (key, rendered)
+            with self._lock:
+                self.misses += 1
+            logger.debug("Rendered %s for snapshot v%s in %.1f ms",
+                         view_name, version, (time.perf_counter() - start) * 1000)
+            return rendered
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the hit and miss counters.
+
+        Returns:
+            Dict[str, float]: hits, misses and hit_rate
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.0}
+
+
+def encode_view(tree) -> bytes:
+    """
+    Serialize a view's component tree the way Dash sends it to the browser.
+
+    Args:
+        tree: Dash component tree
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    return to_json_plotly(tree).encode("utf-8")
+
+
+class SharedViewPayloadCache:
+    """
+    File-backed store of serialized views shared by all worker processes.
+
+    Workers build views into their own ViewRenderCache and write each new
+    rendering here, so when a screen reports the payload key of the view it
+    holds, any worker can look up what that rendering contained and send a
+    Patch. Payloads are keyed by view name and snapshot fingerprint rather than
+    version: every worker refreshes on its own, so version numbers differ
+    between workers while identical data has the same fingerprint. The key
+    also holds a render version, so payloads written by a previous release
+    of the rendering code are never patched against after a deploy. Files
+    are written to a temporary name and renamed into place, so readers never
+    see a partial payload; two workers storing the same rendering write
+    identical content.
+    """
+
+    def __init__(self, directory: str, render_version: str,
+                 time_buckets: Optional[Dict[str, float]] = None, keep: int = 2):
+        """
+        Initialize the payload cache.
+
+        Args:
+            directory (str): Directory shared by the workers
+            render_version (str): Version of the rendering code, see compute_render_version
+            time_buckets (Optional[Dict[str, float]]): Seconds a payload of a
+                clock dependent view stays valid, keyed by view name
+            keep (int): Payloads kept on disk per view
+        """
+        self.directory = directory
+        self.render_version = render_version
+        self.time_buckets = time_buckets or {}
+        self.keep = keep
+
+    def payload_key(self, view_name: str, fingerprint: str) -> str:
+        """
+        Get the cache key of a view payload.
+
+        Args:
+            view_name (str): View identifier
+            fingerprint (str): Fingerprint of the snapshot the view is rendered from
+
+        Returns:
+            str: Cache key
+        """
+        bucket_seconds = self.time_buckets.get(view_name)
+        if bucket_seconds is None:
+            return f"{view_name}-{self.render_version}-{fingerprint}"
+        return f"{view_name}-{self.render_version}-{fingerprint}-{int(time.time() // bucket_seconds)}"
+
+    def seconds_until_key_change(self) -> Optional[float]:
+        """
+        Get the time until the payload key of a clock dependent view changes.
+
+        Returns:
+            Optional[float]: Seconds until the next time bucket starts, None if no view is clock dependent
+        """
+        now = time.time()
+        return min(
+            (bucket_seconds - now % bucket_seconds for bucket_seconds in self.time_buckets.values()),
+            default=None,
+        )
+
+    def key_fingerprint(self, view_name: str, key: str) -> Optional[str]:
+        """
+        Get the snapshot fingerprint a payload key was built from.
+
+        Args:
+            view_name (str): View identifier
+            key (str): Payload key
+
+        Returns:
+            Optional[str]: Fingerprint, None for clock dependent views, keys of
+                another render version and malformed keys
+        """
+        prefix = f"{view_name}-{self.render_version}-"
+        if view_name in self.time_buckets or not key.startswith(prefix):
+            return None
+        # Keys come back from the browser, so only accept what payload_key produces
+        fingerprint = key[len(prefix):]
+        return fingerprint if fingerprint.isalnum() else None
+
+    def load(self, key: str) -> Optional[bytes]:
+        """
+        Read a stored payload.
+
+        Args:
+            key (str): Payload key
+
+        Returns:
+            Optional[bytes]: JSON payload, None if it was pruned
+        """
+        try:
+            with open(os.path.join(self.directory, f"{key}.json"), "rb") as payload_file:
+                return payload_file.read()
+        except FileNotFoundError:
+            return None
+
+    def store(self, view_name: str, fingerprint: str, tree) -> str:
+        """
+        Serialize and store a rendering unless it is stored already.
+
+        Args:
+            view_name (str): View identifier
+            fingerprint (str): Fingerprint of the snapshot the view was rendered from
+            tree: The view's component tree
+
+        Returns:
+            str: Payload key of the rendering
+        """
+        key = self.payload_key(view_name, fingerprint)
+        path = os.path.join(self.directory, f"{key}.json")
+        if not os.path.exists(path):
+            self._write(path, encode_view(tree))
+            self._prune(view_name)
+        return key
+
+    def _write(self, path: str, payload: bytes):
+        os.makedirs(self.directory, exist_ok=True)
+        payload_tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(payload_tmp, "wb") as payload_file:
+            payload_file.write(payload)
+        os.replace(payload_tmp, path)
+
+    def _prune(self, view_name: str):
+        paths = [
+            os.path.join(self.directory, file_name) for file_name in os.listdir(self.directory)
+            if file_name.startswith(f"{view_name}-") and file_name.endswith(".json")
+        ]
+        paths.sort(key=lambda path: os.path.getmtime(path) if os.path.exists(path) else 0, reverse=True)
+        for path in paths[self.keep:]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
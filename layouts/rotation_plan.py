@@ -0,0 +1,100 @@
+"""
+Rotation Plan Module
+
+This module provides the RotationPlan class, which derives the view a display
+group shows from the wall clock. Time is divided into slots counted from the
+Unix epoch, so every screen and every worker process agrees on the current
+slot without sharing any state.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from config.app_config import AVAILABLE_VIEWS, DEFAULT_DISPLAY_GROUP, DISPLAY_GROUPS
+
+
+@dataclass(frozen=True)
+class RotationPlan:
+    """Views a display group rotates through and how long each is shown."""
+    group: str
+    views: Tuple[str, ...]
+    slot_seconds: float
+
+    def slot_at(self, timestamp: Optional[float] = None) -> int:
+        """
+        Get the time slot a moment falls into.
+
+        Args:
+            timestamp (Optional[float]): Unix time, now if None
+
+        Returns:
+            int: Slot number counted from the Unix epoch
+        """
+        return int((time.time() if timestamp is None else timestamp) // self.slot_seconds)
+
+    def view_for_slot(self, slot: int) -> str:
+        """
+        Get the view shown during a time slot.
+
+        Args:
+            slot (int): Slot number
+
+        Returns:
+            str: View name
+        """
+        return self.views[slot % len(self.views)]
+
+    def view_at(self, timestamp: Optional[float] = None) -> str:
+        """
+        Get the view shown at a moment.
+
+        Args:
+            timestamp (Optional[float]): Unix time, now if None
+
+        Returns:
+            str: View name
+        """
+        return self.view_for_slot(self.slot_at(timestamp))
+
+    def to_client(self) -> Dict:
+        """
+        Get the plan as sent to the browser.
+
+        Returns:
+            Dict: Views and slot length in seconds
+        """
+        return {"views": list(self.views), "slotSeconds": self.slot_seconds}
+
+
+def build_rotation_plans() -> Dict[str, RotationPlan]:
+    """
+    Build the rotation plans of all display groups in DISPLAY_GROUPS.
+
+    Returns:
+        Dict[str, RotationPlan]: Plans keyed by group name
+    """
+    plans = {}
+    for group, settings in DISPLAY_GROUPS.items():
+        views = tuple(settings["views"])
+        unknown_views = [view for view in views if view not in AVAILABLE_VIEWS]
+        if not views or unknown_views:
+            raise ValueError(f"Display group {group!r} needs views from AVAILABLE_VIEWS, got {list(views)}")
+        plans[group] = RotationPlan(group, views, float(settings["slot_seconds"]))
+    return plans
+
+
+ROTATION_PLANS = build_rotation_plans()
+
+
+def get_rotation_plan(group: Optional[str]) -> RotationPlan:
+    """
+    Get a display group's rotation plan.
+
+    Args:
+        group (Optional[str]): Group name, unknown groups get DEFAULT_DISPLAY_GROUP
+
+    Returns:
+        RotationPlan: Plan of the group
+    """
+    return ROTATION_PLANS.get(group) or ROTATION_PLANS[DEFAULT_DISPLAY_GROUP]
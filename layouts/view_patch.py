@@ -0,0 +1,103 @@
+"""
+View Patch Module
+
+This module turns a SnapshotDiff into a Dash Patch of a rendered view. The
+paths of the patch targets are collected from the view tree, either as built
+or as decoded from its JSON payload, and a view is only patched if its targets sit at the same paths before and after
+the change; otherwise it has to be sent whole.
+"""
+
+from typing import Dict, FrozenSet, Hashable, Iterable, Optional, Tuple
+
+from dash import Patch
+from dash.development.base_component import Component
+
+from data.snapshot_diff import PATCH_TARGET_ATTRIBUTE
+
+# Keys and list indexes leading from the view root to a component
+TreePath = Tuple[Hashable, ...]
+
+
+def _as_node(node):
+    """Get a built component in the form it is serialized in, so both trees share paths."""
+    return node.to_plotly_json() if isinstance(node, Component) else node
+
+
+def find_patch_targets(tree) -> Dict[str, Tuple[TreePath, ...]]:
+    """
+    Collect the paths of all patch targets in a view.
+
+    Args:
+        tree: View tree as built or as decoded from its JSON payload
+
+    Returns:
+        Dict[str, Tuple[TreePath, ...]]: Paths keyed by target key; a record
+            shown in several places has several paths
+    """
+    targets: Dict[str, list] = {}
+    stack = [((), tree)]
+    while stack:
+        path, node = stack.pop()
+        node = _as_node(node)
+        if isinstance(node, (list, tuple)):
+            stack.extend((path + (index,), child) for index, child in enumerate(node))
+            continue
+        if not isinstance(node, dict) or not isinstance(node.get("props"), dict):
+            continue
+        props = node["props"]
+        target = props.get(PATCH_TARGET_ATTRIBUTE)
+        if target is not None:
+            targets.setdefault(target, []).append(path)
+            continue
+        if "children" in props:
+            stack.append((path + ("props", "children"), props["children"]))
+    return {target: tuple(sorted(paths, key=str)) for target, paths in targets.items()}
+
+
+def _value_at(tree, path: TreePath):
+    for step in path:
+        tree = _as_node(tree)[step]
+    return tree
+
+
+def build_view_patch(tree,
+                     targets: Dict[str, Tuple[TreePath, ...]],
+                     previous_targets: Dict[str, Tuple[TreePath, ...]],
+                     changed_targets: FrozenSet[str]) -> Optional[Patch]:
+    """
+    Build a patch replacing the changed targets of a view.
+
+    Args:
+        tree: New view tree as built or as decoded from its JSON payload
+        targets (Dict[str, Tuple[TreePath, ...]]): Target paths of the new tree
+        previous_targets (Dict[str, Tuple[TreePath, ...]]): Target paths of the tree the screen holds
+        changed_targets (FrozenSet[str]): Targets showing changed records, see SnapshotDiff.target_keys
+
+    Returns:
+        Optional[Patch]: Patch for the view's children, None if the layout
+            changed and the view has to be sent whole
+    """
+    if targets != previous_targets:
+        return None
+    patch = Patch()
+    for target in changed_targets:
+        for path in targets.get(target, ()):
+            location = patch
+            for step in path[:-1]:
+                location = location[step]
+            location[path[-1]] = _value_at(tree, path)
+    return patch
+
+
+def count_patched(changed_targets: Iterable[str], targets: Dict[str, Tuple[TreePath, ...]]) -> int:
+    """
+    Count the components a patch replaces.
+
+    Args:
+        changed_targets (Iterable[str]): Targets showing changed records
+        targets (Dict[str, Tuple[TreePath, ...]]): Target paths of the view
+
+    Returns:
+        int: Number of replaced components, 0 if the view shows none of the changed records
+    """
+    return sum(len(targets.get(target, ())) for target in changed_targets)
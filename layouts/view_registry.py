@@ -0,0 +1,157 @@
+"""
+View Registry Module
+
+This module provides the ViewRegistry class, which maps view names to the
+factories of the components that build them. Components are only constructed
+when their view is first rendered, so views a deployment does not rotate
+through cost neither startup time nor memory.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from data.tournament_data import TournamentSnapshot
+
+logger = logging.getLogger(__name__)
+
+# Builds a view's component tree from a snapshot (None for the current one)
+ViewBuilder = Callable[[Optional[TournamentSnapshot]], Any]
+
+
+@dataclass
+class ViewTimings:
+    """Construction and build timings of one view, in seconds."""
+    construct_seconds: Optional[float] = None
+    builds: int = 0
+    total_build_seconds: float = 0.0
+    last_build_seconds: float = 0.0
+    max_build_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Optional[float]]:
+        return {
+            "construct_seconds": self.construct_seconds,
+            "builds": self.builds,
+            "mean_build_seconds": self.total_build_seconds / self.builds if self.builds else 0.0,
+            "last_build_seconds": self.last_build_seconds,
+            "max_build_seconds": self.max_build_seconds,
+        }
+
+
+class ViewRegistry:
+    """
+    Views registered by name with a factory, constructed on first use.
+
+    A factory is called at most once and returns the view's builder, e.g.
+    the bound create method of a freshly constructed component.
+    """
+
+    def __init__(self, default_view: str):
+        """
+        Initialize an empty registry.
+
+        Args:
+            default_view (str): View used for names that are not registered
+        """
+        self.default_view = default_view
+        self._factories: Dict[str, Callable[[], ViewBuilder]] = {}
+        self._builders: Dict[str, ViewBuilder] = {}
+        self._timings: Dict[str, ViewTimings] = {}
+        self._lock = threading.Lock()
+
+    def register(self, view_name: str, factory: Callable[[], ViewBuilder]):
+        """
+        Register a view.
+
+        Args:
+            view_name (str): View identifier, as listed in AVAILABLE_VIEWS
+            factory (Callable[[], ViewBuilder]): Constructs the view's components and returns its builder
+        """
+        with self._lock:
+            self._factories[view_name] = factory
+            self._builders.pop(view_name, None)
+            self._timings[view_name] = ViewTimings()
+
+    def __contains__(self, view_name: str) -> bool:
+        return view_name in self._factories
+
+    def names(self) -> List[str]:
+        """
+        Get the registered view names.
+
+        Returns:
+            List[str]: View names in registration order
+        """
+        return list(self._factories)
+
+    def resolve(self, view_name: str) -> str:
+        """
+        Map a requested view to a registered one.
+
+        Args:
+            view_name (str): Requested view
+
+        Returns:
+            str: The view itself if registered, the default view otherwise
+        """
+        return view_name if view_name in self._factories else self.default_view
+
+    def get_builder(self, view_name: str) -> ViewBuilder:
+        """
+        Get a view's builder, constructing its components on first use.
+
+        Args:
+            view_name (str): Registered view identifier
+
+        Returns:
+            ViewBuilder: Function building the view from a snapshot
+        """
+        builder = self._builders.get(view_name)
+        if builder is not None:
+            return builder
+        with self._lock:
+            builder = self._builders.get(view_name)
+            if builder is None:
+                start = time.perf_counter()
+                builder = self._factories[view_name]()
+                self._timings[view_name].construct_seconds = time.perf_counter() - start
+                self._builders[view_name] = builder
+                logger.info("Constructed view %s in %.1f ms",
+                            view_name, self._timings[view_name].construct_seconds * 1000)
+        return builder
+
+    def build(self, view_name: str, snapshot: Optional[TournamentSnapshot] = None):
+        """
+        Build a view's component tree and record how long it took.
+
+        Args:
+            view_name (str): Registered view identifier
+            snapshot (Optional[TournamentSnapshot]): Tournament data to render, defaults to the current one
+
+        Returns:
+            The view's component tree
+        """
+        builder = self.get_builder(view_name)
+        start = time.perf_counter()
+        tree = builder(snapshot)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            timings = self._timings[view_name]
+            timings.builds += 1
+            timings.total_build_seconds += elapsed
+            timings.last_build_seconds = elapsed
+            timings.max_build_seconds = max(timings.max_build_seconds, elapsed)
+        return tree
+
+    def timings(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Get the construction and build timings of all views.
+
+        Returns:
+            Dict[str, Dict[str, Optional[float]]]: Timings keyed by view name;
+                construct_seconds is None for views never used
+        """
+        with self._lock:
+            return {view_name: timings.to_dict() for view_name, timings in self._timings.items()}